@@ -0,0 +1,45 @@
+"""compute session expiry server-side
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Default sessions.expires_at to NOW() + 7 days.
+
+    Session timestamps are now derived from the database clock so that
+    multiple app instances cannot disagree on expiry or revocation times.
+    """
+    op.alter_column(
+        "sessions",
+        "expires_at",
+        server_default=sa.text("NOW() + INTERVAL '7 days'"),
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove server default from sessions.expires_at."""
+    op.alter_column(
+        "sessions",
+        "expires_at",
+        server_default=None,
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+    )
@@ -0,0 +1,358 @@
+"""partition sessions table by month
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+
+"""
+
+import logging
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: str | None = "008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# Sessions expire after 7 days; revoked/expired rows are kept for audit purposes
+# for this long before their monthly partition is dropped.
+SESSIONS_RETENTION = "12 months"
+
+# Monthly partitions are kept created this many months ahead, so a missed
+# maintenance run leaves plenty of time before rows spill into sessions_default.
+SESSIONS_MONTHS_AHEAD = 12
+
+
+def upgrade() -> None:
+    """Recreate sessions as a table partitioned by RANGE (created_at).
+
+    Expired sessions are removed by dropping whole monthly partitions instead of
+    row-level DELETEs. The partition key has to be part of every unique
+    constraint, so refresh token JTIs are kept unique across partitions by the
+    unpartitioned session_jtis table, filled by an insert trigger.
+
+    When pg_cron can be used, two jobs are scheduled: one keeps partitions
+    created ahead, the other drops partitions older than the retention window.
+    Otherwise a warning is logged and the helper functions must be called from
+    an external scheduler.
+    """
+    # 1. Move the existing table out of the way (index names are schema-global)
+    op.execute("ALTER TABLE sessions RENAME TO sessions_legacy")
+    op.execute("ALTER INDEX sessions_pkey RENAME TO sessions_legacy_pkey")
+    op.execute(
+        "ALTER INDEX sessions_refresh_token_jti_key RENAME TO sessions_legacy_refresh_token_jti_key"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_sessions_user_id")
+    op.execute("DROP INDEX IF EXISTS idx_sessions_jti")
+    op.execute("DROP INDEX IF EXISTS idx_sessions_created_at")
+    op.execute("DROP INDEX IF EXISTS idx_sessions_active")
+    op.execute("DROP INDEX IF EXISTS idx_sessions_expires_at")
+    op.execute("DROP INDEX IF EXISTS idx_sessions_user_expires")
+
+    # 2. Partitioned table (partition key must be part of PK/unique constraints)
+    op.execute(
+        """
+        CREATE TABLE sessions (
+            id UUID NOT NULL DEFAULT gen_random_uuid(),
+            user_id UUID NOT NULL,
+            refresh_token_jti VARCHAR(255) NOT NULL,
+            device_info VARCHAR(500),
+            ip_address VARCHAR(45) NOT NULL,
+            user_agent VARCHAR,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            expires_at TIMESTAMP WITH TIME ZONE NOT NULL
+                DEFAULT NOW() + INTERVAL '7 days',
+            revoked_at TIMESTAMP WITH TIME ZONE,
+            CONSTRAINT sessions_pkey PRIMARY KEY (id, created_at),
+            CONSTRAINT sessions_user_id_fkey FOREIGN KEY (user_id)
+                REFERENCES users(id) ON DELETE CASCADE,
+            CONSTRAINT sessions_refresh_token_jti_key UNIQUE (refresh_token_jti, created_at),
+            CONSTRAINT expires_after_creation CHECK (expires_at > created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.execute("CREATE TABLE sessions_default PARTITION OF sessions DEFAULT")
+
+    # 3. Global JTI uniqueness: every inserted session claims its JTI here, so a
+    #    duplicate fails with a unique violation whichever partition it lands in
+    op.execute(
+        """
+        CREATE TABLE session_jtis (
+            refresh_token_jti VARCHAR(255) PRIMARY KEY,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION register_session_jti()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            INSERT INTO session_jtis (refresh_token_jti, created_at)
+            VALUES (NEW.refresh_token_jti, NEW.created_at);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER sessions_register_jti AFTER INSERT ON sessions "
+        "FOR EACH ROW EXECUTE FUNCTION register_session_jti()"
+    )
+
+    # 4. Partition maintenance helpers
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION create_sessions_partition(month_start DATE)
+        RETURNS VOID AS $$
+        DECLARE
+            start_date DATE := date_trunc('month', month_start)::DATE;
+            end_date DATE := (date_trunc('month', month_start) + INTERVAL '1 month')::DATE;
+            partition_name TEXT := 'sessions_' || to_char(start_date, 'YYYY_MM');
+            has_default_rows BOOLEAN;
+        BEGIN
+            IF to_regclass(partition_name) IS NOT NULL THEN
+                RETURN;
+            END IF;
+
+            -- Postgres refuses to create a partition while sessions_default
+            -- holds rows for its range, so move those rows into it
+            SELECT EXISTS (
+                SELECT 1 FROM sessions_default
+                WHERE created_at >= start_date AND created_at < end_date
+            ) INTO has_default_rows;
+            IF has_default_rows THEN
+                CREATE TEMP TABLE sessions_moving (LIKE sessions_default);
+                WITH moved AS (
+                    DELETE FROM sessions_default
+                    WHERE created_at >= start_date AND created_at < end_date
+                    RETURNING *
+                )
+                INSERT INTO sessions_moving SELECT * FROM moved;
+                -- Re-inserting claims the JTIs again
+                DELETE FROM session_jtis
+                USING sessions_moving
+                WHERE session_jtis.refresh_token_jti = sessions_moving.refresh_token_jti;
+            END IF;
+
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF sessions FOR VALUES FROM (%L) TO (%L)',
+                partition_name,
+                start_date,
+                end_date
+            );
+
+            IF has_default_rows THEN
+                INSERT INTO sessions SELECT * FROM sessions_moving;
+                DROP TABLE sessions_moving;
+            END IF;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION ensure_sessions_partitions(months_ahead INTEGER)
+        RETURNS VOID AS $$
+        BEGIN
+            PERFORM create_sessions_partition(month::DATE)
+            FROM generate_series(
+                date_trunc('month', NOW()),
+                date_trunc('month', NOW()) + make_interval(months => months_ahead),
+                INTERVAL '1 month'
+            ) AS month;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION drop_expired_sessions_partitions(retention INTERVAL)
+        RETURNS INTEGER AS $$
+        DECLARE
+            cutoff DATE := date_trunc('month', NOW() - retention)::DATE;
+            partition RECORD;
+            dropped INTEGER := 0;
+        BEGIN
+            FOR partition IN
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON pg_inherits.inhparent = parent.oid
+                JOIN pg_class child ON pg_inherits.inhrelid = child.oid
+                WHERE parent.relname = 'sessions'
+                  AND child.relname ~ '^sessions_[0-9]{4}_[0-9]{2}$'
+            LOOP
+                IF to_date(substring(partition.relname FROM 10), 'YYYY_MM')
+                        + INTERVAL '1 month' <= cutoff THEN
+                    EXECUTE format('DROP TABLE IF EXISTS %I', partition.relname);
+                    dropped := dropped + 1;
+                END IF;
+            END LOOP;
+
+            -- Rows that landed in the default partition age out the same way
+            DELETE FROM sessions_default WHERE created_at < cutoff;
+            DELETE FROM session_jtis WHERE created_at < cutoff;
+            RETURN dropped;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    # 5. Pre-create partitions covering existing rows and the months ahead
+    op.execute(
+        """
+        SELECT create_sessions_partition(month::DATE)
+        FROM generate_series(
+            date_trunc('month', COALESCE((SELECT MIN(created_at) FROM sessions_legacy), NOW())),
+            date_trunc('month', NOW()),
+            INTERVAL '1 month'
+        ) AS month
+        """
+    )
+    op.execute(f"SELECT ensure_sessions_partitions({SESSIONS_MONTHS_AHEAD})")
+
+    # 6. Copy data (the trigger claims each JTI) and drop the old table
+    op.execute(
+        """
+        INSERT INTO sessions (
+            id, user_id, refresh_token_jti, device_info, ip_address,
+            user_agent, created_at, expires_at, revoked_at
+        )
+        SELECT
+            id, user_id, refresh_token_jti, device_info, ip_address,
+            user_agent, created_at, expires_at, revoked_at
+        FROM sessions_legacy
+        """
+    )
+    op.execute("DROP TABLE sessions_legacy")
+
+    # 7. Indexes (created on the parent, propagated to every partition)
+    op.execute("CREATE INDEX idx_sessions_user_id ON sessions (user_id)")
+    op.execute("CREATE INDEX idx_sessions_jti ON sessions (refresh_token_jti)")
+    op.execute("CREATE INDEX idx_sessions_user_jti ON sessions (user_id, refresh_token_jti)")
+    op.execute("CREATE INDEX idx_sessions_created_at ON sessions (created_at DESC)")
+    op.execute(
+        "CREATE INDEX idx_sessions_active ON sessions (user_id, revoked_at) "
+        "WHERE revoked_at IS NULL"
+    )
+    op.execute("CREATE INDEX idx_sessions_expires_at ON sessions (expires_at)")
+    op.execute("CREATE INDEX idx_sessions_user_expires ON sessions (user_id, expires_at)")
+
+    # 8. Schedule maintenance with pg_cron (it must be installed and preloaded)
+    pg_cron_usable = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_cron') "
+                "AND 'pg_cron' = ANY(string_to_array("
+                "replace(current_setting('shared_preload_libraries'), ' ', ''), ','))"
+            )
+        )
+        .scalar()
+    )
+    if not pg_cron_usable:
+        logger.warning(
+            "pg_cron is not available; sessions partitions will not be maintained. "
+            "Schedule 'SELECT ensure_sessions_partitions(%d)' and "
+            "\"SELECT drop_expired_sessions_partitions(INTERVAL '%s')\" "
+            "to run monthly with an external scheduler.",
+            SESSIONS_MONTHS_AHEAD,
+            SESSIONS_RETENTION,
+        )
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_cron")
+    op.execute(
+        f"""
+        SELECT cron.schedule(
+            'ensure_sessions_partitions',
+            '0 0 1 * *',
+            'SELECT ensure_sessions_partitions({SESSIONS_MONTHS_AHEAD})'
+        )
+        """
+    )
+    op.execute(
+        f"""
+        SELECT cron.schedule(
+            'drop_expired_sessions_partitions',
+            '30 0 1 * *',
+            $job$SELECT drop_expired_sessions_partitions(INTERVAL '{SESSIONS_RETENTION}')$job$
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Restore sessions as a regular (non-partitioned) table."""
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.unschedule(jobname)
+                FROM cron.job
+                WHERE jobname IN (
+                    'ensure_sessions_partitions',
+                    'drop_expired_sessions_partitions'
+                );
+            END IF;
+        END
+        $$
+        """
+    )
+
+    op.execute("ALTER TABLE sessions RENAME TO sessions_partitioned")
+    op.execute("ALTER INDEX sessions_pkey RENAME TO sessions_partitioned_pkey")
+    op.execute(
+        "ALTER INDEX sessions_refresh_token_jti_key "
+        "RENAME TO sessions_partitioned_refresh_token_jti_key"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_sessions_user_id")
+    op.execute("DROP INDEX IF EXISTS idx_sessions_jti")
+    op.execute("DROP INDEX IF EXISTS idx_sessions_user_jti")
+    op.execute("DROP INDEX IF EXISTS idx_sessions_created_at")
+    op.execute("DROP INDEX IF EXISTS idx_sessions_active")
+    op.execute("DROP INDEX IF EXISTS idx_sessions_expires_at")
+    op.execute("DROP INDEX IF EXISTS idx_sessions_user_expires")
+
+    op.execute(
+        """
+        CREATE TABLE sessions (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+            refresh_token_jti VARCHAR(255) NOT NULL UNIQUE,
+            device_info VARCHAR(500),
+            ip_address VARCHAR(45) NOT NULL,
+            user_agent VARCHAR,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            expires_at TIMESTAMP WITH TIME ZONE NOT NULL
+                DEFAULT NOW() + INTERVAL '7 days',
+            revoked_at TIMESTAMP WITH TIME ZONE,
+            CONSTRAINT expires_after_creation CHECK (expires_at > created_at)
+        )
+        """
+    )
+    op.execute("INSERT INTO sessions SELECT * FROM sessions_partitioned")
+    op.execute("DROP TABLE sessions_partitioned CASCADE")
+    op.execute("DROP TABLE session_jtis")
+    op.execute("DROP FUNCTION IF EXISTS register_session_jti()")
+    op.execute("DROP FUNCTION IF EXISTS drop_expired_sessions_partitions(INTERVAL)")
+    op.execute("DROP FUNCTION IF EXISTS ensure_sessions_partitions(INTEGER)")
+    op.execute("DROP FUNCTION IF EXISTS create_sessions_partition(DATE)")
+
+    op.execute("CREATE INDEX idx_sessions_user_id ON sessions (user_id)")
+    op.execute("CREATE INDEX idx_sessions_jti ON sessions (refresh_token_jti)")
+    op.execute("CREATE INDEX idx_sessions_created_at ON sessions (created_at DESC)")
+    op.execute(
+        "CREATE INDEX idx_sessions_active ON sessions (user_id, revoked_at) "
+        "WHERE revoked_at IS NULL"
+    )
+    op.execute("CREATE INDEX idx_sessions_expires_at ON sessions (expires_at)")
+    op.execute("CREATE INDEX idx_sessions_user_expires ON sessions (user_id, expires_at)")
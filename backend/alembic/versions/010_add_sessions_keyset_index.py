@@ -0,0 +1,31 @@
+"""add sessions keyset pagination index
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: str | None = "009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add partial index for paging a user's active sessions by (created_at, id)."""
+    op.execute(
+        "CREATE INDEX sessions_user_created_idx "
+        "ON sessions (user_id, created_at DESC, id DESC) "
+        "WHERE revoked_at IS NULL"
+    )
+
+
+def downgrade() -> None:
+    """Remove sessions keyset pagination index."""
+    op.execute("DROP INDEX IF EXISTS sessions_user_created_idx")
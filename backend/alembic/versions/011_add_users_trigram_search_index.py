@@ -0,0 +1,34 @@
+"""add trigram index for user search
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: str | None = "010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add GIN trigram index so ILIKE '%term%' user search can use an index.
+
+    The expression must match USER_SEARCH_TEXT in app.models.user.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX users_name_trgm ON users USING gin "
+        "((first_name || E'\\x1f' || last_name || E'\\x1f' || email) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Remove user search trigram index (extension is left installed)."""
+    op.execute("DROP INDEX IF EXISTS users_name_trgm")
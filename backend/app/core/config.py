@@ -3,7 +3,7 @@
 from functools import lru_cache
 from typing import Literal
 
-from pydantic import EmailStr, PostgresDsn, RedisDsn, field_validator
+from pydantic import EmailStr, Field, PostgresDsn, RedisDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -36,6 +36,9 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 7
 
+    # Password hashing (bcrypt work factor; bcrypt accepts 4-31)
+    bcrypt_rounds: int = Field(12, ge=4, le=31)
+
     # Azure Communication Services (Email) - Optional for local dev
     azure_communication_connection_string: str | None = None
     email_from_address: EmailStr
@@ -104,7 +104,7 @@ async def close_redis() -> None:
     global _redis_client
 
     if _redis_client is not None:
-        await _redis_client.close()
+        await _redis_client.aclose()  # type: ignore[attr-defined]
         _redis_client = None
 
 
@@ -16,7 +16,7 @@ def hash_password(password: str) -> str:
     """Hash a password using bcrypt.
 
     bcrypt has a 72-byte limit, passwords are automatically truncated.
-    Uses 12 rounds for security.
+    Uses settings.bcrypt_rounds rounds (12 by default).
 
     Args:
         password: Plain text password
@@ -28,7 +28,7 @@ def hash_password(password: str) -> str:
         hashed = hash_password("SecurePassword123")
     """
     password_bytes = password.encode("utf-8")[:72]  # Truncate to 72 bytes
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode("utf-8")
 
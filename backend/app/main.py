@@ -12,7 +12,7 @@ from app.api.health import router as health_router
 from app.api.metrics import router as metrics_router
 from app.api.v1 import api_router
 from app.core.config import get_settings
-from app.core.database import async_engine
+from app.core.database import AsyncSessionLocal, async_engine
 from app.core.errors import (
     AuthenticationError,
     AuthorizationError,
@@ -29,6 +29,8 @@ from app.core.redis import get_redis
 from app.middleware.consent_check import ConsentCheckMiddleware
 from app.middleware.metrics import MetricsMiddleware
 from app.middleware.request_id import RequestIDMiddleware
+from app.services.audit_service import AuditService
+from app.services.user_service import UserService
 
 # Setup logging
 setup_logging()
@@ -45,9 +47,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     Startup:
     - Initialize Redis connection
+    - Prime role ID cache
+    - Start the background audit worker
     - Log application start
 
     Shutdown:
+    - Log queued background audit events
     - Close database connections
     - Close Redis connection
     """
@@ -65,6 +70,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     redis_client = await get_redis()
     logger.info("Redis connection established")
 
+    # Prime role name -> ID cache (falls back to lazy loading on failure)
+    try:
+        async with AsyncSessionLocal() as db:
+            await UserService.prime_role_cache(db)
+        logger.info("Role cache primed")
+    except Exception as e:
+        logger.warning("Failed to prime role cache", extra={"error": str(e)})
+
+    # Session revocation audit events are logged off the request path
+    AuditService.start_background_worker()
+
     # Mark service as up for metrics
     set_up(1)
 
@@ -73,6 +89,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down Augeo Platform API")
 
+    # Flush queued audit events before closing connections
+    await AuditService.stop_background_worker()
+
     # Close database engine
     await async_engine.dispose()
     logger.info("Database connections closed")
@@ -5,7 +5,7 @@ from app.models.base import Base, TimestampMixin, UUIDMixin
 from app.models.consent import ConsentAuditLog, CookieConsent, UserConsent
 from app.models.legal_document import LegalDocument
 from app.models.role import Role
-from app.models.session import Session
+from app.models.session import Session, SessionJti
 from app.models.user import User
 
 __all__ = [
@@ -18,6 +18,7 @@ __all__ = [
     "LegalDocument",
     "Role",
     "Session",
+    "SessionJti",
     "User",
     "UserConsent",
 ]
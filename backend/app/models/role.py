@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String
+from sqlalchemy import CheckConstraint, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin
@@ -30,10 +30,8 @@ class Role(Base, UUIDMixin, TimestampMixin):
         nullable=False,
         index=True,
     )
-    description: Mapped[str | None] = mapped_column(
-        String(255),
-        nullable=True,
-    )
+    description: Mapped[str] = mapped_column(Text, nullable=False)
+    scope: Mapped[str] = mapped_column(String(20), nullable=False)
 
     # Relationships
     users: Mapped[list["User"]] = relationship(
@@ -42,6 +40,18 @@ class Role(Base, UUIDMixin, TimestampMixin):
         foreign_keys="User.role_id",
     )
 
+    # Check constraints (match migration 001)
+    __table_args__ = (
+        CheckConstraint(
+            "name IN ('super_admin', 'npo_admin', 'event_coordinator', 'staff', 'donor')",
+            name="role_name_valid",
+        ),
+        CheckConstraint(
+            "scope IN ('platform', 'npo', 'event', 'own')",
+            name="role_scope_valid",
+        ),
+    )
+
     def __repr__(self) -> str:
         """Return string representation of role."""
         return f"<Role(id={self.id}, name={self.name})>"
@@ -4,7 +4,18 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, String
+from sqlalchemy import (
+    DDL,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    PrimaryKeyConstraint,
+    String,
+    UniqueConstraint,
+    event,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,9 +34,13 @@ class Session(Base, UUIDMixin):
     Business Rules:
     - Immutable: No UPDATE or DELETE operations (only INSERT and soft revoke)
     - Redis is source of truth for active sessions (this is audit trail only)
-    - expires_at set to 7 days from created_at
+    - expires_at set to 7 days from created_at (computed by PostgreSQL)
     - Logout sets revoked_at but doesn't delete record
     - Each session tracks refresh token JTI for Redis lookup
+    - Table is partitioned monthly by created_at (migration 009); old partitions
+      are dropped instead of deleting rows
+    - Primary key is (id, created_at) since Postgres requires the partition key
+      in every unique constraint; JTI uniqueness is enforced by SessionJti
     """
 
     __tablename__ = "sessions"
@@ -41,7 +56,6 @@ class Session(Base, UUIDMixin):
     # Session Details
     refresh_token_jti: Mapped[str] = mapped_column(
         String(255),
-        unique=True,
         nullable=False,
         index=True,
     )
@@ -52,6 +66,7 @@ class Session(Base, UUIDMixin):
     # Lifecycle timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
         server_default="NOW()",
         index=True,
@@ -59,6 +74,7 @@ class Session(Base, UUIDMixin):
     expires_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        server_default=text("NOW() + INTERVAL '7 days'"),
     )
     revoked_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
@@ -68,8 +84,21 @@ class Session(Base, UUIDMixin):
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="sessions")
 
-    # Check constraints
-    __table_args__ = (CheckConstraint("expires_at > created_at", name="expires_after_creation"),)
+    # Constraints and partitioning
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "created_at", name="sessions_pkey"),
+        CheckConstraint("expires_at > created_at", name="expires_after_creation"),
+        UniqueConstraint("refresh_token_jti", "created_at", name="sessions_refresh_token_jti_key"),
+        Index("idx_sessions_user_jti", "user_id", "refresh_token_jti"),
+        Index(
+            "sessions_user_created_idx",
+            "user_id",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("revoked_at IS NULL"),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     def __repr__(self) -> str:
         """Return string representation of session."""
@@ -77,3 +106,48 @@ class Session(Base, UUIDMixin):
             f"<Session(id={self.id}, user_id={self.user_id}, "
             f"jti={self.refresh_token_jti[:8]}..., revoked={self.revoked_at is not None})>"
         )
+
+
+class SessionJti(Base):
+    """Refresh token JTIs claimed by sessions, one row per JTI.
+
+    Unique constraints on the partitioned sessions table must include
+    created_at, so this unpartitioned table keeps JTIs unique across all
+    partitions. Rows are inserted by the sessions_register_jti trigger and
+    pruned together with expired sessions partitions.
+    """
+
+    __tablename__ = "session_jtis"
+
+    refresh_token_jti: Mapped[str] = mapped_column(String(255), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default="NOW()",
+    )
+
+
+# Mirrors migration 009: monthly partitions are created by
+# ensure_sessions_partitions() there; a fresh schema only needs the default one.
+SESSIONS_PARTITION_DDL = (
+    DDL("CREATE TABLE sessions_default PARTITION OF sessions DEFAULT"),  # type: ignore[no-untyped-call]
+    DDL(  # type: ignore[no-untyped-call]
+        """
+        CREATE OR REPLACE FUNCTION register_session_jti()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            INSERT INTO session_jtis (refresh_token_jti, created_at)
+            VALUES (NEW.refresh_token_jti, NEW.created_at);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    ),
+    DDL(  # type: ignore[no-untyped-call]
+        "CREATE TRIGGER sessions_register_jti AFTER INSERT ON sessions "
+        "FOR EACH ROW EXECUTE FUNCTION register_session_jti()"
+    ),
+)
+
+for _ddl in SESSIONS_PARTITION_DDL:
+    event.listen(Session.__table__, "after_create", _ddl.execute_if(dialect="postgresql"))
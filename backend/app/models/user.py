@@ -4,7 +4,17 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, CheckConstraint, DateTime, ForeignKey, String
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    event,
+    literal_column,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -163,3 +173,30 @@ class User(Base, UUIDMixin, TimestampMixin):
     def __repr__(self) -> str:
         """Return string representation of user."""
         return f"<User(id={self.id}, email={self.email}, role_id={self.role_id})>"
+
+
+# Text searched by UserService.list_users. Migration 011 indexes exactly this
+# expression (first_name || E'\x1f' || last_name || E'\x1f' || email); the
+# unit separator never appears in a search term, so a match cannot span fields.
+_SEARCH_FIELD_SEPARATOR = literal_column("E'\\x1f'", String)
+USER_SEARCH_TEXT = (
+    User.first_name
+    + _SEARCH_FIELD_SEPARATOR
+    + User.last_name
+    + _SEARCH_FIELD_SEPARATOR
+    + User.email
+)
+
+Index(
+    "users_name_trgm",
+    USER_SEARCH_TEXT.label("search_text"),
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+)
+event.listen(
+    User.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(  # type: ignore[no-untyped-call]
+        dialect="postgresql"
+    ),
+)
@@ -4,16 +4,25 @@ Logs authentication and authorization events for compliance and security monitor
 Persists audit events to database and logs to structured logger.
 """
 
+import asyncio
+import contextvars
+import functools
 import uuid
 from datetime import datetime
 from enum import Enum
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
+from app.middleware.request_id import get_request_id
 
 logger = get_logger(__name__)
 
+# Session revocations waiting for the background audit worker, each with the
+# context of the request that revoked them
+RevocationEvent = tuple[contextvars.Context, dict[str, Any]]
+
 
 class AuditEventType(str, Enum):
     """Types of audit events to log."""
@@ -44,6 +53,14 @@ class AuditService:
     In production, these logs should be sent to a SIEM or log aggregation service.
     """
 
+    # Bound on queued session revocation events (see schedule_log_session_revoked)
+    REVOCATION_QUEUE_SIZE = 1000
+
+    # Queue of pending revocation events and the worker task logging them;
+    # both are None while the worker is not running
+    _revocation_queue: "asyncio.Queue[RevocationEvent] | None" = None
+    _revocation_worker: "asyncio.Task[None] | None" = None
+
     @staticmethod
     async def log_login_success(
         db: AsyncSession | None,
@@ -198,6 +215,9 @@ class AuditService:
     ) -> None:
         """Log session revocation event.
 
+        The request ID is read from the current context; the background worker
+        runs this in the context captured by schedule_log_session_revoked.
+
         Args:
             user_id: UUID of user whose session was revoked
             email: User's email address
@@ -212,6 +232,7 @@ class AuditService:
             "Session revoked",
             extra={
                 "event_type": AuditEventType.SESSION_REVOKED.value,
+                "request_id": get_request_id() or None,
                 "user_id": str(user_id),
                 "email": email,
                 "session_jti": session_jti,
@@ -222,6 +243,89 @@ class AuditService:
             },
         )
 
+    @staticmethod
+    def schedule_log_session_revoked(
+        user_id: uuid.UUID,
+        email: str,
+        session_jti: str,
+        reason: str | None = None,
+        ip_address: str | None = None,
+        revoked_by_user_id: uuid.UUID | None = None,
+    ) -> None:
+        """Queue a session revocation event for the background audit worker.
+
+        Keeps audit logging off the logout response path. The current context
+        is captured with the event, so the request ID is still logged. When
+        the worker is not running or its queue is full, the event is logged
+        inline instead of being dropped.
+
+        Args:
+            user_id: UUID of user whose session was revoked
+            email: User's email address
+            session_jti: JWT ID of the revoked session
+            reason: Optional reason for revocation
+            ip_address: Optional IP address where revocation occurred
+            revoked_by_user_id: Optional UUID of admin who revoked session
+        """
+        event: dict[str, Any] = {
+            "user_id": user_id,
+            "email": email,
+            "session_jti": session_jti,
+            "reason": reason,
+            "ip_address": ip_address,
+            "revoked_by_user_id": revoked_by_user_id,
+        }
+        queue = AuditService._revocation_queue
+        if queue is not None:
+            try:
+                queue.put_nowait((contextvars.copy_context(), event))
+                return
+            except asyncio.QueueFull:
+                logger.warning("Audit queue full, logging session revocation inline")
+
+        AuditService.log_session_revoked(**event)
+
+    @staticmethod
+    def start_background_worker() -> None:
+        """Start the worker that logs queued events (call on application startup)."""
+        if AuditService._revocation_worker is not None:
+            return
+
+        queue: asyncio.Queue[RevocationEvent] = asyncio.Queue(
+            maxsize=AuditService.REVOCATION_QUEUE_SIZE
+        )
+        AuditService._revocation_queue = queue
+        AuditService._revocation_worker = asyncio.get_running_loop().create_task(
+            AuditService._log_queued_revocations(queue)
+        )
+
+    @staticmethod
+    async def stop_background_worker() -> None:
+        """Log every queued event, then stop the worker (call on application shutdown)."""
+        queue = AuditService._revocation_queue
+        worker = AuditService._revocation_worker
+        if queue is None or worker is None:
+            return
+
+        # New events are logged inline from here on
+        AuditService._revocation_queue = None
+        await queue.join()
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        AuditService._revocation_worker = None
+
+    @staticmethod
+    async def _log_queued_revocations(queue: "asyncio.Queue[RevocationEvent]") -> None:
+        """Worker loop: log each queued event in the context it was queued from."""
+        while True:
+            context, event = await queue.get()
+            try:
+                context.run(functools.partial(AuditService.log_session_revoked, **event))
+            except Exception as e:
+                logger.error("Failed to log session revocation", extra={"error": str(e)})
+            finally:
+                queue.task_done()
+
     @staticmethod
     def log_account_created(
         user_id: uuid.UUID,
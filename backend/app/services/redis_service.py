@@ -5,6 +5,8 @@ import uuid
 from datetime import datetime
 from typing import Any
 
+from redis.exceptions import WatchError
+
 from app.core.redis import get_redis
 
 
@@ -12,7 +14,7 @@ class RedisService:
     """Service for Redis operations.
 
     Handles:
-    - Active session storage (7-day TTL)
+    - Active session storage (7-day TTL) with a per-user session index set
     - JWT blacklist for revoked access tokens (15-min TTL)
     - Email verification tokens (24-hour TTL)
     - Password reset tokens (1-hour TTL)
@@ -39,6 +41,9 @@ class RedisService:
         Value: JSON with session metadata
         TTL: 7 days (matches refresh token expiry)
 
+        The JTI is also added to user_sessions:{user_id} so all of a user's
+        sessions can be revoked without scanning the keyspace.
+
         Args:
             user_id: User UUID
             jti: JWT ID from refresh token
@@ -56,11 +61,13 @@ class RedisService:
             "created_at": datetime.utcnow().isoformat(),
         }
 
-        await redis.setex(
-            key,
-            RedisService.SESSION_TTL,
-            json.dumps(session_data),
-        )
+        index_key = f"user_sessions:{user_id}"
+
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.setex(key, RedisService.SESSION_TTL, json.dumps(session_data))
+            pipe.sadd(index_key, jti)
+            pipe.expire(index_key, RedisService.SESSION_TTL)
+            await pipe.execute()
 
     @staticmethod
     async def get_session(user_id: uuid.UUID, jti: str) -> dict[str, Any] | None:
@@ -93,30 +100,48 @@ class RedisService:
         """
         redis = await get_redis()
         key = f"session:{user_id}:{jti}"
-        await redis.delete(key)
+
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.srem(f"user_sessions:{user_id}", jti)
+            await pipe.execute()
 
     @staticmethod
-    async def delete_all_user_sessions(user_id: uuid.UUID) -> int:
+    async def delete_all_user_sessions(user_id: uuid.UUID, except_jti: str | None = None) -> int:
         """Delete all sessions for a user (password reset, account deactivation).
 
+        Sessions are found through the user_sessions:{user_id} index and
+        removed in a MULTI/EXEC transaction that WATCHes the index, so a
+        session added concurrently by set_session makes the transaction
+        retry instead of being left behind. The kept session (if any) is
+        never deleted.
+
         Args:
             user_id: User UUID
+            except_jti: Optional JTI of a session to keep active
 
         Returns:
             Number of sessions deleted
         """
         redis = await get_redis()
-        pattern = f"session:{user_id}:*"
-
-        # Find all matching keys
-        keys = []
-        async for key in redis.scan_iter(match=pattern):
-            keys.append(key)
-
-        # Delete all found keys
-        if keys:
-            return await redis.delete(*keys)
-        return 0
+        index_key = f"user_sessions:{user_id}"
+
+        async with redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(index_key)
+                    jtis = [jti for jti in await pipe.smembers(index_key) if jti != except_jti]
+                    if not jtis:
+                        await pipe.unwatch()
+                        return 0
+
+                    pipe.multi()
+                    pipe.delete(*(f"session:{user_id}:{jti}" for jti in jtis))
+                    pipe.srem(index_key, *jtis)
+                    deleted, _ = await pipe.execute()
+                    return int(deleted)
+                except WatchError:
+                    continue
 
     @staticmethod
     async def blacklist_token(jti: str) -> None:
@@ -1,10 +1,10 @@
 """Session service for managing user sessions (PostgreSQL audit + Redis active tracking)."""
 
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import select, update
+from sqlalchemy import func, literal, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.session import Session
@@ -42,17 +42,14 @@ class SessionService:
         Returns:
             Created Session model
         """
-        # Calculate expiry (7 days from now)
-        expires_at = datetime.utcnow() + timedelta(days=7)
-
         # Create session record in PostgreSQL (audit trail)
+        # expires_at is computed server-side (NOW() + 7 days) to avoid app clock skew
         session = Session(
             user_id=user_id,
             refresh_token_jti=refresh_token_jti,
             device_info=device_info,
             ip_address=ip_address or "unknown",
             user_agent=user_agent,
-            expires_at=expires_at,
         )
 
         db.add(session)
@@ -105,16 +102,16 @@ class SessionService:
         Returns:
             True if session was revoked, False if not found
         """
-        # Fetch session details for audit logging
-        stmt = select(Session).where(
+        # Fetch session IP for audit logging (only the column we need)
+        stmt = select(Session.ip_address).where(
             Session.user_id == user_id,
             Session.refresh_token_jti == refresh_token_jti,
             Session.revoked_at.is_(None),
         )
         session_result = await db.execute(stmt)
-        session = session_result.scalar_one_or_none()
+        session_row = session_result.one_or_none()
 
-        if not session:
+        if session_row is None:
             return False
 
         # Set revoked_at in PostgreSQL (immutable audit trail)
@@ -125,7 +122,7 @@ class SessionService:
                 Session.refresh_token_jti == refresh_token_jti,
                 Session.revoked_at.is_(None),  # Only revoke if not already revoked
             )
-            .values(revoked_at=datetime.utcnow())
+            .values(revoked_at=func.now())
         )
         await db.commit()
 
@@ -135,17 +132,17 @@ class SessionService:
         # Log audit event (get user email for logging)
         from app.models.user import User
 
-        user_stmt = select(User).where(User.id == user_id)
+        user_stmt = select(User.email).where(User.id == user_id)
         user_result = await db.execute(user_stmt)
-        user = user_result.scalar_one_or_none()
+        email = user_result.scalar_one_or_none()
 
-        if user:
-            AuditService.log_session_revoked(
+        if email:
+            AuditService.schedule_log_session_revoked(
                 user_id=user_id,
-                email=user.email,
+                email=email,
                 session_jti=refresh_token_jti,
                 reason=reason or "manual_logout",
-                ip_address=session.ip_address,
+                ip_address=session_row.ip_address,
             )
 
         rows_affected: int = result.rowcount or 0  # type: ignore[attr-defined]
@@ -172,9 +169,9 @@ class SessionService:
         # Get user info for audit logging
         from app.models.user import User
 
-        user_stmt = select(User).where(User.id == user_id)
+        user_stmt = select(User.email).where(User.id == user_id)
         user_result = await db.execute(user_stmt)
-        user = user_result.scalar_one_or_none()
+        email = user_result.scalar_one_or_none()
 
         # Build query to revoke sessions
         query = update(Session).where(
@@ -186,7 +183,7 @@ class SessionService:
         if except_jti:
             query = query.where(Session.refresh_token_jti != except_jti)
 
-        query = query.values(revoked_at=datetime.utcnow())
+        query = query.values(revoked_at=func.now())
 
         result = await db.execute(query)
         await db.commit()
@@ -194,34 +191,16 @@ class SessionService:
         rows_affected: int = result.rowcount or 0  # type: ignore[attr-defined]
 
         # Log audit event for bulk session revocation
-        if user and rows_affected > 0:
-            AuditService.log_session_revoked(
+        if email and rows_affected > 0:
+            AuditService.schedule_log_session_revoked(
                 user_id=user_id,
-                email=user.email,
+                email=email,
                 session_jti="ALL_SESSIONS",
                 reason=reason or "bulk_revocation",
             )
 
-        # Delete from Redis (except current session)
-        await RedisService.delete_all_user_sessions(user_id)
-
-        # Re-add current session if it was excluded
-        if except_jti:
-            # Fetch the session to get details
-            stmt = select(Session).where(
-                Session.user_id == user_id,
-                Session.refresh_token_jti == except_jti,
-            )
-            result_session = await db.execute(stmt)
-            current_session = result_session.scalar_one_or_none()
-
-            if current_session:
-                await RedisService.set_session(
-                    user_id=user_id,
-                    jti=except_jti,
-                    device_info=current_session.device_info,
-                    ip_address=current_session.ip_address,
-                )
+        # Delete from Redis atomically, keeping the current session if specified
+        await RedisService.delete_all_user_sessions(user_id, except_jti=except_jti)
 
         return rows_affected
 
@@ -229,24 +208,40 @@ class SessionService:
     async def get_user_sessions(
         db: AsyncSession,
         user_id: uuid.UUID,
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+        limit: int | None = None,
         active_only: bool = True,
     ) -> list[Session]:
-        """Get all sessions for a user (for session management UI).
+        """Get sessions for a user (for session management UI), newest first.
+
+        Supports keyset pagination on (created_at, id): pass the created_at
+        and id of the last session from the previous page as cursor to fetch
+        the next page. The id breaks ties between sessions created at the
+        same instant.
 
         Args:
             db: Database session
             user_id: User UUID
+            cursor: Only return sessions ordered after this (created_at, id)
+            limit: Maximum number of sessions to return (None returns all)
             active_only: If True, only return non-revoked sessions
 
         Returns:
-            List of Session models
+            List of Session models, newest first
         """
         query = select(Session).where(Session.user_id == user_id)
 
         if active_only:
             query = query.where(Session.revoked_at.is_(None))
 
-        query = query.order_by(Session.created_at.desc())
+        if cursor is not None:
+            cursor_created_at, cursor_id = cursor
+            query = query.where(
+                tuple_(Session.created_at, Session.id)
+                < tuple_(literal(cursor_created_at), literal(cursor_id))
+            )
+
+        query = query.order_by(Session.created_at.desc(), Session.id.desc()).limit(limit)
 
         result = await db.execute(query)
         return list(result.scalars().all())
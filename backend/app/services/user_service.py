@@ -7,11 +7,14 @@ including listing, creating, updating roles, and deactivating users.
 import uuid
 from math import ceil
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import event, func, or_, select, update
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapper
 
 from app.core.security import hash_password
-from app.models.user import User
+from app.models.role import Role
+from app.models.user import USER_SEARCH_TEXT, User
 from app.schemas.users import (
     UserCreateRequest,
     UserListResponse,
@@ -24,10 +27,59 @@ from app.services.permission_service import PermissionService
 class UserService:
     """Service for user management operations."""
 
+    # Role name -> role ID. Roles are seed data (migration 001, names fixed by
+    # a check constraint), so the mapping is loaded once and shared
+    # process-wide. ORM inserts/updates/deletes of Role clear it in this
+    # process; roles changed any other way (migrations, raw SQL, another
+    # worker) are picked up on restart or by calling clear_role_cache().
+    _ROLE_ID_BY_NAME: dict[str, uuid.UUID] = {}
+
     def __init__(self) -> None:
         """Initialize UserService with PermissionService."""
         self.permission_service = PermissionService()
 
+    @classmethod
+    async def prime_role_cache(cls, db: AsyncSession) -> None:
+        """Load the role name -> role ID mapping from the database.
+
+        Args:
+            db: Database session
+        """
+        result = await db.execute(select(Role.name, Role.id))
+        cls._ROLE_ID_BY_NAME = dict(result.tuples().all())
+
+    @classmethod
+    def clear_role_cache(cls) -> None:
+        """Forget cached role IDs (next lookup reloads them)."""
+        cls._ROLE_ID_BY_NAME = {}
+
+    async def _get_role_id(self, db: AsyncSession, role: str) -> uuid.UUID:
+        """Resolve a role name to its ID using the process-wide cache.
+
+        The cache is filled from the database when it is empty (e.g. priming
+        failed at startup) or does not hold the role yet.
+
+        Args:
+            db: Database session (used only on a cache miss)
+            role: Role name
+
+        Returns:
+            Role ID
+
+        Raises:
+            ValueError: If role does not exist
+        """
+        if not UserService._ROLE_ID_BY_NAME:
+            await UserService.prime_role_cache(db)
+
+        role_id = UserService._ROLE_ID_BY_NAME.get(role)
+        if role_id is None:
+            role_id = await db.scalar(select(Role.id).where(Role.name == role))
+            if role_id is None:
+                raise ValueError(f"Invalid role: {role}")
+            UserService._ROLE_ID_BY_NAME[role] = role_id
+        return role_id
+
     async def list_users(
         self,
         db: AsyncSession,
@@ -101,14 +153,8 @@ class UserService:
             stmt = stmt.where(User.is_active == is_active)
 
         if search:
-            search_pattern = f"%{search.lower()}%"
-            stmt = stmt.where(
-                or_(
-                    func.lower(User.first_name).like(search_pattern),
-                    func.lower(User.last_name).like(search_pattern),
-                    func.lower(User.email).like(search_pattern),
-                )
-            )
+            # Served by the users_name_trgm GIN index (migration 011)
+            stmt = stmt.where(USER_SEARCH_TEXT.ilike(f"%{search}%"))
 
         # Get total count
         count_stmt = select(func.count()).select_from(stmt.alias())
@@ -200,14 +246,7 @@ class UserService:
             raise ValueError("Email already exists")
 
         # Get role ID
-        from app.models.base import Base
-
-        roles_table = Base.metadata.tables["roles"]
-        role_stmt = select(roles_table.c.id).where(roles_table.c.name == user_data.role)
-        role_result = await db.execute(role_stmt)
-        role_id = role_result.scalar_one_or_none()
-        if not role_id:
-            raise ValueError(f"Invalid role: {user_data.role}")
+        role_id = await self._get_role_id(db, user_data.role)
 
         # Create user with provided password
         user = User(
@@ -256,6 +295,29 @@ class UserService:
 
         return user
 
+    async def _get_user_npo_id(self, db: AsyncSession, user_id: uuid.UUID) -> uuid.UUID | None:
+        """Get a user's npo_id without loading the full user row.
+
+        Args:
+            db: Database session
+            user_id: User ID to look up
+
+        Returns:
+            The user's NPO ID (None for platform-wide users)
+
+        Raises:
+            ValueError: If user not found
+        """
+        stmt = select(User.npo_id).where(User.id == user_id)
+        result = await db.execute(stmt)
+        row = result.one_or_none()
+
+        if row is None:
+            raise ValueError("User not found")
+
+        npo_id: uuid.UUID | None = row.npo_id
+        return npo_id
+
     async def update_user(
         self,
         db: AsyncSession,
@@ -323,14 +385,17 @@ class UserService:
             ValueError: If user not found or role/npo_id validation fails
             PermissionError: If user doesn't have permission to assign this role
         """
-        user = await self.get_user(db, current_user, user_id)
+        # Permission checks only need npo_id, so avoid loading the full row here
+        target_npo_id = await self._get_user_npo_id(db, user_id)
+        if not await self.permission_service.can_view_user(current_user, target_npo_id):
+            raise PermissionError("Insufficient permissions to view this user")
 
         # Prevent users from changing their own role
         if current_user.id == user_id:
             raise PermissionError("Cannot change your own role")
 
         # Check permissions
-        if not await self.permission_service.can_modify_user(current_user, user.npo_id):
+        if not await self.permission_service.can_modify_user(current_user, target_npo_id):
             raise PermissionError("Insufficient permissions to modify this user")
 
         if not await self.permission_service.can_assign_role(current_user, role):
@@ -340,14 +405,12 @@ class UserService:
         # See app/schemas/users.py for validation logic
 
         # Get role ID
-        from app.models.base import Base
+        role_id = await self._get_role_id(db, role)
 
-        roles_table = Base.metadata.tables["roles"]
-        role_stmt = select(roles_table.c.id).where(roles_table.c.name == role)
-        role_result = await db.execute(role_stmt)
-        role_id = role_result.scalar_one_or_none()
-        if not role_id:
-            raise ValueError(f"Invalid role: {role}")
+        # Served from the identity map when the caller already loaded this user
+        user = await db.get(User, user_id)
+        if not user:
+            raise ValueError("User not found")
 
         # Update role and npo_id
         user.role_id = role_id
@@ -375,18 +438,7 @@ class UserService:
             ValueError: If user not found
             PermissionError: If user doesn't have permission to modify this user
         """
-        user = await self.get_user(db, current_user, user_id)
-
-        # Check permissions
-        if not await self.permission_service.can_modify_user(current_user, user.npo_id):
-            raise PermissionError("Insufficient permissions to modify this user")
-
-        user.is_active = False
-
-        await db.commit()
-        await db.refresh(user)
-
-        return user
+        return await self._set_active(db, current_user, user_id, False)
 
     async def activate_user(self, db: AsyncSession, current_user: User, user_id: uuid.UUID) -> User:
         """Activate a user account.
@@ -403,15 +455,56 @@ class UserService:
             ValueError: If user not found
             PermissionError: If user doesn't have permission to modify this user
         """
-        user = await self.get_user(db, current_user, user_id)
+        return await self._set_active(db, current_user, user_id, True)
+
+    async def _set_active(
+        self, db: AsyncSession, current_user: User, user_id: uuid.UUID, value: bool
+    ) -> User:
+        """Set a user's is_active flag with a single UPDATE ... RETURNING.
+
+        Permission checks only need the target's npo_id, so the full row is
+        never SELECTed before the update.
+
+        Args:
+            db: Database session
+            current_user: User making the request
+            user_id: User ID to update
+            value: New is_active value
+
+        Returns:
+            Updated user
+
+        Raises:
+            ValueError: If user not found
+            PermissionError: If user doesn't have permission to modify this user
+        """
+        target_npo_id = await self._get_user_npo_id(db, user_id)
 
         # Check permissions
-        if not await self.permission_service.can_modify_user(current_user, user.npo_id):
+        if not await self.permission_service.can_view_user(current_user, target_npo_id):
+            raise PermissionError("Insufficient permissions to view this user")
+        if not await self.permission_service.can_modify_user(current_user, target_npo_id):
             raise PermissionError("Insufficient permissions to modify this user")
 
-        user.is_active = True
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(is_active=value)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
+        result = await db.execute(stmt)
+        user = result.scalar_one()
 
         await db.commit()
-        await db.refresh(user)
 
         return user
+
+
+def _clear_role_cache_on_write(mapper: Mapper[Role], connection: Connection, target: Role) -> None:
+    """Drop cached role IDs once a role row is written through the ORM."""
+    UserService.clear_role_cache()
+
+
+for _identifier in ("after_insert", "after_update", "after_delete"):
+    event.listen(Role, _identifier, _clear_role_cache_on_write)
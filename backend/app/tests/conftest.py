@@ -1,40 +1,199 @@
 """Pytest configuration and fixtures."""
 
 import asyncio
-from collections.abc import AsyncGenerator, Generator
+import contextlib
+import functools
+import hashlib
+import json
+import os
+import time
+import uuid
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
+from datetime import UTC, datetime
 from typing import Any
+from urllib.parse import urlsplit
 
 import pytest
 import pytest_asyncio
-from fastapi.testclient import TestClient
-from httpx import AsyncClient
-from redis.asyncio import Redis  # type: ignore[import-untyped]
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from httpx import ASGITransport, AsyncClient
+from pydantic import RedisDsn
+from pytest_asyncio import is_async_test
+from redis.asyncio import ConnectionPool, Redis  # type: ignore[import-untyped]
+from sqlalchemy import Index, event, func, insert, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateIndex, CreateTable
 
 from app.core.config import get_settings
 from app.core.database import get_db
+from app.core.redis import close_redis, get_redis
+from app.core.security import create_access_token, decode_token
 from app.main import app
 from app.models.base import Base
+from app.models.legal_document import (
+    LegalDocument,
+    LegalDocumentStatus,
+    LegalDocumentType,
+)
+from app.models.role import Role
+from app.models.session import SESSIONS_PARTITION_DDL
+from app.models.user import User
+from app.services.audit_service import AuditService
+from app.services.redis_service import RedisService
+from app.services.user_service import UserService
+from app.tests.helpers import password_hash
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is unavailable on Windows
+    uvloop = None  # type: ignore[assignment]
 
 settings = get_settings()
 
+# pytest-xdist worker id ("gw0", "gw1", ...), None when running without -n
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+
+# Tests use Redis database 1 (1 + N for xdist worker gwN, so workers don't flush
+# each other's keys). The database number in REDIS_URL takes precedence over a
+# db= argument, so rewrite the URL itself, and point the app's own client
+# (app.core.redis reads the same settings object) there too so a run never
+# touches development data in database 0
+TEST_REDIS_DB = 1 + int(XDIST_WORKER.removeprefix("gw")) if XDIST_WORKER else 1
+TEST_REDIS_URL = urlsplit(str(settings.redis_url))._replace(path=f"/{TEST_REDIS_DB}").geturl()
+settings.redis_url = RedisDsn(TEST_REDIS_URL)
+
+# Session factory for tests; bound to the shared test connection in db_session.
+# Commits become SAVEPOINT releases inside the per-test SAVEPOINT.
+TestSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    expire_on_commit=False,
+    join_transaction_mode="create_savepoint",
+)
+
+# Roles seeded into the test database (matches migration 001)
+ROLE_SEED: list[dict[str, str]] = [
+    {
+        "name": "super_admin",
+        "description": "Augeo platform staff with full access to all NPOs and events",
+        "scope": "platform",
+    },
+    {
+        "name": "npo_admin",
+        "description": "Full management access within assigned nonprofit organization(s)",
+        "scope": "npo",
+    },
+    {
+        "name": "event_coordinator",
+        "description": "Event and auction management within assigned NPO",
+        "scope": "npo",
+    },
+    {
+        "name": "staff",
+        "description": "Donor registration and check-in within assigned events",
+        "scope": "event",
+    },
+    {
+        "name": "donor",
+        "description": "Bidding and profile management only",
+        "scope": "own",
+    },
+]
+
 # ================================
 # Event Loop Configuration
 # ================================
 
 
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run every async test in the session-scoped event loop.
+
+    Session-scoped fixtures (engine, shared connection, HTTP client) are bound
+    to that loop, so tests must run in it too.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+# Fixture setup that issues more statements than this on the shared test
+# connection fails, so an N+1 creeping into the fixtures shows up immediately.
+# Tests that legitimately need more can raise it with @pytest.mark.max_queries(n).
+DEFAULT_MAX_SETUP_QUERIES = 10
+
+_query_counter = {"queries": 0}
+_setup_query_count = pytest.StashKey[int]()
+
+
+def _count_query(*_args: Any) -> None:
+    _query_counter["queries"] += 1
+
+
+@contextlib.contextmanager
+def _uncounted_queries() -> Generator[None, None, None]:
+    """Leave statements run inside the block out of the setup query count."""
+    queries = _query_counter["queries"]
+    try:
+        yield
+    finally:
+        _query_counter["queries"] = queries
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_setup(item: pytest.Item) -> Generator[None, None, None]:
+    """Fail tests whose fixture setup runs too many statements on the test connection."""
+    start = _query_counter["queries"]
+    result = yield
+    count = _query_counter["queries"] - start
+    item.stash[_setup_query_count] = count
+
+    marker = item.get_closest_marker("max_queries")
+    limit = marker.args[0] if marker else DEFAULT_MAX_SETUP_QUERIES
+    if count > limit:
+        pytest.fail(
+            f"Fixture setup ran {count} queries (limit {limit}); "
+            "batch the lookups or raise it with @pytest.mark.max_queries(n)",
+            pytrace=False,
+        )
+    return result
+
+
 @pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
     """
-    Create event loop for async tests.
+    Choose the event loop implementation for async tests.
 
-    Scope: session - one event loop for all tests
+    Scope: session - one policy for all tests
+    Uses uvloop (installed with uvicorn[standard]) when available.
     """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+    if uvloop is None:  # pragma: no cover - uvloop is unavailable on Windows
+        return asyncio.DefaultEventLoopPolicy()
+
+    policy: asyncio.AbstractEventLoopPolicy = uvloop.EventLoopPolicy()
+    return policy
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_password_hashing() -> Generator[None, None, None]:
+    """
+    Use the minimum bcrypt work factor while tests run.
+
+    Scope: session - set before any fixture hashes a password, restored at the end
+    Hashing is the same algorithm, just cheap enough that logins and
+    hash_password() calls don't dominate the suite.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(settings, "bcrypt_rounds", 4)
+        yield
 
 
 # ================================
@@ -42,10 +201,10 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
 # ================================
 
 
-@pytest.fixture(scope="session")
-def test_database_url() -> str:
+@functools.cache
+def get_test_database_url() -> str:
     """
-    Get test database URL.
+    Build the test database URL once per process.
 
     Uses separate test database to avoid conflicts with development data.
     Ensures asyncpg driver is used for async SQLAlchemy.
@@ -62,133 +221,318 @@ def test_database_url() -> str:
     if db_url.startswith("postgresql://"):
         db_url = db_url.replace("postgresql://", "postgresql+asyncpg://")
 
+    # Each pytest-xdist worker gets its own copy of the test database
+    if XDIST_WORKER:
+        url = make_url(db_url)
+        db_url = url.set(database=f"{url.database}_{XDIST_WORKER}").render_as_string(
+            hide_password=False
+        )
+
     return db_url
 
 
-@pytest_asyncio.fixture(scope="session")
-async def test_engine(test_database_url: str) -> AsyncGenerator[AsyncEngine, None]:
+@pytest.fixture(scope="session")
+def test_database_url() -> str:
+    """Get test database URL."""
+    return get_test_database_url()
+
+
+# PostgreSQL enum types for legal documentation (matching migration 007).
+# CREATE TYPE has no IF NOT EXISTS, so each one is guarded by its own
+# exception block; all of them go to the server in a single round-trip.
+_CREATE_ENUM_TYPES = text(
     """
-    Create test database engine.
+    DO $$
+    BEGIN
+        BEGIN
+            CREATE TYPE legal_document_type AS ENUM ('terms_of_service', 'privacy_policy');
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END;
+        BEGIN
+            CREATE TYPE legal_document_status AS ENUM ('draft', 'published', 'archived');
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END;
+        BEGIN
+            CREATE TYPE consent_status AS ENUM ('active', 'withdrawn', 'superseded');
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END;
+        BEGIN
+            CREATE TYPE consent_action AS ENUM (
+                'consent_given',
+                'consent_updated',
+                'consent_withdrawn',
+                'data_export_requested',
+                'data_deletion_requested',
+                'cookie_consent_updated'
+            );
+        EXCEPTION WHEN duplicate_object THEN NULL;
+        END;
+    END
+    $$
+    """
+)
 
-    Scope: session - one engine for all tests
-    Uses NullPool to avoid connection pooling in tests
-    """
-    engine = create_async_engine(test_database_url, poolclass=NullPool, echo=False)
-
-    # Create all tables including roles
-    async with engine.begin() as conn:
-        # First create roles table (required by users table FK)
-        await conn.execute(
-            text(
-                """
-                CREATE TABLE IF NOT EXISTS roles (
-                    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
-                    name VARCHAR(50) UNIQUE NOT NULL,
-                    description TEXT NOT NULL,
-                    scope VARCHAR(20) NOT NULL,
-                    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
-                    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
-                    CONSTRAINT role_name_valid CHECK (
-                        name IN ('super_admin', 'npo_admin', 'event_coordinator',
-                                 'staff', 'donor')
-                    ),
-                    CONSTRAINT role_scope_valid CHECK (
-                        scope IN ('platform', 'npo', 'event', 'own')
-                    )
-                )
-            """
-            )
-        )
 
-        # Seed roles
-        await conn.execute(
-            text(
-                """
-                INSERT INTO roles (name, description, scope) VALUES
-                    ('super_admin',
-                     'Augeo platform staff with full access to all NPOs and events',
-                     'platform'),
-                    ('npo_admin',
-                     'Full management access within assigned nonprofit organization(s)',
-                     'npo'),
-                    ('event_coordinator',
-                     'Event and auction management within assigned NPO',
-                     'npo'),
-                    ('staff', 'Donor registration and check-in within assigned events', 'event'),
-                    ('donor', 'Bidding and profile management only', 'own')
-                ON CONFLICT (name) DO NOTHING
-            """
-            )
+async def _create_schema(conn: AsyncConnection) -> None:
+    """Create enum types, missing tables and seed roles on an existing database."""
+    # Create PostgreSQL enum types for legal documentation (matching migration 007)
+    await conn.execute(_CREATE_ENUM_TYPES)
+
+    # Create all tables (including roles) from model metadata
+    await conn.run_sync(Base.metadata.create_all)
+
+    # Seed roles
+    await conn.execute(
+        pg_insert(Role).values(ROLE_SEED).on_conflict_do_nothing(index_elements=["name"])
+    )
+
+
+def _needs_pg_trgm(index: Index) -> bool:
+    """Whether an index uses pg_trgm operator classes (e.g. users_name_trgm)."""
+    return "gin_trgm_ops" in (index.dialect_options["postgresql"]["ops"] or {}).values()
+
+
+def _schema_script(pg_trgm: bool) -> str:
+    """Render the test schema (enums, tables, indexes, DDL, role seed) as one SQL script.
+
+    Trigram indexes only change query plans, so they are left out when the
+    server has no pg_trgm extension to build them with.
+    """
+    dialect = postgresql.dialect()  # type: ignore[no-untyped-call]
+    statements = [_CREATE_ENUM_TYPES.text]
+    if pg_trgm:
+        statements.append("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table in Base.metadata.sorted_tables:
+        statements.append(str(CreateTable(table).compile(dialect=dialect)))
+        statements.extend(
+            str(CreateIndex(index).compile(dialect=dialect))
+            for index in table.indexes
+            if pg_trgm or not _needs_pg_trgm(index)
         )
+    # after_create listeners only fire under metadata.create_all()
+    statements.extend(str(ddl.compile(dialect=dialect)) for ddl in SESSIONS_PARTITION_DDL)
+    role_seed = pg_insert(Role).values(
+        [{**role, "id": func.gen_random_uuid()} for role in ROLE_SEED]
+    )
+    statements.append(
+        str(role_seed.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    )
+    return ";\n".join(statements) + ";"
+
 
-        # Reflect the roles table into Base.metadata so auth_service can use it
-        await conn.run_sync(lambda sync_conn: Base.metadata.reflect(bind=sync_conn, only=["roles"]))
+def _schema_fingerprint(pg_trgm: bool) -> str:
+    """Hash the schema script; changes whenever the test schema would."""
+    return hashlib.sha256(_schema_script(pg_trgm).encode()).hexdigest()
 
-        # Create PostgreSQL enum types for legal documentation (matching migration 007)
-        # Use exception handling since CREATE TYPE doesn't support IF NOT EXISTS
-        try:
+
+async def _clone_test_database(test_database_url: str) -> None:
+    """
+    Recreate the test database from a template database.
+
+    The template (<test db>_template) is only rebuilt when the schema fingerprint
+    stored in its COMMENT no longer matches, so most runs skip all DDL and just
+    clone the template with CREATE DATABASE ... TEMPLATE. pytest-xdist workers
+    share one template and take turns under an advisory lock, since Postgres
+    refuses to clone a template while another session is using it.
+    """
+    url = make_url(test_database_url)
+    database = url.database or ""
+    if XDIST_WORKER:
+        database = database.removesuffix(f"_{XDIST_WORKER}")
+    template_name = f"{database}_template"
+
+    admin_engine = create_async_engine(
+        url.set(database="postgres"), isolation_level="AUTOCOMMIT", poolclass=NullPool
+    )
+    try:
+        async with admin_engine.connect() as conn:
+            # Released when the connection closes
             await conn.execute(
-                text(
-                    "CREATE TYPE legal_document_type AS ENUM ('terms_of_service', 'privacy_policy')"
-                )
+                text("SELECT pg_advisory_lock(hashtext(:name))"), {"name": template_name}
             )
-        except Exception:
-            pass  # Type already exists
-        try:
-            await conn.execute(
-                text("CREATE TYPE legal_document_status AS ENUM ('draft', 'published', 'archived')")
+            result = await conn.execute(
+                text(
+                    "SELECT shobj_description(oid, 'pg_database') "
+                    "FROM pg_database WHERE datname = :name"
+                ),
+                {"name": template_name},
             )
-        except Exception:
-            pass
-        try:
-            await conn.execute(
-                text("CREATE TYPE consent_status AS ENUM ('active', 'withdrawn', 'superseded')")
+            row = result.first()
+            pg_trgm = await conn.scalar(
+                text("SELECT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')")
             )
-        except Exception:
-            pass
-        try:
-            await conn.execute(
-                text(
-                    "CREATE TYPE consent_action AS ENUM ('consent_given', 'consent_updated', 'consent_withdrawn', 'data_export_requested', 'data_deletion_requested', 'cookie_consent_updated')"
+            fingerprint = _schema_fingerprint(pg_trgm)
+
+            if row is None or row[0] != fingerprint:
+                if row is not None:
+                    await conn.execute(
+                        text(f'ALTER DATABASE "{template_name}" WITH IS_TEMPLATE false')
+                    )
+                await conn.execute(text(f'DROP DATABASE IF EXISTS "{template_name}" WITH (FORCE)'))
+                await conn.execute(text(f'CREATE DATABASE "{template_name}"'))
+
+                template_engine = create_async_engine(
+                    url.set(database=template_name), poolclass=NullPool
                 )
-            )
-        except Exception:
-            pass
+                try:
+                    # The template is empty, so the whole schema goes over in one
+                    # simple-query round-trip instead of one per statement
+                    async with template_engine.connect() as template_conn:
+                        raw_conn = await template_conn.get_raw_connection()
+                        assert raw_conn.driver_connection is not None
+                        await raw_conn.driver_connection.execute(_schema_script(pg_trgm))
+                finally:
+                    await template_engine.dispose()
+
+                await conn.execute(
+                    text(f"COMMENT ON DATABASE \"{template_name}\" IS '{fingerprint}'")
+                )
+                # A stray connection to the template would make every clone fail
+                await conn.execute(
+                    text(
+                        f'ALTER DATABASE "{template_name}" '
+                        "WITH IS_TEMPLATE true ALLOW_CONNECTIONS false"
+                    )
+                )
+
+            await conn.execute(text(f'DROP DATABASE IF EXISTS "{url.database}" WITH (FORCE)'))
+            await conn.execute(text(f'CREATE DATABASE "{url.database}" TEMPLATE "{template_name}"'))
+    finally:
+        await admin_engine.dispose()
+
+
+# Queries on the login/authentication path, mirrored from the services so they
+# compile to the same SQL text the app sends
+_WARMUP_STATEMENTS = (
+    select(User).where(User.email == ""),
+    select(User).where(User.id == uuid.UUID(int=0)),
+    select(Role.name, Role.id),
+)
+
+
+async def _warm_up_pool(engine: AsyncEngine) -> None:
+    """Prepare hot statements on every pooled connection.
+
+    asyncpg caches prepared statements per connection, keyed by SQL text, so
+    later tests skip the parse/plan step for these queries.
+    """
+    # Keep each connection checked out so the pool opens (and warms) a new one
+    async with contextlib.AsyncExitStack() as stack:
+        for _ in range(engine.pool.size()):  # type: ignore[attr-defined]
+            conn = await stack.enter_async_context(engine.connect())
+            for statement in _WARMUP_STATEMENTS:
+                await conn.execute(statement)
+
+
+async def _drop_test_database(test_database_url: str) -> None:
+    """Drop a cloned test database."""
+    url = make_url(test_database_url)
+    admin_engine = create_async_engine(
+        url.set(database="postgres"), isolation_level="AUTOCOMMIT", poolclass=NullPool
+    )
+    try:
+        async with admin_engine.connect() as conn:
+            await conn.execute(text(f'DROP DATABASE IF EXISTS "{url.database}" WITH (FORCE)'))
+    finally:
+        await admin_engine.dispose()
 
-        # Then create other tables
-        await conn.run_sync(Base.metadata.create_all)
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def test_engine(test_database_url: str) -> AsyncGenerator[AsyncEngine, None]:
+    """
+    Create test database engine.
+
+    Scope: session - one engine for all tests
+    Uses a small connection pool so tests reuse connections instead of reconnecting
+    Dedicated test databases are cloned from a template; any other database
+    gets its schema built in place.
+    """
+    use_template = "test" in (make_url(test_database_url).database or "")
+    if use_template:
+        await _clone_test_database(test_database_url)
+
+    # Overflow covers bursts beyond the steady state (the shared test connection
+    # plus the concurrent token-priming logins) without waiting on the pool
+    engine = create_async_engine(
+        test_database_url, pool_size=5, max_overflow=5, pool_pre_ping=False, echo=False
+    )
+
+    if not use_template:
+        async with engine.begin() as conn:
+            await _create_schema(conn)
+
+    await _warm_up_pool(engine)
+
+    # Role IDs differ per database; reload them lazily from the test database
+    UserService.clear_role_cache()
 
     yield engine
 
-    # Drop all tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.execute(text("DROP TABLE IF EXISTS roles CASCADE"))
+    if not use_template:
+        # Drop all tables
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
 
     await engine.dispose()
 
+    # A cloned database is thrown away whole (the next run clones a fresh one);
+    # set KEEP_TEST_DB=1 to inspect it after the run
+    if use_template and not os.environ.get("KEEP_TEST_DB"):
+        await _drop_test_database(test_database_url)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _db_connection(
+    test_engine: AsyncEngine, _seed_users: dict[str, User]
+) -> AsyncGenerator[AsyncConnection, None]:
+    """
+    Open the connection every test runs on.
+
+    Scope: session - one connection and one outer transaction for the whole run
+    The outer transaction is rolled back at the end, so nothing tests write is kept.
+    NOW() is the transaction start time, so the committed fixture users are
+    seeded first to keep their timestamps earlier than anything tests write.
+    """
+    async with test_engine.connect() as connection:
+        event.listen(connection.sync_connection, "before_cursor_execute", _count_query)
+        outer_transaction = await connection.begin()
+
+        yield connection
+
+        await outer_transaction.rollback()
+
 
 @pytest_asyncio.fixture
-async def db_session(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+async def db_session(_db_connection: AsyncConnection) -> AsyncGenerator[AsyncSession, None]:
     """
     Create database session for each test.
 
     Scope: function - new session for each test
-    Uses transaction rollback to keep tests isolated
+    Runs the test inside a SAVEPOINT on the shared connection that is rolled
+    back at teardown. Commits issued by the code under test only release a
+    nested SAVEPOINT.
     """
-    # Start a transaction
-    connection = await test_engine.connect()
-    transaction = await connection.begin()
+    savepoint = await _db_connection.begin_nested()
 
-    # Create session bound to transaction
-    session = AsyncSession(bind=connection, expire_on_commit=False)
+    session = TestSessionLocal(bind=_db_connection)
 
     yield session
 
-    # Rollback transaction and close connection
     await session.close()
-    await transaction.rollback()
-    await connection.close()
+    if savepoint.is_active:
+        await savepoint.rollback()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def role_ids(test_engine: AsyncEngine) -> dict[str, uuid.UUID]:
+    """
+    Map role names to role IDs.
+
+    Scope: session - roles are seeded once and never change during the run
+    """
+    async with test_engine.connect() as conn:
+        result = await conn.execute(select(Role.name, Role.id))
+        return dict(result.tuples().all())
 
 
 # ================================
@@ -196,26 +540,54 @@ async def db_session(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, N
 # ================================
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def redis_client() -> AsyncGenerator["Redis[Any]", None]:
     """
     Create Redis client for tests.
 
-    Scope: function - new client for each test
-    Uses database 1 for tests (default is 0)
+    Scope: session - one connection pool shared by all tests
+    Uses TEST_REDIS_URL (database 1, or one per xdist worker)
     """
-    client: Redis[Any] = Redis.from_url(
-        str(settings.redis_url),
+    pool: ConnectionPool[Any] = ConnectionPool.from_url(
+        TEST_REDIS_URL,
         encoding="utf-8",
         decode_responses=True,
-        db=1,  # Use separate database for tests
+        max_connections=50,
     )
+    client: Redis[Any] = Redis(connection_pool=pool)
 
     yield client
 
-    # Clear test database
-    await client.flushdb()
-    await client.close()  # type: ignore[attr-defined]
+    await client.flushdb(asynchronous=True)
+    await client.aclose()  # type: ignore[attr-defined]
+    await pool.disconnect()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def app_redis() -> AsyncGenerator["Redis[Any]", None]:
+    """
+    Get the application's own Redis client.
+
+    Scope: session - the client and its pool are module globals in app.core.redis
+    Middleware and services call get_redis() directly rather than through the
+    dependency, so login rate limits and cached permissions live here.
+    """
+    yield await get_redis()
+
+    await close_redis()
+
+
+@pytest_asyncio.fixture
+async def _clean_redis(redis_client: "Redis[Any]") -> AsyncGenerator[None, None]:
+    """
+    Clear the Redis test database after each test.
+
+    Scope: function - keeps tests isolated while reusing the session client
+    FLUSHDB ASYNC frees the keys in a background thread, so teardown does not
+    wait on an O(N) delete.
+    """
+    yield
+    await redis_client.flushdb(asynchronous=True)
 
 
 # ================================
@@ -223,162 +595,373 @@ async def redis_client() -> AsyncGenerator["Redis[Any]", None]:
 # ================================
 
 
-@pytest.fixture
-def client() -> Generator[TestClient, None, None]:
+# Dependencies the shared client resolves for the current test (set per test
+# by async_client, read by the overrides installed once per session)
+_current_deps: dict[str, Any] = {}
+
+# Client address the ASGI transport reports for every test request
+_TEST_CLIENT_HOST = "127.0.0.1"
+
+
+async def _override_get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield the current test's database session."""
+    yield _current_deps["db"]
+
+
+async def _override_get_redis() -> "Redis[Any]":
+    """Return the test Redis client (db=1)."""
+    redis_client: Redis[Any] = _current_deps["redis"]
+    return redis_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _session_client(app_redis: "Redis[Any]") -> AsyncGenerator[AsyncClient, None]:
     """
-    Create synchronous test client.
+    Create the shared async test client.
 
-    Scope: function - new client for each test
-    Use for simple tests that don't need async
+    Scope: session - one client and one set of dependency overrides
+    ASGITransport does not run the app lifespan, whose startup primes the role
+    cache through the application's own engine. The parts that apply to tests
+    run once here instead: the app Redis client is connected up front (app_redis),
+    and the background audit worker runs for the session and is drained at the end.
     """
-    with TestClient(app) as test_client:
+    app.dependency_overrides[get_db] = _override_get_db
+    app.dependency_overrides[get_redis] = _override_get_redis
+    AuditService.start_background_worker()
+
+    transport = ASGITransport(app=app, client=(_TEST_CLIENT_HOST, 123))  # type: ignore[arg-type]
+    async with AsyncClient(transport=transport, base_url="http://test") as test_client:
         yield test_client
 
+    await AuditService.stop_background_worker()
+
+    # Remove only our overrides; leave any installed by other fixtures intact
+    app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_redis, None)
+
 
 @pytest_asyncio.fixture
 async def async_client(
-    db_session: AsyncSession, redis_client: Redis
-) -> AsyncGenerator[AsyncClient, None]:  # type: ignore[type-arg]
+    _session_client: AsyncClient,
+    _primed_tokens: None,
+    db_session: AsyncSession,
+    redis_client: "Redis[Any]",
+    _clean_redis: None,
+) -> AsyncGenerator[AsyncClient, None]:
     """
     Create async test client.
 
-    Scope: function - new client for each test
+    Scope: function - shared session client bound to this test's DB session
     Use for tests that need async operations
     """
+    default_headers = _session_client.headers.copy()
+    _current_deps["db"] = db_session
+    _current_deps["redis"] = redis_client
 
-    from app.core.redis import get_redis
+    yield _session_client
 
-    # Override get_db dependency to use test session
-    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
-        yield db_session
+    # Undo per-test state (e.g. Authorization set by the *_client fixtures)
+    _session_client.headers = default_headers
+    _session_client.cookies.clear()
+    _current_deps.clear()
 
-    # Override get_redis dependency to use test Redis client (db=1)
-    async def override_get_redis() -> Redis:  # type: ignore[type-arg]
-        return redis_client
 
-    app.dependency_overrides[get_db] = override_get_db
-    app.dependency_overrides[get_redis] = override_get_redis
+# ================================
+# Authentication Fixtures
+# ================================
 
-    async with AsyncClient(app=app, base_url="http://test") as test_client:
-        yield test_client
+# Namespace for deterministic fixture user IDs (stable across tests, so cached
+# access tokens keep pointing at the same user after each rollback)
+_FIXTURE_USER_NAMESPACE = uuid.UUID("6f1c2a4e-8d3b-4f5a-9c7e-2b1d0e9f8a7c")
 
-    app.dependency_overrides.clear()
+# Access tokens issued to fixture users, keyed by email
+_token_cache: dict[str, str] = {}
 
 
-# ================================
-# Authentication Fixtures
-# ================================
+def _fixture_user_id(email: str) -> uuid.UUID:
+    """Return the deterministic ID used for a fixture user."""
+    return uuid.uuid5(_FIXTURE_USER_NAMESPACE, email)
 
 
-@pytest_asyncio.fixture
-async def test_user(db_session: AsyncSession) -> Any:
+# Login requests only ever carry fixed credentials; serialize each body once
+_LOGIN_HEADERS = {"Content-Type": "application/json"}
+
+
+@functools.cache
+def _login_body(email: str) -> bytes:
+    """Get the pre-serialized JSON login body for a fixture user."""
+    return json.dumps({"email": email, "password": "TestPass123"}).encode()
+
+
+async def _cached_token(email: str) -> str | None:
     """
-    Create a test user for authentication tests.
+    Get the cached access token for a fixture user, if it is still usable.
 
-    Returns a User model instance with verified email and active status.
-    Password: TestPass123
+    A token is reused while it is valid for at least another minute and has
+    not been blacklisted.
     """
-    from sqlalchemy import text
-
-    from app.core.security import hash_password
-    from app.models.user import User
-
-    # Get donor role_id from database
-    role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-    donor_role_id = role_result.scalar_one()
-
-    # Create test user
-    user = User(
-        email="test@example.com",
-        first_name="Test",
-        last_name="User",
-        phone="+1-555-0100",
-        password_hash=hash_password("TestPass123"),
-        email_verified=True,
-        is_active=True,
-        role_id=donor_role_id,
+    token = _token_cache.get(email)
+    if token is None:
+        return None
+
+    claims = decode_token(token, verify_expiration=False)
+    if claims["exp"] - time.time() <= 60:
+        return None
+    if await RedisService.is_token_blacklisted(claims["jti"]):
+        return None
+    return token
+
+
+def _mint_token(user: User) -> str:
+    """Create an access token for a fixture user with the claims /auth/login issues."""
+    return create_access_token(
+        data={"sub": str(user.id), "email": user.email, "role": str(user.role_id)}
     )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
 
-    return user
+
+async def _login(async_client: AsyncClient, email: str) -> str:
+    """
+    Get an access token for a fixture user (password TestPass123).
+
+    Reuses a cached token when possible; otherwise logs in through the API.
+    """
+    token = await _cached_token(email)
+    if token is not None:
+        return token
+
+    # The token is cached for the rest of the run, so don't bill the login to
+    # whichever test happens to need it first.
+    with _uncounted_queries():
+        response = await async_client.post(
+            "/api/v1/auth/login",
+            content=_login_body(email),
+            headers=_LOGIN_HEADERS,
+        )
+    assert response.status_code == 200, f"Login failed: {response.json()}"
+
+    access_token: str = response.json()["access_token"]
+    _token_cache[email] = access_token
+    return access_token
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _seed_users(test_engine: AsyncEngine, role_ids: dict[str, uuid.UUID]) -> dict[str, User]:
+    """
+    Create every fixture user once and commit them.
+
+    Scope: session - tests only ever change these rows inside their own
+    rolled-back transaction
+    Inserts all users with a single multi-row INSERT ... RETURNING.
+    Returns detached, fully loaded User instances keyed like users_bundle.
+    """
+    npo_id = uuid.uuid4()
+
+    rows: dict[str, dict[str, Any]] = {
+        "user": {
+            "id": _fixture_user_id("test@example.com"),
+            "email": "test@example.com",
+            "first_name": "Test",
+            "last_name": "User",
+            "phone": "+1-555-0100",
+            "password_hash": password_hash("TestPass123"),
+            "email_verified": True,
+            "is_active": True,
+            "role_id": role_ids["donor"],
+            "npo_id": None,
+        },
+        "super_admin": {
+            "id": _fixture_user_id("superadmin@test.com"),
+            "email": "superadmin@test.com",
+            "first_name": "Super",
+            "last_name": "Admin",
+            "phone": "+1-555-0001",
+            "password_hash": password_hash("TestPass123"),
+            "email_verified": True,
+            "is_active": True,
+            "role_id": role_ids["super_admin"],
+            "npo_id": None,
+        },
+        "npo_admin": {
+            "id": _fixture_user_id("npoadmin@test.com"),
+            "email": "npoadmin@test.com",
+            "first_name": "NPO",
+            "last_name": "Admin",
+            "phone": "+1-555-0002",
+            "password_hash": password_hash("TestPass123"),
+            "email_verified": True,
+            "is_active": True,
+            "role_id": role_ids["npo_admin"],
+            "npo_id": npo_id,
+        },
+        "event_coordinator": {
+            "id": _fixture_user_id("eventcoordinator@test.com"),
+            "email": "eventcoordinator@test.com",
+            "first_name": "Event",
+            "last_name": "Coordinator",
+            "phone": "+1-555-0003",
+            "password_hash": password_hash("TestPass123"),
+            "email_verified": True,
+            "is_active": True,
+            "role_id": role_ids["event_coordinator"],
+            "npo_id": npo_id,
+        },
+        "staff": {
+            "id": _fixture_user_id("staff@test.com"),
+            "email": "staff@test.com",
+            "first_name": "Staff",
+            "last_name": "Member",
+            "phone": "+1-555-0004",
+            "password_hash": password_hash("TestPass123"),
+            "email_verified": True,
+            "is_active": True,
+            "role_id": role_ids["staff"],
+            "npo_id": npo_id,
+        },
+        "donor": {
+            "id": _fixture_user_id("donor@test.com"),
+            "email": "donor@test.com",
+            "first_name": "Donor",
+            "last_name": "Person",
+            "phone": "+1-555-0005",
+            "password_hash": password_hash("TestPass123"),
+            "email_verified": False,
+            "is_active": True,
+            "role_id": role_ids["donor"],
+            "npo_id": None,
+        },
+    }
+
+    # One INSERT ... VALUES (...), (...) RETURNING users.* round-trip; the
+    # returned rows are loaded straight into the identity map, so no reload.
+    # A multi-row VALUES clause needs the same columns in every row (npo_id=None).
+    async with AsyncSession(test_engine, expire_on_commit=False) as session:
+        result = await session.scalars(insert(User).values(list(rows.values())).returning(User))
+        users_by_email = {user.email: user for user in result}
+        await session.commit()
+
+    return {key: users_by_email[row["email"]] for key, row in rows.items()}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _primed_tokens(
+    _session_client: AsyncClient,
+    _seed_users: dict[str, User],
+    test_engine: AsyncEngine,
+    app_redis: "Redis[Any]",
+) -> None:
+    """
+    Log every verified fixture user in once, concurrently.
+
+    Scope: session - fills the token cache before the first test needs a token
+    Each login gets its own database session (the per-test session cannot
+    serve concurrent requests), so the resulting sessions rows are committed.
+    """
+
+    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncSession(test_engine, expire_on_commit=False) as session:
+            yield session
+
+    emails = [user.email for user in _seed_users.values() if user.email_verified]
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        responses = await asyncio.gather(
+            *(
+                _session_client.post(
+                    "/api/v1/auth/login", content=_login_body(email), headers=_LOGIN_HEADERS
+                )
+                for email in emails
+            )
+        )
+    finally:
+        app.dependency_overrides[get_db] = _override_get_db
+
+    for email, response in zip(emails, responses, strict=True):
+        assert response.status_code == 200, f"Login failed: {response.json()}"
+        _token_cache[email] = response.json()["access_token"]
+
+    # These logins count toward the test client's login rate limit
+    await app_redis.unlink(f"login_attempt:{_TEST_CLIENT_HOST}")
 
 
 @pytest_asyncio.fixture
-async def test_super_admin_user(db_session: AsyncSession) -> Any:
+async def verified_user_factory(
+    db_session: AsyncSession, role_ids: dict[str, uuid.UUID]
+) -> Callable[..., Awaitable[User]]:
     """
-    Create a test super_admin user.
+    Create verified, active donor accounts directly in the database.
 
-    Returns a User model instance with super_admin role.
-    Password: TestPass123
+    Scope: function - rows are rolled back with db_session
+    Stands in for register + verify-email in tests that only need an account
+    that can log in; those endpoints have their own contract tests.
     """
-    from sqlalchemy import text
-
-    from app.core.security import hash_password
-    from app.models.user import User
-
-    # Get super_admin role_id from database
-    role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'super_admin'"))
-    super_admin_role_id = role_result.scalar_one()
-
-    # Create test super_admin user
-    user = User(
-        email="superadmin@test.com",
-        first_name="Super",
-        last_name="Admin",
-        phone="+1-555-0001",
-        password_hash=hash_password("TestPass123"),
-        email_verified=True,
-        is_active=True,
-        role_id=super_admin_role_id,
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
 
-    return user
+    async def make(
+        email: str,
+        password: str = "SecurePass123",
+        first_name: str = "Test",
+        last_name: str = "User",
+    ) -> User:
+        user = User(
+            email=email,
+            password_hash=password_hash(password),
+            first_name=first_name,
+            last_name=last_name,
+            role_id=role_ids["donor"],
+            email_verified=True,
+            is_active=True,
+        )
+        db_session.add(user)
+        await db_session.commit()
+        return user
+
+    return make
 
 
 @pytest_asyncio.fixture
-async def test_npo_admin_user(db_session: AsyncSession) -> Any:
+async def users_bundle(db_session: AsyncSession, _seed_users: dict[str, User]) -> dict[str, Any]:
     """
-    Create a test npo_admin user.
+    Get every fixture user, attached to this test's session.
 
-    Returns a User model instance with npo_admin role and npo_id.
+    Scope: function - changes are rolled back with db_session
+    Merges the session-seeded users without loading them again, so no SQL runs.
+    Keys: user, super_admin, npo_admin, event_coordinator, staff, donor
+    Password for every user: TestPass123
+    """
+    return {key: await db_session.merge(user, load=False) for key, user in _seed_users.items()}
+
+
+@pytest_asyncio.fixture
+async def test_user(users_bundle: dict[str, Any]) -> Any:
+    """
+    Get the test user for authentication tests.
+
+    Returns a User model instance with verified email and active status.
     Password: TestPass123
     """
-    import uuid
+    return users_bundle["user"]
 
-    from sqlalchemy import text
 
-    from app.core.security import hash_password
-    from app.models.user import User
+@pytest_asyncio.fixture
+async def test_super_admin_user(users_bundle: dict[str, Any]) -> Any:
+    """
+    Get the test super_admin user.
 
-    # Get npo_admin role_id from database
-    role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'npo_admin'"))
-    npo_admin_role_id = role_result.scalar_one()
+    Returns a User model instance with super_admin role.
+    Password: TestPass123
+    """
+    return users_bundle["super_admin"]
 
-    # Create test NPO ID
-    npo_id = uuid.uuid4()
 
-    # Create test npo_admin user
-    user = User(
-        email="npoadmin@test.com",
-        first_name="NPO",
-        last_name="Admin",
-        phone="+1-555-0002",
-        password_hash=hash_password("TestPass123"),
-        email_verified=True,
-        is_active=True,
-        role_id=npo_admin_role_id,
-        npo_id=npo_id,
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
+@pytest_asyncio.fixture
+async def test_npo_admin_user(users_bundle: dict[str, Any]) -> Any:
+    """
+    Get the test npo_admin user.
 
-    return user
+    Returns a User model instance with npo_admin role and npo_id.
+    Password: TestPass123
+    """
+    return users_bundle["npo_admin"]
 
 
 @pytest_asyncio.fixture
@@ -390,140 +973,48 @@ async def test_npo_id(test_npo_admin_user: Any) -> Any:
 
 
 @pytest_asyncio.fixture
-async def test_event_coordinator_user(db_session: AsyncSession, test_npo_id: Any) -> Any:
+async def test_event_coordinator_user(users_bundle: dict[str, Any]) -> Any:
     """
-    Create a test event_coordinator user.
+    Get the test event_coordinator user.
 
     Returns a User model instance with event_coordinator role and npo_id.
     Password: TestPass123
     """
-    from sqlalchemy import text
-
-    from app.core.security import hash_password
-    from app.models.user import User
-
-    # Get event_coordinator role_id from database
-    role_result = await db_session.execute(
-        text("SELECT id FROM roles WHERE name = 'event_coordinator'")
-    )
-    event_coordinator_role_id = role_result.scalar_one()
-
-    # Create test event_coordinator user
-    user = User(
-        email="eventcoordinator@test.com",
-        first_name="Event",
-        last_name="Coordinator",
-        phone="+1-555-0003",
-        password_hash=hash_password("TestPass123"),
-        email_verified=True,
-        is_active=True,
-        role_id=event_coordinator_role_id,
-        npo_id=test_npo_id,
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
-    return user
+    return users_bundle["event_coordinator"]
 
 
 @pytest_asyncio.fixture
-async def test_staff_user(db_session: AsyncSession, test_npo_id: Any) -> Any:
+async def test_staff_user(users_bundle: dict[str, Any]) -> Any:
     """
-    Create a test staff user.
+    Get the test staff user.
 
     Returns a User model instance with staff role and npo_id.
     Password: TestPass123
     """
-    from sqlalchemy import text
-
-    from app.core.security import hash_password
-    from app.models.user import User
-
-    # Get staff role_id from database
-    role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'staff'"))
-    staff_role_id = role_result.scalar_one()
-
-    # Create test staff user
-    user = User(
-        email="staff@test.com",
-        first_name="Staff",
-        last_name="Member",
-        phone="+1-555-0004",
-        password_hash=hash_password("TestPass123"),
-        email_verified=True,
-        is_active=True,
-        role_id=staff_role_id,
-        npo_id=test_npo_id,
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
-    return user
+    return users_bundle["staff"]
 
 
 @pytest_asyncio.fixture
-async def test_donor_user(db_session: AsyncSession) -> Any:
+async def test_donor_user(users_bundle: dict[str, Any]) -> Any:
     """
-    Create a test donor user.
+    Get the test donor user.
 
     Returns a User model instance with donor role.
     Password: TestPass123
     """
-    from sqlalchemy import text
-
-    from app.core.security import hash_password
-    from app.models.user import User
-
-    # Get donor role_id from database
-    role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-    donor_role_id = role_result.scalar_one()
-
-    # Create test donor user
-    user = User(
-        email="donor@test.com",
-        first_name="Donor",
-        last_name="Person",
-        phone="+1-555-0005",
-        password_hash=hash_password("TestPass123"),
-        email_verified=False,
-        is_active=True,
-        role_id=donor_role_id,
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-
-    return user
+    return users_bundle["donor"]
 
 
 @pytest_asyncio.fixture
 async def test_super_admin_token(async_client: AsyncClient, test_super_admin_user: Any) -> str:
     """Get access token for test super_admin user."""
-    response = await async_client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": test_super_admin_user.email,
-            "password": "TestPass123",
-        },
-    )
-    assert response.status_code == 200
-    return response.json()["access_token"]
+    return await _login(async_client, test_super_admin_user.email)
 
 
 @pytest_asyncio.fixture
 async def test_npo_admin_token(async_client: AsyncClient, test_npo_admin_user: Any) -> str:
     """Get access token for test npo_admin user."""
-    response = await async_client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": test_npo_admin_user.email,
-            "password": "TestPass123",
-        },
-    )
-    assert response.status_code == 200
-    return response.json()["access_token"]
+    return await _login(async_client, test_npo_admin_user.email)
 
 
 @pytest_asyncio.fixture
@@ -531,29 +1022,13 @@ async def test_event_coordinator_token(
     async_client: AsyncClient, test_event_coordinator_user: Any
 ) -> str:
     """Get access token for test event_coordinator user."""
-    response = await async_client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": test_event_coordinator_user.email,
-            "password": "TestPass123",
-        },
-    )
-    assert response.status_code == 200
-    return response.json()["access_token"]
+    return await _login(async_client, test_event_coordinator_user.email)
 
 
 @pytest_asyncio.fixture
 async def test_staff_token(async_client: AsyncClient, test_staff_user: Any) -> str:
     """Get access token for test staff user."""
-    response = await async_client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": test_staff_user.email,
-            "password": "TestPass123",
-        },
-    )
-    assert response.status_code == 200
-    return response.json()["access_token"]
+    return await _login(async_client, test_staff_user.email)
 
 
 @pytest_asyncio.fixture
@@ -563,42 +1038,42 @@ async def test_donor_token(async_client: AsyncClient, test_donor_user: Any) -> s
     test_donor_user.email_verified = True
     test_donor_user.is_active = True
 
-    response = await async_client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": test_donor_user.email,
-            "password": "TestPass123",
-        },
-    )
-    assert response.status_code == 200
-    return response.json()["access_token"]
+    return await _login(async_client, test_donor_user.email)
 
 
 @pytest_asyncio.fixture
-async def authenticated_client(async_client: AsyncClient, test_user: Any) -> AsyncClient:
+async def all_tokens(async_client: AsyncClient, users_bundle: dict[str, Any]) -> dict[str, str]:
     """
-    Create authenticated async test client with access token.
+    Get access tokens for every fixture user at once.
 
-    Returns AsyncClient with Authorization header set to valid access token.
+    Keys match users_bundle (user, super_admin, npo_admin, ...).
+    Tokens primed at session start are validated concurrently against Redis;
+    logins for the rest (the donor, or revoked tokens) run one after another
+    because every request shares the test's single AsyncSession, which does
+    not allow concurrent use.
     """
-    # Clear rate limiting from Redis to avoid conflicts from previous test runs
-    from app.core.redis import get_redis
+    # Allow the (initially unverified) donor to log in, as test_donor_token does
+    users_bundle["donor"].email_verified = True
 
-    redis_client = await get_redis()
-    await redis_client.flushdb()
+    cached = await asyncio.gather(*(_cached_token(user.email) for user in users_bundle.values()))
 
-    # Login to get access token
-    response = await async_client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": test_user.email,
-            "password": "TestPass123",
-        },
-    )
+    tokens: dict[str, str] = {}
+    for (key, user), token in zip(users_bundle.items(), cached, strict=True):
+        tokens[key] = token if token is not None else await _login(async_client, user.email)
+    return tokens
 
-    assert response.status_code == 200, f"Login failed: {response.json()}"
-    data = response.json()
-    access_token = data["access_token"]
+
+@pytest_asyncio.fixture
+async def authenticated_client(async_client: AsyncClient, test_user: Any) -> AsyncClient:
+    """
+    Create authenticated async test client with access token.
+
+    Returns AsyncClient with Authorization header set to valid access token.
+
+    The token is minted directly rather than through /auth/login; tests that
+    exercise login itself use the *_token fixtures or call the endpoint.
+    """
+    access_token = _mint_token(test_user)
 
     # Set authorization header for subsequent requests
     async_client.headers["Authorization"] = f"Bearer {access_token}"
@@ -613,24 +1088,7 @@ async def super_admin_client(async_client: AsyncClient, test_super_admin_user: A
 
     Returns AsyncClient with Authorization header set to super_admin token.
     """
-    # Clear rate limiting from Redis to avoid conflicts from previous test runs
-    from app.core.redis import get_redis
-
-    redis_client = await get_redis()
-    await redis_client.flushdb()
-
-    # Login to get access token
-    response = await async_client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": test_super_admin_user.email,
-            "password": "TestPass123",
-        },
-    )
-
-    assert response.status_code == 200, f"Login failed: {response.json()}"
-    data = response.json()
-    access_token = data["access_token"]
+    access_token = _mint_token(test_super_admin_user)
 
     # Set authorization header for subsequent requests
     async_client.headers["Authorization"] = f"Bearer {access_token}"
@@ -645,24 +1103,7 @@ async def npo_admin_client(async_client: AsyncClient, test_npo_admin_user: Any)
 
     Returns AsyncClient with Authorization header set to npo_admin token.
     """
-    # Clear rate limiting from Redis to avoid conflicts from previous test runs
-    from app.core.redis import get_redis
-
-    redis_client = await get_redis()
-    await redis_client.flushdb()
-
-    # Login to get access token
-    response = await async_client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": test_npo_admin_user.email,
-            "password": "TestPass123",
-        },
-    )
-
-    assert response.status_code == 200, f"Login failed: {response.json()}"
-    data = response.json()
-    access_token = data["access_token"]
+    access_token = _mint_token(test_npo_admin_user)
 
     # Set authorization header for subsequent requests
     async_client.headers["Authorization"] = f"Bearer {access_token}"
@@ -679,24 +1120,7 @@ async def event_coordinator_client(
 
     Returns AsyncClient with Authorization header set to event_coordinator token.
     """
-    # Clear rate limiting from Redis to avoid conflicts from previous test runs
-    from app.core.redis import get_redis
-
-    redis_client = await get_redis()
-    await redis_client.flushdb()
-
-    # Login to get access token
-    response = await async_client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": test_event_coordinator_user.email,
-            "password": "TestPass123",
-        },
-    )
-
-    assert response.status_code == 200, f"Login failed: {response.json()}"
-    data = response.json()
-    access_token = data["access_token"]
+    access_token = _mint_token(test_event_coordinator_user)
 
     # Set authorization header for subsequent requests
     async_client.headers["Authorization"] = f"Bearer {access_token}"
@@ -742,8 +1166,7 @@ async def user_id(test_donor_user: Any) -> str:
 
 @pytest_asyncio.fixture
 async def published_legal_documents(
-    async_client: AsyncClient,
-    admin_auth_headers: dict[str, str],
+    db_session: AsyncSession,
 ) -> dict[str, str]:
     """
     Create and publish initial legal documents (TOS v1.0 and Privacy v1.0).
@@ -752,51 +1175,29 @@ async def published_legal_documents(
     - tos_id: UUID of published Terms of Service v1.0
     - privacy_id: UUID of published Privacy Policy v1.0
 
-    These are used as base documents for consent testing.
+    These are used as base documents for consent testing. The rows are inserted
+    already published rather than going through the admin create/publish
+    endpoints, which have their own contract tests.
     """
-    # Create TOS v1.0
-    tos_payload = {
-        "document_type": "terms_of_service",
-        "version": "1.0",
-        "content": "# Terms of Service v1.0\n\nInitial terms...",
-    }
-    tos_response = await async_client.post(
-        "/api/v1/legal/admin/documents",
-        json=tos_payload,
-        headers=admin_auth_headers,
-    )
-    assert tos_response.status_code == 201
-    tos_id = tos_response.json()["id"]
-
-    # Publish TOS
-    publish_tos_response = await async_client.post(
-        f"/api/v1/legal/admin/documents/{tos_id}/publish",
-        headers=admin_auth_headers,
-    )
-    assert publish_tos_response.status_code == 200
-
-    # Create Privacy v1.0
-    privacy_payload = {
-        "document_type": "privacy_policy",
-        "version": "1.0",
-        "content": "# Privacy Policy v1.0\n\nInitial privacy policy...",
-    }
-    privacy_response = await async_client.post(
-        "/api/v1/legal/admin/documents",
-        json=privacy_payload,
-        headers=admin_auth_headers,
+    published_at = datetime.now(UTC)
+    tos = LegalDocument(
+        document_type=LegalDocumentType.TERMS_OF_SERVICE,
+        version="1.0",
+        content="# Terms of Service v1.0\n\nInitial terms...",
+        status=LegalDocumentStatus.PUBLISHED,
+        published_at=published_at,
     )
-    assert privacy_response.status_code == 201
-    privacy_id = privacy_response.json()["id"]
-
-    # Publish Privacy
-    publish_privacy_response = await async_client.post(
-        f"/api/v1/legal/admin/documents/{privacy_id}/publish",
-        headers=admin_auth_headers,
+    privacy = LegalDocument(
+        document_type=LegalDocumentType.PRIVACY_POLICY,
+        version="1.0",
+        content="# Privacy Policy v1.0\n\nInitial privacy policy...",
+        status=LegalDocumentStatus.PUBLISHED,
+        published_at=published_at,
     )
-    assert publish_privacy_response.status_code == 200
+    db_session.add_all([tos, privacy])
+    await db_session.commit()
 
     return {
-        "tos_id": tos_id,
-        "privacy_id": privacy_id,
+        "tos_id": str(tos.id),
+        "privacy_id": str(privacy.id),
     }
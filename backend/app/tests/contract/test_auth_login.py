@@ -9,36 +9,28 @@ These tests verify:
 - Email verification is enforced
 """
 
+from collections.abc import Awaitable, Callable
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.user import User
+
 
 class TestAuthLoginContract:
     """Contract tests for user login endpoint."""
 
-    @pytest.mark.asyncio
     async def test_login_success_returns_200(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self, async_client: AsyncClient, verified_user_factory: Callable[..., Awaitable[User]]
     ) -> None:
         """Test successful login returns 200 with JWT tokens.
 
         Contract: POST /api/v1/auth/login
         Expected: 200 OK with LoginResponse schema (access_token, refresh_token, user)
         """
-        # First register a user and verify their email
-        register_payload = {
-            "email": "login.test@example.com",
-            "password": "SecurePass123",
-            "first_name": "Login",
-            "last_name": "Test",
-        }
-        register_response = await async_client.post("/api/v1/auth/register", json=register_payload)
-        assert register_response.status_code == 201
-
-        # Verify email before login
-        verification_token = register_response.json()["verification_token"]
-        await async_client.post("/api/v1/auth/verify-email", json={"token": verification_token})
+        # Verified account to log in with
+        await verified_user_factory("login.test@example.com", first_name="Login", last_name="Test")
 
         # Attempt login
         login_payload = {"email": "login.test@example.com", "password": "SecurePass123"}
@@ -68,7 +60,6 @@ class TestAuthLoginContract:
         assert data["access_token"].count(".") == 2
         assert data["refresh_token"].count(".") == 2
 
-    @pytest.mark.asyncio
     async def test_login_invalid_credentials_returns_401(self, async_client: AsyncClient) -> None:
         """Test invalid credentials return 401 Unauthorized.
 
@@ -91,7 +82,6 @@ class TestAuthLoginContract:
         assert "message" in error
         assert "Invalid email or password" in error["message"]
 
-    @pytest.mark.asyncio
     async def test_login_wrong_password_returns_401(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -121,7 +111,6 @@ class TestAuthLoginContract:
         assert "detail" in data
         assert data["detail"]["code"] == "INVALID_CREDENTIALS"
 
-    @pytest.mark.asyncio
     async def test_login_unverified_email_returns_400(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -153,7 +142,7 @@ class TestAuthLoginContract:
         assert error["code"] == "EMAIL_NOT_VERIFIED"
         assert "verify your email" in error["message"].lower()
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires user deactivation implementation")
     async def test_login_deactivated_account_returns_403(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -164,32 +153,23 @@ class TestAuthLoginContract:
         """
         # This test will need the implementation of user deactivation
         # For now, we define the expected contract
-        pytest.skip("Requires user deactivation implementation")
 
-    @pytest.mark.asyncio
-    async def test_login_missing_fields_returns_422(self, async_client: AsyncClient) -> None:
+    @pytest.mark.parametrize(
+        "payload",
+        [{"email": "test@example.com"}, {"password": "SecurePass123"}, {}],
+        ids=["missing-password", "missing-email", "empty"],
+    )
+    async def test_login_missing_fields_returns_422(
+        self, async_client: AsyncClient, payload: dict[str, str]
+    ) -> None:
         """Test missing required fields returns 422 Validation Error.
 
         Contract: email and password are required
         Expected: 422 Unprocessable Entity
         """
-        # Missing password
-        response1 = await async_client.post(
-            "/api/v1/auth/login", json={"email": "test@example.com"}
-        )
-        assert response1.status_code == 422
-
-        # Missing email
-        response2 = await async_client.post(
-            "/api/v1/auth/login", json={"password": "SecurePass123"}
-        )
-        assert response2.status_code == 422
-
-        # Empty payload
-        response3 = await async_client.post("/api/v1/auth/login", json={})
-        assert response3.status_code == 422
-
-    @pytest.mark.asyncio
+        response = await async_client.post("/api/v1/auth/login", json=payload)
+        assert response.status_code == 422
+
     async def test_login_rate_limiting_after_5_failed_attempts(
         self, async_client: AsyncClient
     ) -> None:
@@ -219,27 +199,16 @@ class TestAuthLoginContract:
         assert error["code"] == "RATE_LIMIT_EXCEEDED"
         assert "15 minutes" in error["message"]
 
-    @pytest.mark.asyncio
     async def test_login_case_insensitive_email(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self, async_client: AsyncClient, verified_user_factory: Callable[..., Awaitable[User]]
     ) -> None:
         """Test login with different email case still works.
 
         Contract: Email comparison should be case-insensitive
         Expected: Login succeeds with any case variation
         """
-        # Register with lowercase email
-        register_payload = {
-            "email": "case@example.com",
-            "password": "SecurePass123",
-            "first_name": "Test",
-            "last_name": "User",
-        }
-        register_response = await async_client.post("/api/v1/auth/register", json=register_payload)
-
-        # Verify email
-        verification_token = register_response.json()["verification_token"]
-        await async_client.post("/api/v1/auth/verify-email", json={"token": verification_token})
+        # Verified account with lowercase email
+        await verified_user_factory("case@example.com")
 
         # Try to login with uppercase email
         login_payload = {"email": "CASE@EXAMPLE.COM", "password": "SecurePass123"}
@@ -249,7 +218,7 @@ class TestAuthLoginContract:
         # For now, will fail with EMAIL_NOT_VERIFIED
         assert response.status_code in [200, 400]  # 200 if verified, 400 if not
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires implementation to verify timestamp update")
     async def test_login_updates_last_login_timestamp(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -260,9 +229,8 @@ class TestAuthLoginContract:
         """
         # This test will verify the side effect in the database
         # For now, we just verify the contract structure
-        pytest.skip("Requires implementation to verify timestamp update")
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires implementation to verify session creation")
     async def test_login_creates_session_record(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -272,4 +240,3 @@ class TestAuthLoginContract:
         Expected: Session record exists with device info, IP, user agent
         """
         # This test will verify session creation
-        pytest.skip("Requires implementation to verify session creation")
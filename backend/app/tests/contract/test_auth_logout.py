@@ -12,33 +12,24 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.user import User
+
 
 class TestAuthLogoutContract:
     """Contract tests for user logout endpoint."""
 
-    @pytest.mark.asyncio
     async def test_logout_success_returns_200(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self, async_client: AsyncClient, test_user: User
     ) -> None:
         """Test successful logout returns 200 with message.
 
         Contract: POST /api/v1/auth/logout
         Expected: 200 OK with MessageResponse schema
         """
-        # Register, verify, and login a user
-        register_payload = {
-            "email": "logout.test@example.com",
-            "password": "SecurePass123",
-            "first_name": "Logout",
-            "last_name": "Test",
-        }
-        register_response = await async_client.post("/api/v1/auth/register", json=register_payload)
-        verification_token = register_response.json()["verification_token"]
-        await async_client.post("/api/v1/auth/verify-email", json={"token": verification_token})
-
+        # Log in the shared fixture user (the new session is rolled back)
         login_response = await async_client.post(
             "/api/v1/auth/login",
-            json={"email": "logout.test@example.com", "password": "SecurePass123"},
+            json={"email": test_user.email, "password": "TestPass123"},
         )
         access_token = login_response.json()["access_token"]
         refresh_token = login_response.json()["refresh_token"]
@@ -55,7 +46,6 @@ class TestAuthLogoutContract:
         assert "message" in data
         assert "Logged out successfully" in data["message"]
 
-    @pytest.mark.asyncio
     async def test_logout_missing_auth_token_returns_401(self, async_client: AsyncClient) -> None:
         """Test logout without auth token returns 401 Unauthorized.
 
@@ -85,7 +75,6 @@ class TestAuthLogoutContract:
         reason="TODO: JWT validation raises unhandled JWTError for malformed tokens. "
         "Need to add exception handler in middleware to catch JWTError and return 401."
     )
-    @pytest.mark.asyncio
     async def test_logout_invalid_auth_token_returns_401(self, async_client: AsyncClient) -> None:
         """Test logout with invalid auth token returns 401 Unauthorized.
 
@@ -101,16 +90,14 @@ class TestAuthLogoutContract:
         # Verify status code
         assert response.status_code == 401
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires token expiration implementation")
     async def test_logout_expired_token_returns_401(self, async_client: AsyncClient) -> None:
         """Test logout with expired token returns 401 Unauthorized.
 
         Contract: Expired tokens should be rejected
         Expected: 401 Unauthorized
         """
-        pytest.skip("Requires token expiration implementation")
 
-    @pytest.mark.asyncio
     async def test_logout_missing_refresh_token_returns_422(
         self, async_client: AsyncClient
     ) -> None:
@@ -130,7 +117,7 @@ class TestAuthLogoutContract:
         # Should return validation error (once auth is implemented)
         assert response.status_code in [401, 422]  # 401 if auth fails first, 422 for validation
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires session implementation")
     async def test_logout_revokes_session_in_postgres(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -139,9 +126,8 @@ class TestAuthLogoutContract:
         Contract: Logout should set revoked_at timestamp on session
         Expected: Session record has revoked_at != null
         """
-        pytest.skip("Requires session implementation")
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires Redis session implementation")
     async def test_logout_deletes_session_from_redis(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -150,9 +136,8 @@ class TestAuthLogoutContract:
         Contract: Logout should delete session from Redis
         Expected: Redis key session:{user_id}:{jti} is deleted
         """
-        pytest.skip("Requires Redis session implementation")
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires JWT blacklist implementation")
     async def test_logout_blacklists_access_token(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -161,9 +146,8 @@ class TestAuthLogoutContract:
         Contract: Logout should blacklist access token JTI in Redis
         Expected: Redis key blacklist:{jti} exists with 15min TTL
         """
-        pytest.skip("Requires JWT blacklist implementation")
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires audit logging implementation")
     async def test_logout_creates_audit_log(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -172,9 +156,8 @@ class TestAuthLogoutContract:
         Contract: Logout should log 'logout' action to audit_logs
         Expected: audit_logs table has entry with action='logout'
         """
-        pytest.skip("Requires audit logging implementation")
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires full logout implementation")
     async def test_logout_idempotent_already_logged_out(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -183,4 +166,3 @@ class TestAuthLogoutContract:
         Contract: Logging out with already-revoked session should still return 200
         Expected: 200 OK (or appropriate error for already-revoked session)
         """
-        pytest.skip("Requires full logout implementation")
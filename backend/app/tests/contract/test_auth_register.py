@@ -8,7 +8,6 @@ These tests verify:
 - Business rules are enforced
 """
 
-import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,7 +15,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 class TestAuthRegisterContract:
     """Contract tests for user registration endpoint."""
 
-    @pytest.mark.asyncio
     async def test_register_success_returns_201(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -67,7 +65,6 @@ class TestAuthRegisterContract:
         # Verify message
         assert "Verification email sent" in data["message"]
 
-    @pytest.mark.asyncio
     async def test_register_duplicate_email_returns_409(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -102,7 +99,6 @@ class TestAuthRegisterContract:
         assert "message" in error
         assert "Email already registered" in error["message"]
 
-    @pytest.mark.asyncio
     async def test_register_weak_password_returns_422(self, async_client: AsyncClient) -> None:
         """Test weak password returns 422 Validation Error.
 
@@ -148,7 +144,6 @@ class TestAuthRegisterContract:
             assert isinstance(error["details"], list)
             assert len(error["details"]) > 0
 
-    @pytest.mark.asyncio
     async def test_register_missing_required_fields_returns_422(
         self, async_client: AsyncClient
     ) -> None:
@@ -178,7 +173,6 @@ class TestAuthRegisterContract:
             data = response.json()
             assert "detail" in data
 
-    @pytest.mark.asyncio
     async def test_register_invalid_email_format_returns_422(
         self, async_client: AsyncClient
     ) -> None:
@@ -202,7 +196,6 @@ class TestAuthRegisterContract:
             # Verify status code
             assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_register_email_case_insensitive(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -239,7 +232,6 @@ class TestAuthRegisterContract:
         # Should fail with duplicate email
         assert response2.status_code == 409
 
-    @pytest.mark.asyncio
     async def test_register_phone_optional(self, async_client: AsyncClient) -> None:
         """Test phone number is optional.
 
@@ -263,7 +255,6 @@ class TestAuthRegisterContract:
         data = response.json()
         assert data["user"]["phone"] is None
 
-    @pytest.mark.asyncio
     async def test_register_default_role_is_donor(self, async_client: AsyncClient) -> None:
         """Test new users get 'donor' role by default.
 
@@ -284,7 +275,6 @@ class TestAuthRegisterContract:
         data = response.json()
         assert data["user"]["role"] == "donor"
 
-    @pytest.mark.asyncio
     async def test_register_user_inactive_until_verified(self, async_client: AsyncClient) -> None:
         """Test new users are inactive until email verified.
 
@@ -8,8 +8,11 @@ Tests:
 2. POST /api/v1/auth/verify-email/resend - Resend verification email
 """
 
+from typing import Any
+
 import pytest
 from httpx import AsyncClient
+from redis.asyncio import Redis
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,7 +22,7 @@ class TestEmailVerificationContract:
 
     @pytest.fixture
     async def unverified_user_with_token(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self, async_client: AsyncClient, db_session: AsyncSession, app_redis: "Redis[Any]"
     ) -> dict[str, str]:
         """Create an unverified user and return their verification token."""
         # Register user (creates unverified account)
@@ -35,17 +38,14 @@ class TestEmailVerificationContract:
         user_id = user_data["user"]["id"]
 
         # Extract verification token from Redis (in real system, would come from email)
-        from app.core.redis import get_redis
-
-        redis = await get_redis()
         # Find the token by scanning for keys with this user_id
         cursor = 0
         token = None
         while True:
-            cursor, keys = await redis.scan(cursor, match="email_verify:*", count=100)
+            cursor, keys = await app_redis.scan(cursor, match="email_verify:*", count=100)
             for key in keys:
                 key_str = key.decode() if isinstance(key, bytes) else key
-                stored_user_id = await redis.get(key_str)
+                stored_user_id = await app_redis.get(key_str)
                 if stored_user_id:
                     # Handle both bytes and string returns from Redis
                     user_id_str = (
@@ -67,7 +67,6 @@ class TestEmailVerificationContract:
             "token": token,
         }
 
-    @pytest.mark.asyncio
     async def test_verify_email_success_returns_200(
         self,
         async_client: AsyncClient,
@@ -93,7 +92,6 @@ class TestEmailVerificationContract:
         assert "message" in data
         assert "verified" in data["message"].lower()
 
-    @pytest.mark.asyncio
     async def test_verify_email_invalid_token_returns_400(
         self,
         async_client: AsyncClient,
@@ -112,11 +110,11 @@ class TestEmailVerificationContract:
         error = response.json()["detail"]
         assert error["code"] in ["INVALID_TOKEN", "TOKEN_NOT_FOUND"]
 
-    @pytest.mark.asyncio
     async def test_verify_email_expired_token_returns_400(
         self,
         async_client: AsyncClient,
         unverified_user_with_token: dict[str, str],
+        app_redis: "Redis[Any]",
     ) -> None:
         """Test verification with expired token returns 400 Bad Request.
 
@@ -129,10 +127,7 @@ class TestEmailVerificationContract:
         token = unverified_user_with_token["token"]
 
         # Delete token to simulate expiration
-        from app.core.redis import get_redis
-
-        redis = await get_redis()
-        await redis.delete(f"email_verify:{token}")
+        await app_redis.delete(f"email_verify:{token}")
 
         # Try to verify with expired token
         verify_payload = {"token": token}
@@ -143,7 +138,6 @@ class TestEmailVerificationContract:
         error = response.json()["detail"]
         assert error["code"] in ["INVALID_TOKEN", "TOKEN_EXPIRED", "TOKEN_NOT_FOUND"]
 
-    @pytest.mark.asyncio
     async def test_verify_email_already_verified_returns_400(
         self,
         async_client: AsyncClient,
@@ -178,7 +172,6 @@ class TestEmailVerificationContract:
             error = response.json()["detail"]
             assert error["code"] in ["ALREADY_VERIFIED", "INVALID_TOKEN"]
 
-    @pytest.mark.asyncio
     async def test_verify_email_missing_token_returns_422(
         self,
         async_client: AsyncClient,
@@ -219,7 +212,6 @@ class TestEmailResendContract:
             "email": "resend.contract@example.com",
         }
 
-    @pytest.mark.asyncio
     async def test_resend_verification_success_returns_200(
         self,
         async_client: AsyncClient,
@@ -242,7 +234,6 @@ class TestEmailResendContract:
         assert "message" in data
         assert "sent" in data["message"].lower() or "resent" in data["message"].lower()
 
-    @pytest.mark.asyncio
     async def test_resend_verification_already_verified_returns_400(
         self,
         async_client: AsyncClient,
@@ -272,7 +263,6 @@ class TestEmailResendContract:
         error = response.json()["detail"]
         assert error["code"] == "ALREADY_VERIFIED"
 
-    @pytest.mark.asyncio
     async def test_resend_verification_user_not_found_returns_404(
         self,
         async_client: AsyncClient,
@@ -291,7 +281,6 @@ class TestEmailResendContract:
         error = response.json()["detail"]
         assert error["code"] == "USER_NOT_FOUND"
 
-    @pytest.mark.asyncio
     async def test_resend_verification_missing_email_returns_422(
         self,
         async_client: AsyncClient,
@@ -5,17 +5,17 @@ and POST /api/v1/auth/password/reset/confirm
 Tests verify API contract compliance per contracts/auth.yaml
 """
 
-import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
+from app.services.password_service import PasswordService
+from app.services.redis_service import RedisService
 
 
 class TestPasswordResetRequest:
     """Test POST /api/v1/password/reset/request endpoint."""
 
-    @pytest.mark.asyncio
     async def test_request_password_reset_success(
         self, async_client: AsyncClient, test_user: User
     ) -> None:
@@ -30,7 +30,6 @@ class TestPasswordResetRequest:
         assert "message" in data
         assert "password reset" in data["message"].lower()
 
-    @pytest.mark.asyncio
     async def test_request_password_reset_nonexistent_email(
         self, async_client: AsyncClient
     ) -> None:
@@ -44,7 +43,6 @@ class TestPasswordResetRequest:
         data = response.json()
         assert "message" in data
 
-    @pytest.mark.asyncio
     async def test_request_password_reset_invalid_email(self, async_client: AsyncClient) -> None:
         """Should return 422 for invalid email format."""
         response = await async_client.post(
@@ -56,7 +54,6 @@ class TestPasswordResetRequest:
         data = response.json()
         assert "detail" in data  # Pydantic validation error
 
-    @pytest.mark.asyncio
     async def test_request_password_reset_missing_email(self, async_client: AsyncClient) -> None:
         """Should return 422 when email is missing."""
         response = await async_client.post(
@@ -70,14 +67,10 @@ class TestPasswordResetRequest:
 class TestPasswordResetConfirm:
     """Test POST /api/v1/password/reset/confirm endpoint."""
 
-    @pytest.mark.asyncio
     async def test_confirm_password_reset_success(
         self, async_client: AsyncClient, db_session: AsyncSession, test_user: User
     ) -> None:
         """Should reset password with valid token."""
-        from app.services.password_service import PasswordService
-        from app.services.redis_service import RedisService
-
         # Generate token directly and store in Redis
         token = PasswordService.generate_reset_token()
         token_hash = PasswordService.hash_token(token)
@@ -96,7 +89,6 @@ class TestPasswordResetConfirm:
         assert "message" in data
         assert "password reset successfully" in data["message"].lower()
 
-    @pytest.mark.asyncio
     async def test_confirm_password_reset_invalid_token(self, async_client: AsyncClient) -> None:
         """Should return 400 for invalid or expired token."""
         response = await async_client.post(
@@ -112,8 +104,6 @@ class TestPasswordResetConfirm:
         assert "detail" in data
         assert data["detail"]["code"] == "INVALID_TOKEN"
 
-    @pytest.mark.asyncio
-    @pytest.mark.asyncio
     async def test_confirm_password_reset_weak_password(self, async_client: AsyncClient) -> None:
         """Should return 422 for weak password."""
         response = await async_client.post(
@@ -128,7 +118,6 @@ class TestPasswordResetConfirm:
         data = response.json()
         assert "detail" in data  # Pydantic validation error
 
-    @pytest.mark.asyncio
     async def test_confirm_password_reset_missing_fields(self, async_client: AsyncClient) -> None:
         """Should return 422 when required fields are missing."""
         response = await async_client.post(
@@ -142,7 +131,6 @@ class TestPasswordResetConfirm:
 class TestPasswordChange:
     """Test POST /api/v1/password/change endpoint."""
 
-    @pytest.mark.asyncio
     async def test_change_password_success(
         self, async_client: AsyncClient, authenticated_client: AsyncClient, test_user: User
     ) -> None:
@@ -160,7 +148,6 @@ class TestPasswordChange:
         assert "message" in data
         assert "password changed successfully" in data["message"].lower()
 
-    @pytest.mark.asyncio
     async def test_change_password_incorrect_current(
         self, authenticated_client: AsyncClient
     ) -> None:
@@ -178,8 +165,6 @@ class TestPasswordChange:
         assert "detail" in data
         assert data["detail"]["code"] == "INVALID_PASSWORD"
 
-    @pytest.mark.asyncio
-    @pytest.mark.asyncio
     async def test_change_password_weak_new_password(
         self, authenticated_client: AsyncClient
     ) -> None:
@@ -196,7 +181,6 @@ class TestPasswordChange:
         data = response.json()
         assert "detail" in data  # Pydantic validation error
 
-    @pytest.mark.asyncio
     async def test_change_password_unauthenticated(self, async_client: AsyncClient) -> None:
         """Should return 401 when not authenticated."""
         response = await async_client.post(
@@ -209,7 +193,6 @@ class TestPasswordChange:
 
         assert response.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_change_password_missing_fields(self, authenticated_client: AsyncClient) -> None:
         """Should return 422 when required fields are missing."""
         response = await authenticated_client.post(
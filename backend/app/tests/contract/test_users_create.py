@@ -13,14 +13,14 @@ import uuid
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.tests.helpers import INSERT_USER, password_hash
+
 
 class TestUsersCreateContract:
     """Contract tests for POST /api/v1/users endpoint."""
 
-    @pytest.mark.asyncio
     async def test_create_user_requires_authentication(self, async_client: AsyncClient) -> None:
         """Test that creating users requires authentication.
 
@@ -39,7 +39,6 @@ class TestUsersCreateContract:
         data = response.json()
         assert "detail" in data
 
-    @pytest.mark.asyncio
     async def test_create_user_donor_role_forbidden(
         self, authenticated_client: AsyncClient
     ) -> None:
@@ -82,7 +81,6 @@ class TestUsersCreateContract:
             or "authorized" in error_msg.lower()
         )
 
-    @pytest.mark.asyncio
     async def test_create_user_missing_required_fields_returns_400(
         self, authenticated_client: AsyncClient
     ) -> None:
@@ -103,34 +101,15 @@ class TestUsersCreateContract:
         data = response.json()
         assert "detail" in data
 
-    @pytest.mark.asyncio
-    async def test_create_user_invalid_email_returns_400(
-        self, super_admin_client: AsyncClient
-    ) -> None:
-        """Test that invalid email format returns 400.
-
-        Contract: POST /api/v1/users
-        Expected: 422 Unprocessable Entity with validation error
-        """
-        payload = {
-            "email": "not-an-email",
-            "first_name": "Test",
-            "last_name": "User",
-            "role": "donor",
-        }
-        response = await super_admin_client.post("/api/v1/users", json=payload)
-
-        assert response.status_code == 422
-        data = response.json()
-        assert "detail" in data
-        # Check validation error details for email field
-        assert any("email" in error["field"].lower() for error in data["detail"]["details"])
-
-    @pytest.mark.asyncio
-    async def test_create_user_invalid_role_returns_400(
-        self, super_admin_client: AsyncClient
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [("email", "not-an-email"), ("role", "invalid_role")],
+        ids=["invalid-email", "invalid-role"],
+    )
+    async def test_create_user_invalid_field_returns_400(
+        self, super_admin_client: AsyncClient, field: str, value: str
     ) -> None:
-        """Test that invalid role returns 400.
+        """Test that an invalid email or role returns 400.
 
         Contract: POST /api/v1/users
         Expected: 422 Unprocessable Entity with validation error
@@ -139,19 +118,22 @@ class TestUsersCreateContract:
             "email": "test@example.com",
             "first_name": "Test",
             "last_name": "User",
-            "role": "invalid_role",
+            "role": "donor",
+            field: value,
         }
         response = await super_admin_client.post("/api/v1/users", json=payload)
 
         assert response.status_code == 422
         data = response.json()
         assert "detail" in data
-        # Check validation error details for role field
-        assert any("role" in error["field"].lower() for error in data["detail"]["details"])
+        # Check validation error details for the invalid field
+        assert any(field in error["field"].lower() for error in data["detail"]["details"])
 
-    @pytest.mark.asyncio
     async def test_create_user_duplicate_email_returns_409(
-        self, super_admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        super_admin_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that duplicate email returns 409.
 
@@ -159,27 +141,17 @@ class TestUsersCreateContract:
         Expected: 409 Conflict
         """
         # Create a user first
-        from app.core.security import hash_password
-
-        role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = role_result.scalar_one()
+        donor_role_id = role_ids["donor"]
 
         user_id = uuid.uuid4()
         await db_session.execute(
-            text(
-                """
-                INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                 email_verified, is_active, role_id)
-                VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                       :email_verified, :is_active, :role_id)
-            """
-            ),
+            INSERT_USER,
             {
                 "id": user_id,
                 "email": "existing@example.com",
                 "first_name": "Existing",
                 "last_name": "User",
-                "password_hash": hash_password("Password123"),
+                "password_hash": password_hash("Password123"),
                 "email_verified": True,
                 "is_active": True,
                 "role_id": donor_role_id,
@@ -206,106 +178,44 @@ class TestUsersCreateContract:
             or "exists" in data["detail"]["message"].lower()
         )
 
-    @pytest.mark.asyncio
-    async def test_create_npo_admin_without_npo_id_returns_400(
-        self, super_admin_client: AsyncClient
-    ) -> None:
-        """Test that creating npo_admin without npo_id returns 400.
-
-        Contract: POST /api/v1/users
-        Expected: 422 Unprocessable Entity - npo_admin role requires npo_id
-        """
-        payload = {
-            "email": "npoadmin@example.com",
-            "password": "Password123",
-            "first_name": "NPO",
-            "last_name": "Admin",
-            "phone": "+1-555-0124",
-            "role": "npo_admin",
-            # Missing npo_id
-        }
-        response = await super_admin_client.post("/api/v1/users", json=payload)
-
-        assert response.status_code == 422
-        data = response.json()
-        assert "detail" in data
-        # Check validation error message mentions npo_id requirement
-        assert any("npo_id" in error["message"].lower() for error in data["detail"]["details"])
-
-    @pytest.mark.asyncio
-    async def test_create_event_coordinator_without_npo_id_returns_400(
-        self, super_admin_client: AsyncClient
+    @pytest.mark.parametrize(
+        ("role", "npo_id"),
+        [
+            ("npo_admin", None),
+            ("event_coordinator", None),
+            ("donor", "550e8400-e29b-41d4-a716-446655440000"),
+            ("staff", "550e8400-e29b-41d4-a716-446655440000"),
+        ],
+        ids=[
+            "npo-admin-without-npo-id",
+            "event-coordinator-without-npo-id",
+            "donor-with-npo-id",
+            "staff-with-npo-id",
+        ],
+    )
+    async def test_create_user_npo_id_mismatch_returns_400(
+        self, super_admin_client: AsyncClient, role: str, npo_id: str | None
     ) -> None:
-        """Test that creating event_coordinator without npo_id returns 400.
+        """Test that npo_id must match the role's NPO requirement.
 
         Contract: POST /api/v1/users
-        Expected: 422 Unprocessable Entity - event_coordinator role requires npo_id
+        Expected: 422 Unprocessable Entity - npo_admin and event_coordinator
+        require npo_id; donor and staff must not have one
         """
         payload = {
-            "email": "coordinator@example.com",
-            "password": "Password123",
-            "first_name": "Event",
-            "last_name": "Coordinator",
-            "phone": "+1-555-0125",
-            "role": "event_coordinator",
-            # Missing npo_id
-        }
-        response = await super_admin_client.post("/api/v1/users", json=payload)
-
-        assert response.status_code == 422
-        data = response.json()
-        assert "detail" in data
-        # Check validation error message mentions npo_id requirement
-        assert any("npo_id" in error["message"].lower() for error in data["detail"]["details"])
-
-    @pytest.mark.asyncio
-    async def test_create_donor_with_npo_id_returns_400(
-        self, super_admin_client: AsyncClient
-    ) -> None:
-        """Test that creating donor with npo_id returns 400.
-
-        Contract: POST /api/v1/users
-        Expected: 422 Unprocessable Entity - donor role must not have npo_id
-        """
-        payload = {
-            "email": "donor@example.com",
+            "email": f"{role}@example.com",
             "password": "Password123",
             "first_name": "Invalid",
-            "last_name": "Donor",
-            "phone": "+1-555-0126",
-            "role": "donor",
-            "npo_id": "550e8400-e29b-41d4-a716-446655440000",  # Should not be allowed
-        }
-        response = await super_admin_client.post("/api/v1/users", json=payload)
-
-        assert response.status_code == 422
-        data = response.json()
-        assert "detail" in data
-        # Check validation error message mentions npo_id should not be provided
-        assert any("npo_id" in error["message"].lower() for error in data["detail"]["details"])
-
-    @pytest.mark.asyncio
-    async def test_create_staff_with_npo_id_returns_400(
-        self, super_admin_client: AsyncClient
-    ) -> None:
-        """Test that creating staff with npo_id returns 400.
-
-        Contract: POST /api/v1/users
-        Expected: 422 Unprocessable Entity - staff role must not have npo_id
-        """
-        payload = {
-            "email": "staff@example.com",
-            "password": "Password123",
-            "first_name": "Invalid",
-            "last_name": "Staff",
-            "phone": "+1-555-0127",
-            "role": "staff",
-            "npo_id": "550e8400-e29b-41d4-a716-446655440000",  # Should not be allowed
+            "last_name": "User",
+            "phone": "+1-555-0124",
+            "role": role,
         }
+        if npo_id is not None:
+            payload["npo_id"] = npo_id
         response = await super_admin_client.post("/api/v1/users", json=payload)
 
         assert response.status_code == 422
         data = response.json()
         assert "detail" in data
-        # Check validation error message mentions npo_id should not be provided
+        # Check validation error message mentions the npo_id rule
         assert any("npo_id" in error["message"].lower() for error in data["detail"]["details"])
@@ -10,19 +10,20 @@ These tests verify:
 """
 
 import uuid
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
 
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
-from app.core.security import hash_password
+from app.tests.helpers import INSERT_USER, password_hash
 
 
 class TestUsersListContract:
     """Contract tests for GET /api/v1/users endpoint."""
 
-    @pytest.mark.asyncio
     async def test_list_users_requires_authentication(self, async_client: AsyncClient) -> None:
         """Test that listing users requires authentication.
 
@@ -35,9 +36,11 @@ class TestUsersListContract:
         data = response.json()
         assert "detail" in data
 
-    @pytest.mark.asyncio
     async def test_list_users_default_pagination(
-        self, super_admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        super_admin_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test default pagination (page=1, per_page=20).
 
@@ -45,31 +48,24 @@ class TestUsersListContract:
         Expected: 200 OK with paginated response
         """
         # Create some additional test users
-        role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = role_result.scalar_one()
-
-        for i in range(5):
-            user_id = uuid.uuid4()
-            await db_session.execute(
-                text(
-                    """
-                    INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                     email_verified, is_active, role_id)
-                    VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                           :email_verified, :is_active, :role_id)
-                """
-                ),
+        donor_role_id = role_ids["donor"]
+
+        await db_session.execute(
+            INSERT_USER,
+            [
                 {
-                    "id": user_id,
+                    "id": uuid.uuid4(),
                     "email": f"user{i}@example.com",
                     "first_name": f"User{i}",
                     "last_name": "Test",
-                    "password_hash": hash_password("Password123"),
+                    "password_hash": password_hash("Password123"),
                     "email_verified": True,
                     "is_active": True,
                     "role_id": donor_role_id,
-                },
-            )
+                }
+                for i in range(5)
+            ],
+        )
         await db_session.commit()
 
         response = await super_admin_client.get("/api/v1/users")
@@ -97,9 +93,11 @@ class TestUsersListContract:
         # At least the test_user and 5 created users should be present
         assert len(data["items"]) >= 6
 
-    @pytest.mark.asyncio
     async def test_list_users_custom_pagination(
-        self, super_admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        super_admin_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test custom pagination parameters.
 
@@ -107,31 +105,24 @@ class TestUsersListContract:
         Expected: 200 OK with specified page and per_page
         """
         # Create some test users
-        role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = role_result.scalar_one()
-
-        for i in range(5):
-            user_id = uuid.uuid4()
-            await db_session.execute(
-                text(
-                    """
-                    INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                     email_verified, is_active, role_id)
-                    VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                           :email_verified, :is_active, :role_id)
-                """
-                ),
+        donor_role_id = role_ids["donor"]
+
+        await db_session.execute(
+            INSERT_USER,
+            [
                 {
-                    "id": user_id,
+                    "id": uuid.uuid4(),
                     "email": f"page_user{i}@example.com",
                     "first_name": f"PageUser{i}",
                     "last_name": "Test",
-                    "password_hash": hash_password("Password123"),
+                    "password_hash": password_hash("Password123"),
                     "email_verified": True,
                     "is_active": True,
                     "role_id": donor_role_id,
-                },
-            )
+                }
+                for i in range(5)
+            ],
+        )
         await db_session.commit()
 
         response = await super_admin_client.get("/api/v1/users?page=2&per_page=2")
@@ -143,277 +134,117 @@ class TestUsersListContract:
         assert data["per_page"] == 2
         assert len(data["items"]) <= 2
 
-    @pytest.mark.asyncio
-    async def test_list_users_filter_by_role(
-        self, super_admin_client: AsyncClient, db_session: AsyncSession
-    ) -> None:
-        """Test filtering by role.
-
-        Contract: GET /api/v1/users?role=donor
-        Expected: 200 OK with only donor users
-        """
-        # Create users with different roles
-        donor_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = donor_result.scalar_one()
-
-        staff_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'staff'"))
-        staff_role_id = staff_result.scalar_one()
-
-        # Create 2 donors and 2 staff
-        for i in range(2):
-            user_id = uuid.uuid4()
-            await db_session.execute(
-                text(
-                    """
-                    INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                     email_verified, is_active, role_id)
-                    VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                           :email_verified, :is_active, :role_id)
-                """
-                ),
-                {
-                    "id": user_id,
-                    "email": f"donor_filter{i}@example.com",
-                    "first_name": f"Donor{i}",
-                    "last_name": "Test",
-                    "password_hash": hash_password("Password123"),
-                    "email_verified": True,
-                    "is_active": True,
-                    "role_id": donor_role_id,
-                },
-            )
-
-        for i in range(2):
-            user_id = uuid.uuid4()
-            await db_session.execute(
-                text(
-                    """
-                    INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                     email_verified, is_active, role_id)
-                    VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                           :email_verified, :is_active, :role_id)
-                """
-                ),
-                {
-                    "id": user_id,
-                    "email": f"staff_filter{i}@example.com",
-                    "first_name": f"Staff{i}",
-                    "last_name": "Test",
-                    "password_hash": hash_password("Password123"),
-                    "email_verified": True,
-                    "is_active": True,
-                    "role_id": staff_role_id,
-                },
-            )
-        await db_session.commit()
-
-        response = await super_admin_client.get("/api/v1/users?role=donor")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        # All returned users should have role "donor"
-        for user in data["items"]:
-            assert user["role"] == "donor"
-
-    @pytest.mark.asyncio
-    async def test_list_users_filter_by_email_verified(
-        self, super_admin_client: AsyncClient, db_session: AsyncSession
-    ) -> None:
-        """Test filtering by email_verified status.
+    @pytest_asyncio.fixture(scope="module", loop_scope="session")
+    async def filter_users(
+        self, _db_connection: AsyncConnection, role_ids: dict[str, uuid.UUID]
+    ) -> AsyncGenerator[None, None]:
+        """Create a mix of users that each filter test matches and excludes.
 
-        Contract: GET /api/v1/users?email_verified=false
-        Expected: 200 OK with only unverified users
+        Scope: module - inserted once in a SAVEPOINT on the shared connection
+        and rolled back after the last test in this module.
         """
-        role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = role_result.scalar_one()
-
-        # Create unverified user
-        user_id = uuid.uuid4()
-        await db_session.execute(
-            text(
-                """
-                INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                 email_verified, is_active, role_id)
-                VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                       :email_verified, :is_active, :role_id)
-            """
+        savepoint = await _db_connection.begin_nested()
+        rows = [
+            # 2 donors and 2 staff
+            *(
+                (f"Donor{i}", "Test", f"donor_filter{i}@example.com", True, True, "donor")
+                for i in range(2)
             ),
-            {
-                "id": user_id,
-                "email": "unverified@example.com",
-                "first_name": "Unverified",
-                "last_name": "User",
-                "password_hash": hash_password("Password123"),
-                "email_verified": False,
-                "is_active": False,
-                "role_id": donor_role_id,
-            },
-        )
-        await db_session.commit()
-
-        response = await super_admin_client.get("/api/v1/users?email_verified=false")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        # All returned users should have email_verified=false
-        for user in data["items"]:
-            assert user["email_verified"] is False
-
-    @pytest.mark.asyncio
-    async def test_list_users_filter_by_is_active(
-        self, super_admin_client: AsyncClient, db_session: AsyncSession
-    ) -> None:
-        """Test filtering by is_active status.
-
-        Contract: GET /api/v1/users?is_active=false
-        Expected: 200 OK with only inactive users
-        """
-        role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = role_result.scalar_one()
-
-        # Create inactive user
-        user_id = uuid.uuid4()
-        await db_session.execute(
-            text(
-                """
-                INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                 email_verified, is_active, role_id)
-                VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                       :email_verified, :is_active, :role_id)
-            """
+            *(
+                (f"Staff{i}", "Test", f"staff_filter{i}@example.com", True, True, "staff")
+                for i in range(2)
             ),
-            {
-                "id": user_id,
-                "email": "inactive@example.com",
-                "first_name": "Inactive",
-                "last_name": "User",
-                "password_hash": hash_password("Password123"),
-                "email_verified": True,
-                "is_active": False,
-                "role_id": donor_role_id,
-            },
+            ("Unverified", "User", "unverified@example.com", False, False, "donor"),
+            ("Inactive", "User", "inactive@example.com", True, False, "donor"),
+            # Distinctive names for search
+            ("John", "Smith", "john.smith@example.com", True, True, "donor"),
+            ("Jane", "Doe", "jane.doe@example.com", True, True, "donor"),
+        ]
+        await _db_connection.execute(
+            INSERT_USER,
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "email": email,
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "password_hash": password_hash("Password123"),
+                    "email_verified": email_verified,
+                    "is_active": is_active,
+                    "role_id": role_ids[role],
+                }
+                for first_name, last_name, email, email_verified, is_active, role in rows
+            ],
         )
-        await db_session.commit()
-
-        response = await super_admin_client.get("/api/v1/users?is_active=false")
 
-        assert response.status_code == 200
-        data = response.json()
-
-        # All returned users should have is_active=false
-        for user in data["items"]:
-            assert user["is_active"] is False
-
-    @pytest.mark.asyncio
-    async def test_list_users_filter_by_search(
-        self, super_admin_client: AsyncClient, db_session: AsyncSession
+        yield
+
+        if savepoint.is_active:
+            await savepoint.rollback()
+
+    @pytest.mark.parametrize(
+        ("query", "matches"),
+        [
+            ("role=donor", lambda user: user["role"] == "donor"),
+            ("email_verified=false", lambda user: user["email_verified"] is False),
+            ("is_active=false", lambda user: user["is_active"] is False),
+            (
+                "search=john",
+                lambda user: any(
+                    "john" in user[field].lower() for field in ("first_name", "last_name", "email")
+                ),
+            ),
+        ],
+        ids=["role", "email-verified", "is-active", "search"],
+    )
+    async def test_list_users_filter(
+        self,
+        super_admin_client: AsyncClient,
+        filter_users: None,
+        query: str,
+        matches: Callable[[dict[str, Any]], bool],
     ) -> None:
-        """Test search functionality across name and email.
+        """Test filtering by role, email_verified, is_active and search.
 
-        Contract: GET /api/v1/users?search=john
-        Expected: 200 OK with users matching search term
+        Contract: GET /api/v1/users?role=donor, ?email_verified=false,
+        ?is_active=false, ?search=john (search covers name and email)
+        Expected: 200 OK with only (and at least one) matching users
         """
-        role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = role_result.scalar_one()
-
-        # Create users with distinctive names
-        user_id = uuid.uuid4()
-        await db_session.execute(
-            text(
-                """
-                INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                 email_verified, is_active, role_id)
-                VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                       :email_verified, :is_active, :role_id)
-            """
-            ),
-            {
-                "id": user_id,
-                "email": "john.smith@example.com",
-                "first_name": "John",
-                "last_name": "Smith",
-                "password_hash": hash_password("Password123"),
-                "email_verified": True,
-                "is_active": True,
-                "role_id": donor_role_id,
-            },
-        )
-
-        user_id = uuid.uuid4()
-        await db_session.execute(
-            text(
-                """
-                INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                 email_verified, is_active, role_id)
-                VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                       :email_verified, :is_active, :role_id)
-            """
-            ),
-            {
-                "id": user_id,
-                "email": "jane.doe@example.com",
-                "first_name": "Jane",
-                "last_name": "Doe",
-                "password_hash": hash_password("Password123"),
-                "email_verified": True,
-                "is_active": True,
-                "role_id": donor_role_id,
-            },
-        )
-        await db_session.commit()
-
-        response = await super_admin_client.get("/api/v1/users?search=john")
+        response = await super_admin_client.get(f"/api/v1/users?{query}")
 
         assert response.status_code == 200
         data = response.json()
 
-        # At least one user should match
         assert len(data["items"]) >= 1
-
-        # Check that matched users contain "john" in name or email (case-insensitive)
         for user in data["items"]:
-            search_match = (
-                "john" in user["first_name"].lower()
-                or "john" in user["last_name"].lower()
-                or "john" in user["email"].lower()
-            )
-            assert search_match
-
-    @pytest.mark.asyncio
-    async def test_list_users_invalid_page_returns_400(
-        self, super_admin_client: AsyncClient
-    ) -> None:
-        """Test invalid page parameter returns 400.
+            assert matches(user)
 
-        Contract: GET /api/v1/users?page=0
-        Expected: 422 Unprocessable Entity
-        """
-        response = await super_admin_client.get("/api/v1/users?page=0")
-
-        assert response.status_code == 422
-
-    @pytest.mark.asyncio
-    async def test_list_users_invalid_per_page_returns_400(
-        self, super_admin_client: AsyncClient
+    async def test_list_users_search_does_not_span_fields(
+        self, super_admin_client: AsyncClient, filter_users: None
     ) -> None:
-        """Test invalid per_page parameter returns 400.
+        """Test search terms only match within a single field.
 
-        Contract: GET /api/v1/users?per_page=0
-        Expected: 422 Unprocessable Entity
+        Contract: GET /api/v1/users?search=smith john
+        Expected: 200 OK with no items ("Smith" ends last_name, "john" starts email)
         """
-        response = await super_admin_client.get("/api/v1/users?per_page=0")
+        response = await super_admin_client.get("/api/v1/users", params={"search": "smith john"})
 
-        assert response.status_code == 422
-
-    @pytest.mark.asyncio
-    async def test_list_users_per_page_max_100(self, super_admin_client: AsyncClient) -> None:
-        """Test per_page cannot exceed 100.
+        assert response.status_code == 200
+        assert response.json()["items"] == []
+
+    @pytest.mark.parametrize(
+        "query",
+        ["page=0", "per_page=0", "per_page=101"],
+        ids=["page-below-1", "per-page-below-1", "per-page-above-100"],
+    )
+    async def test_list_users_invalid_pagination_returns_400(
+        self, super_admin_client: AsyncClient, query: str
+    ) -> None:
+        """Test out-of-range pagination parameters return 400.
 
-        Contract: GET /api/v1/users?per_page=101
+        Contract: GET /api/v1/users (page >= 1, 1 <= per_page <= 100)
         Expected: 422 Unprocessable Entity
         """
-        response = await super_admin_client.get("/api/v1/users?per_page=101")
+        response = await super_admin_client.get(f"/api/v1/users?{query}")
 
         assert response.status_code == 422
@@ -11,20 +11,20 @@ These tests verify:
 
 import uuid
 
-import pytest
 from httpx import AsyncClient
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import hash_password
+from app.tests.helpers import INSERT_NPO_USER, INSERT_USER, password_hash
 
 
 class TestUsersRoleUpdateContract:
     """Contract tests for PATCH /api/v1/users/{user_id}/role endpoint."""
 
-    @pytest.mark.asyncio
     async def test_update_role_requires_authentication(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that updating roles requires authentication.
 
@@ -32,25 +32,17 @@ class TestUsersRoleUpdateContract:
         Expected: 401 Unauthorized when no token provided
         """
         # Create a user to update
-        role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = role_result.scalar_one()
+        donor_role_id = role_ids["donor"]
 
         user_id = uuid.uuid4()
         await db_session.execute(
-            text(
-                """
-                INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                 email_verified, is_active, role_id)
-                VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                       :email_verified, :is_active, :role_id)
-            """
-            ),
+            INSERT_USER,
             {
                 "id": user_id,
                 "email": "toroleupdate@example.com",
                 "first_name": "To",
                 "last_name": "Update",
-                "password_hash": hash_password("Password123"),
+                "password_hash": password_hash("Password123"),
                 "email_verified": True,
                 "is_active": True,
                 "role_id": donor_role_id,
@@ -65,9 +57,11 @@ class TestUsersRoleUpdateContract:
         data = response.json()
         assert "detail" in data
 
-    @pytest.mark.asyncio
     async def test_update_role_donor_role_forbidden(
-        self, authenticated_client: AsyncClient, db_session: AsyncSession
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that donor role cannot update user roles.
 
@@ -75,25 +69,17 @@ class TestUsersRoleUpdateContract:
         Expected: 403 Forbidden for non-admin roles
         """
         # Create a user to update
-        role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = role_result.scalar_one()
+        donor_role_id = role_ids["donor"]
 
         user_id = uuid.uuid4()
         await db_session.execute(
-            text(
-                """
-                INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                 email_verified, is_active, role_id)
-                VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                       :email_verified, :is_active, :role_id)
-            """
-            ),
+            INSERT_USER,
             {
                 "id": user_id,
                 "email": "toroleupdate2@example.com",
                 "first_name": "To",
                 "last_name": "Update",
-                "password_hash": hash_password("Password123"),
+                "password_hash": password_hash("Password123"),
                 "email_verified": True,
                 "is_active": True,
                 "role_id": donor_role_id,
@@ -125,9 +111,11 @@ class TestUsersRoleUpdateContract:
             or "authorized" in error_message
         )
 
-    @pytest.mark.asyncio
     async def test_update_role_invalid_role_returns_400(
-        self, super_admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        super_admin_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that invalid role returns 400.
 
@@ -135,25 +123,17 @@ class TestUsersRoleUpdateContract:
         Expected: 422 Unprocessable Entity (Pydantic validation error)
         """
         # Create a user to update
-        role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = role_result.scalar_one()
+        donor_role_id = role_ids["donor"]
 
         user_id = uuid.uuid4()
         await db_session.execute(
-            text(
-                """
-                INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                 email_verified, is_active, role_id)
-                VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                       :email_verified, :is_active, :role_id)
-            """
-            ),
+            INSERT_USER,
             {
                 "id": user_id,
                 "email": "invalidrole@example.com",
                 "first_name": "Invalid",
                 "last_name": "Role",
-                "password_hash": hash_password("Password123"),
+                "password_hash": password_hash("Password123"),
                 "email_verified": True,
                 "is_active": True,
                 "role_id": donor_role_id,
@@ -166,7 +146,6 @@ class TestUsersRoleUpdateContract:
 
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_update_role_nonexistent_user_returns_404(
         self, super_admin_client: AsyncClient
     ) -> None:
@@ -185,9 +164,11 @@ class TestUsersRoleUpdateContract:
         data = response.json()
         assert "detail" in data
 
-    @pytest.mark.asyncio
     async def test_update_to_npo_admin_without_npo_id_returns_400(
-        self, super_admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        super_admin_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that updating to npo_admin without providing npo_id returns 400.
 
@@ -195,25 +176,17 @@ class TestUsersRoleUpdateContract:
         Expected: 422 Unprocessable Entity - npo_admin role requires npo_id
         """
         # Create a donor user without npo_id
-        role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = role_result.scalar_one()
+        donor_role_id = role_ids["donor"]
 
         user_id = uuid.uuid4()
         await db_session.execute(
-            text(
-                """
-                INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                 email_verified, is_active, role_id)
-                VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                       :email_verified, :is_active, :role_id)
-            """
-            ),
+            INSERT_USER,
             {
                 "id": user_id,
                 "email": "tonpoadmin@example.com",
                 "first_name": "To",
                 "last_name": "NPOAdmin",
-                "password_hash": hash_password("Password123"),
+                "password_hash": password_hash("Password123"),
                 "email_verified": True,
                 "is_active": True,
                 "role_id": donor_role_id,
@@ -231,9 +204,11 @@ class TestUsersRoleUpdateContract:
         # Check validation error message mentions npo_id requirement
         assert any("npo_id" in error["message"].lower() for error in data["detail"]["details"])
 
-    @pytest.mark.asyncio
     async def test_update_to_event_coordinator_without_npo_id_returns_400(
-        self, super_admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        super_admin_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that updating to event_coordinator without providing npo_id returns 400.
 
@@ -241,25 +216,17 @@ class TestUsersRoleUpdateContract:
         Expected: 422 Unprocessable Entity - event_coordinator role requires npo_id
         """
         # Create a donor user without npo_id
-        role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = role_result.scalar_one()
+        donor_role_id = role_ids["donor"]
 
         user_id = uuid.uuid4()
         await db_session.execute(
-            text(
-                """
-                INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                 email_verified, is_active, role_id)
-                VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                       :email_verified, :is_active, :role_id)
-            """
-            ),
+            INSERT_USER,
             {
                 "id": user_id,
                 "email": "tocoordinator@example.com",
                 "first_name": "To",
                 "last_name": "Coordinator",
-                "password_hash": hash_password("Password123"),
+                "password_hash": password_hash("Password123"),
                 "email_verified": True,
                 "is_active": True,
                 "role_id": donor_role_id,
@@ -277,9 +244,11 @@ class TestUsersRoleUpdateContract:
         # Check validation error message mentions npo_id requirement
         assert any("npo_id" in error["message"].lower() for error in data["detail"]["details"])
 
-    @pytest.mark.asyncio
     async def test_update_to_npo_admin_with_npo_id_succeeds(
-        self, super_admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        super_admin_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that updating to npo_admin with npo_id succeeds.
 
@@ -287,27 +256,19 @@ class TestUsersRoleUpdateContract:
         Expected: 200 OK with updated user
         """
         # Create a donor user without npo_id
-        role_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = role_result.scalar_one()
+        donor_role_id = role_ids["donor"]
 
         user_id = uuid.uuid4()
         npo_id = uuid.uuid4()
 
         await db_session.execute(
-            text(
-                """
-                INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                 email_verified, is_active, role_id)
-                VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                       :email_verified, :is_active, :role_id)
-            """
-            ),
+            INSERT_USER,
             {
                 "id": user_id,
                 "email": "npoadminupdate@example.com",
                 "first_name": "NPO",
                 "last_name": "AdminUpdate",
-                "password_hash": hash_password("Password123"),
+                "password_hash": password_hash("Password123"),
                 "email_verified": True,
                 "is_active": True,
                 "role_id": donor_role_id,
@@ -325,9 +286,11 @@ class TestUsersRoleUpdateContract:
         assert data["role"] == "npo_admin"
         assert data["npo_id"] == str(npo_id)
 
-    @pytest.mark.asyncio
     async def test_update_from_npo_admin_to_donor_clears_npo_id(
-        self, super_admin_client: AsyncClient, db_session: AsyncSession
+        self,
+        super_admin_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that updating from npo_admin to donor clears npo_id.
 
@@ -335,29 +298,19 @@ class TestUsersRoleUpdateContract:
         Expected: 200 OK with npo_id cleared
         """
         # Create an npo_admin user with npo_id
-        role_result = await db_session.execute(
-            text("SELECT id FROM roles WHERE name = 'npo_admin'")
-        )
-        npo_admin_role_id = role_result.scalar_one()
+        npo_admin_role_id = role_ids["npo_admin"]
 
         user_id = uuid.uuid4()
         npo_id = uuid.uuid4()
 
         await db_session.execute(
-            text(
-                """
-                INSERT INTO users (id, email, first_name, last_name, password_hash,
-                                 email_verified, is_active, role_id, npo_id)
-                VALUES (:id, :email, :first_name, :last_name, :password_hash,
-                       :email_verified, :is_active, :role_id, :npo_id)
-            """
-            ),
+            INSERT_NPO_USER,
             {
                 "id": user_id,
                 "email": "downgrade@example.com",
                 "first_name": "Downgrade",
                 "last_name": "Test",
-                "password_hash": hash_password("Password123"),
+                "password_hash": password_hash("Password123"),
                 "email_verified": True,
                 "is_active": True,
                 "role_id": npo_admin_role_id,
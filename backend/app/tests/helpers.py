@@ -0,0 +1,41 @@
+"""Shared constants and helpers for the test modules.
+
+Test modules import these from here rather than from conftest.py, which pytest
+loads itself (importing it again can re-run its module-level setup).
+"""
+
+import functools
+from typing import Final
+
+from sqlalchemy import text
+
+from app.core.security import hash_password
+
+# Raw user INSERTs for tests that bulk-create users (executemany over a list of
+# parameter dicts); built once and shared by the users contract tests
+INSERT_USER: Final = text(
+    """
+    INSERT INTO users (id, email, first_name, last_name, password_hash,
+                       email_verified, is_active, role_id)
+    VALUES (:id, :email, :first_name, :last_name, :password_hash,
+            :email_verified, :is_active, :role_id)
+    """
+)
+INSERT_NPO_USER: Final = text(
+    """
+    INSERT INTO users (id, email, first_name, last_name, password_hash,
+                       email_verified, is_active, role_id, npo_id)
+    VALUES (:id, :email, :first_name, :last_name, :password_hash,
+            :email_verified, :is_active, :role_id, :npo_id)
+    """
+)
+
+
+@functools.cache
+def password_hash(password: str) -> str:
+    """Hash a test password once per run.
+
+    Call it from fixtures and tests rather than at import time, so the hash
+    uses the lowered test work factor.
+    """
+    return hash_password(password)
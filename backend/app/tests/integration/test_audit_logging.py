@@ -6,7 +6,6 @@ authentication and authorization actions occur.
 
 import uuid
 
-import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,7 +16,6 @@ from app.services.audit_service import AuditService
 class TestAuditLogging:
     """Integration tests for audit log persistence."""
 
-    @pytest.mark.asyncio
     async def test_audit_service_creates_database_record(
         self,
         db_session: AsyncSession,
@@ -57,7 +55,6 @@ class TestAuditLogging:
         assert audit_log.event_metadata is not None
         assert audit_log.event_metadata["email"] == test_user.email
 
-    @pytest.mark.asyncio
     async def test_failed_login_logs_with_null_user_id(
         self,
         db_session: AsyncSession,
@@ -96,7 +93,6 @@ class TestAuditLogging:
         assert audit_log.event_metadata["email"] == "nonexistent@example.com"
         assert audit_log.event_metadata["reason"] == "User not found"
 
-    @pytest.mark.asyncio
     async def test_multiple_audit_log_methods(
         self,
         db_session: AsyncSession,
@@ -162,7 +158,6 @@ class TestAuditLogging:
         assert logout_log is not None
         assert logout_log.action == "logout"
 
-    @pytest.mark.asyncio
     async def test_audit_log_queryability(
         self,
         db_session: AsyncSession,
@@ -17,8 +17,10 @@ This tests the integration of:
 - Cache (Redis)
 """
 
+import asyncio
+
 import pytest
-from httpx import AsyncClient
+from httpx import AsyncClient, Response
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -30,7 +32,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 class TestAuthenticationFlow:
     """Integration tests for complete authentication flow."""
 
-    @pytest.mark.asyncio
     async def test_complete_auth_flow_register_to_logout(
         self,
         async_client: AsyncClient,
@@ -105,7 +106,6 @@ class TestAuthenticationFlow:
         # 4. Logout
         # 5. Verify session revocation
 
-    @pytest.mark.asyncio
     async def test_failed_login_does_not_create_session(
         self,
         async_client: AsyncClient,
@@ -136,7 +136,6 @@ class TestAuthenticationFlow:
         session_keys = await redis_client.keys("session:*")
         assert len(session_keys) == 0
 
-    @pytest.mark.asyncio
     async def test_register_duplicate_email_database_constraint(
         self,
         async_client: AsyncClient,
@@ -172,7 +171,6 @@ class TestAuthenticationFlow:
         # users = result.scalars().all()
         # assert len(users) == 1
 
-    @pytest.mark.asyncio
     async def test_password_hashing_integration(
         self,
         async_client: AsyncClient,
@@ -210,7 +208,6 @@ class TestAuthenticationFlow:
     @pytest.mark.skip(
         reason="TODO: Concurrent database operations cause ResourceClosedError in test cleanup - test infrastructure issue"
     )
-    @pytest.mark.asyncio
     async def test_concurrent_registration_race_condition(
         self,
         async_client: AsyncClient,
@@ -222,8 +219,6 @@ class TestAuthenticationFlow:
         1. Database constraint prevents duplicate emails even with concurrent requests
         2. One registration succeeds, others fail with 409
         """
-        import asyncio
-
         payload = {
             "email": "race@example.com",
             "password": "SecurePass123",
@@ -237,8 +232,6 @@ class TestAuthenticationFlow:
         responses = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Filter out exceptions and get actual response objects
-        from httpx import Response
-
         response_objects = [r for r in responses if isinstance(r, Response)]
 
         # Count successes (201) and conflicts (409)
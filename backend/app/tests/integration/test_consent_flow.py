@@ -19,18 +19,17 @@ This tests the integration of:
 
 import uuid
 
-import pytest
 from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.consent import ConsentAction, ConsentAuditLog, ConsentStatus, UserConsent
+from app.models.user import User
 
 
 class TestConsentFlow:
     """Integration tests for consent management operations."""
 
-    @pytest.mark.asyncio
     async def test_accept_consent_creates_record(
         self,
         async_client: AsyncClient,
@@ -62,7 +61,6 @@ class TestConsentFlow:
         assert consent is not None
         assert consent.status == ConsentStatus.ACTIVE
 
-    @pytest.mark.asyncio
     async def test_accept_consent_supersedes_previous(
         self,
         async_client: AsyncClient,
@@ -99,7 +97,6 @@ class TestConsentFlow:
         old_consent = result.scalar_one()
         assert old_consent.status == ConsentStatus.SUPERSEDED
 
-    @pytest.mark.asyncio
     async def test_accept_consent_creates_audit_log(
         self,
         async_client: AsyncClient,
@@ -131,7 +128,6 @@ class TestConsentFlow:
         assert audit_logs[0].details is not None
         assert "tos_document_id" in audit_logs[0].details
 
-    @pytest.mark.asyncio
     async def test_get_consent_status(
         self,
         async_client: AsyncClient,
@@ -163,7 +159,6 @@ class TestConsentFlow:
         assert data["current_tos_version"] == "1.0"
         assert data["current_privacy_version"] == "1.0"
 
-    @pytest.mark.asyncio
     async def test_consent_status_shows_outdated(
         self,
         async_client: AsyncClient,
@@ -213,7 +208,6 @@ class TestConsentFlow:
         assert data["current_tos_version"] == "1.0"
         assert data["latest_tos_version"] == "2.0"
 
-    @pytest.mark.asyncio
     async def test_get_consent_history(
         self,
         async_client: AsyncClient,
@@ -249,7 +243,6 @@ class TestConsentFlow:
         assert len(data["consents"]) == 2
         assert data["page"] == 1
 
-    @pytest.mark.asyncio
     async def test_withdraw_consent(
         self,
         async_client: AsyncClient,
@@ -287,13 +280,10 @@ class TestConsentFlow:
         assert consent.withdrawn_at is not None
 
         # Check user is deactivated
-        from app.models.user import User
-
         user_result = await db_session.execute(select(User).where(User.id == uuid.UUID(user_id)))
         user = user_result.scalar_one()
         assert user.is_active is False
 
-    @pytest.mark.asyncio
     async def test_request_data_export(
         self,
         async_client: AsyncClient,
@@ -322,7 +312,6 @@ class TestConsentFlow:
         audit_log = result.scalar_one_or_none()
         assert audit_log is not None
 
-    @pytest.mark.asyncio
     async def test_request_data_deletion(
         self,
         async_client: AsyncClient,
@@ -352,13 +341,10 @@ class TestConsentFlow:
         assert audit_log is not None
 
         # Check user is deactivated
-        from app.models.user import User
-
         user_result = await db_session.execute(select(User).where(User.id == uuid.UUID(user_id)))
         user = user_result.scalar_one()
         assert user.is_active is False
 
-    @pytest.mark.asyncio
     async def test_unauthenticated_cannot_access_consent_endpoints(
         self,
         async_client: AsyncClient,
@@ -17,7 +17,6 @@ This tests the integration of:
 
 import uuid
 
-import pytest
 from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -28,7 +27,6 @@ from app.models.consent import CookieConsent
 class TestCookieConsentFlow:
     """Integration tests for cookie consent operations."""
 
-    @pytest.mark.asyncio
     async def test_get_cookie_consent_anonymous_default(
         self,
         async_client: AsyncClient,
@@ -48,7 +46,6 @@ class TestCookieConsentFlow:
         assert data["marketing"] is False
         assert data["has_consent"] is False  # No consent set yet
 
-    @pytest.mark.asyncio
     async def test_set_cookie_consent_anonymous(
         self,
         async_client: AsyncClient,
@@ -84,7 +81,6 @@ class TestCookieConsentFlow:
         assert consent is not None
         assert consent.analytics is True
 
-    @pytest.mark.asyncio
     async def test_set_cookie_consent_authenticated(
         self,
         async_client: AsyncClient,
@@ -119,7 +115,6 @@ class TestCookieConsentFlow:
         assert consent is not None
         assert consent.marketing is True
 
-    @pytest.mark.asyncio
     async def test_get_cookie_consent_authenticated(
         self,
         async_client: AsyncClient,
@@ -152,7 +147,6 @@ class TestCookieConsentFlow:
         assert data["analytics"] is True
         assert data["marketing"] is False
 
-    @pytest.mark.asyncio
     async def test_update_cookie_consent_authenticated(
         self,
         async_client: AsyncClient,
@@ -198,7 +192,6 @@ class TestCookieConsentFlow:
         assert consent.analytics is True
         assert consent.marketing is True
 
-    @pytest.mark.asyncio
     async def test_update_cookie_consent_anonymous(
         self,
         async_client: AsyncClient,
@@ -236,7 +229,6 @@ class TestCookieConsentFlow:
         assert data["analytics"] is True
         assert data["marketing"] is False
 
-    @pytest.mark.asyncio
     async def test_revoke_cookie_consent_authenticated(
         self,
         async_client: AsyncClient,
@@ -274,7 +266,6 @@ class TestCookieConsentFlow:
         assert consent.analytics is False
         assert consent.marketing is False
 
-    @pytest.mark.asyncio
     async def test_revoke_cookie_consent_anonymous(
         self,
         async_client: AsyncClient,
@@ -311,7 +302,6 @@ class TestCookieConsentFlow:
         assert consent.analytics is False
         assert consent.marketing is False
 
-    @pytest.mark.asyncio
     async def test_essential_cookies_always_true(
         self,
         async_client: AsyncClient,
@@ -335,7 +325,6 @@ class TestCookieConsentFlow:
         data = response.json()
         assert data["essential"] is True  # Forced to True
 
-    @pytest.mark.asyncio
     async def test_get_cookie_consent_requires_session_or_auth(
         self,
         async_client: AsyncClient,
@@ -347,7 +336,6 @@ class TestCookieConsentFlow:
         # Based on implementation, it should return default (reject all)
         assert response.status_code in [200, 400]
 
-    @pytest.mark.asyncio
     async def test_authenticated_user_migrates_session_consent(
         self,
         async_client: AsyncClient,
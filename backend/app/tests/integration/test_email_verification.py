@@ -12,7 +12,6 @@ integration tests verify the complete user journey works end-to-end.
 
 import uuid
 
-import pytest
 from httpx import AsyncClient
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,9 +22,11 @@ from app.core.security import hash_password
 class TestEmailVerificationIntegration:
     """Integration tests for complete email verification workflows."""
 
-    @pytest.mark.asyncio
     async def test_super_admin_can_verify_any_user_email(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that super_admin can verify email for any user.
 
@@ -37,10 +38,7 @@ class TestEmailVerificationIntegration:
         5. Verify donor can now login
         """
         # Step 1: Create super_admin
-        super_admin_result = await db_session.execute(
-            text("SELECT id FROM roles WHERE name = 'super_admin'")
-        )
-        super_admin_role_id = super_admin_result.scalar_one()
+        super_admin_role_id = role_ids["super_admin"]
 
         admin_id = uuid.uuid4()
         await db_session.execute(
@@ -66,8 +64,7 @@ class TestEmailVerificationIntegration:
         await db_session.commit()
 
         # Step 2: Create unverified donor user
-        donor_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = donor_result.scalar_one()
+        donor_role_id = role_ids["donor"]
 
         donor_id = uuid.uuid4()
         await db_session.execute(
@@ -126,9 +123,11 @@ class TestEmailVerificationIntegration:
         donor_user = donor_login.json()["user"]
         assert donor_user["email_verified"] is True
 
-    @pytest.mark.asyncio
     async def test_npo_admin_can_verify_users_in_their_npo(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that npo_admin can verify emails for users in their NPO.
 
@@ -141,10 +140,7 @@ class TestEmailVerificationIntegration:
         npo_id = uuid.uuid4()
 
         # Step 1: Create npo_admin
-        npo_admin_result = await db_session.execute(
-            text("SELECT id FROM roles WHERE name = 'npo_admin'")
-        )
-        npo_admin_role_id = npo_admin_result.scalar_one()
+        npo_admin_role_id = role_ids["npo_admin"]
 
         admin_id = uuid.uuid4()
         await db_session.execute(
@@ -171,10 +167,7 @@ class TestEmailVerificationIntegration:
         await db_session.commit()
 
         # Step 2: Create unverified event_coordinator in same NPO
-        coordinator_result = await db_session.execute(
-            text("SELECT id FROM roles WHERE name = 'event_coordinator'")
-        )
-        coordinator_role_id = coordinator_result.scalar_one()
+        coordinator_role_id = role_ids["event_coordinator"]
 
         coordinator_id = uuid.uuid4()
         await db_session.execute(
@@ -218,9 +211,11 @@ class TestEmailVerificationIntegration:
         assert verified_user["email_verified"] is True
         assert verified_user["npo_id"] == str(npo_id)
 
-    @pytest.mark.asyncio
     async def test_npo_admin_cannot_verify_users_in_different_npo(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that npo_admin CANNOT verify emails for users in different NPO.
 
@@ -234,10 +229,7 @@ class TestEmailVerificationIntegration:
         npo_id_2 = uuid.uuid4()
 
         # Step 1: Create npo_admin in NPO 1
-        npo_admin_result = await db_session.execute(
-            text("SELECT id FROM roles WHERE name = 'npo_admin'")
-        )
-        npo_admin_role_id = npo_admin_result.scalar_one()
+        npo_admin_role_id = role_ids["npo_admin"]
 
         admin_id = uuid.uuid4()
         await db_session.execute(
@@ -264,10 +256,7 @@ class TestEmailVerificationIntegration:
         await db_session.commit()
 
         # Step 2: Create unverified user in NPO 2
-        coordinator_result = await db_session.execute(
-            text("SELECT id FROM roles WHERE name = 'event_coordinator'")
-        )
-        coordinator_role_id = coordinator_result.scalar_one()
+        coordinator_role_id = role_ids["event_coordinator"]
 
         coordinator_id = uuid.uuid4()
         await db_session.execute(
@@ -312,9 +301,11 @@ class TestEmailVerificationIntegration:
         error_message = error_data["detail"]["message"].lower()
         assert "npo" in error_message or "permission" in error_message
 
-    @pytest.mark.asyncio
     async def test_staff_and_donor_cannot_verify_emails(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that staff and donor roles cannot verify emails.
 
@@ -325,8 +316,7 @@ class TestEmailVerificationIntegration:
         4. Verify request is rejected with 403 Forbidden
         """
         # Step 1: Create staff user
-        staff_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'staff'"))
-        staff_role_id = staff_result.scalar_one()
+        staff_role_id = role_ids["staff"]
 
         staff_id = uuid.uuid4()
         await db_session.execute(
@@ -352,8 +342,7 @@ class TestEmailVerificationIntegration:
         await db_session.commit()
 
         # Step 2: Create unverified donor
-        donor_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = donor_result.scalar_one()
+        donor_role_id = role_ids["donor"]
 
         donor_id = uuid.uuid4()
         await db_session.execute(
@@ -392,9 +381,11 @@ class TestEmailVerificationIntegration:
         # Step 4: Verify request is rejected
         assert verify_response.status_code == 403
 
-    @pytest.mark.asyncio
     async def test_verify_email_for_nonexistent_user(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that verifying email for non-existent user returns 404.
 
@@ -404,10 +395,7 @@ class TestEmailVerificationIntegration:
         3. Verify request returns 404 Not Found
         """
         # Step 1: Create super_admin
-        super_admin_result = await db_session.execute(
-            text("SELECT id FROM roles WHERE name = 'super_admin'")
-        )
-        super_admin_role_id = super_admin_result.scalar_one()
+        super_admin_role_id = role_ids["super_admin"]
 
         admin_id = uuid.uuid4()
         await db_session.execute(
@@ -451,9 +439,11 @@ class TestEmailVerificationIntegration:
         # Error format: {"detail": {"code": 404, "message": "...", "type": "HTTPException"}}
         assert "detail" in error_data
 
-    @pytest.mark.asyncio
     async def test_verify_email_idempotent(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that verifying already-verified email is idempotent.
 
@@ -464,10 +454,7 @@ class TestEmailVerificationIntegration:
         4. Verify still returns 200 with email_verified=True
         """
         # Step 1: Create super_admin
-        super_admin_result = await db_session.execute(
-            text("SELECT id FROM roles WHERE name = 'super_admin'")
-        )
-        super_admin_role_id = super_admin_result.scalar_one()
+        super_admin_role_id = role_ids["super_admin"]
 
         admin_id = uuid.uuid4()
         await db_session.execute(
@@ -493,8 +480,7 @@ class TestEmailVerificationIntegration:
         await db_session.commit()
 
         # Step 2: Create already-verified donor
-        donor_result = await db_session.execute(text("SELECT id FROM roles WHERE name = 'donor'"))
-        donor_role_id = donor_result.scalar_one()
+        donor_role_id = role_ids["donor"]
 
         donor_id = uuid.uuid4()
         await db_session.execute(
@@ -535,9 +521,11 @@ class TestEmailVerificationIntegration:
         verified_user = verify_response.json()
         assert verified_user["email_verified"] is True
 
-    @pytest.mark.asyncio
     async def test_complete_admin_creates_and_verifies_user_flow(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test complete flow: admin creates user, verifies email, user can login.
 
@@ -549,10 +537,7 @@ class TestEmailVerificationIntegration:
         5. User can login successfully
         """
         # Step 1: Create super_admin
-        super_admin_result = await db_session.execute(
-            text("SELECT id FROM roles WHERE name = 'super_admin'")
-        )
-        super_admin_role_id = super_admin_result.scalar_one()
+        super_admin_role_id = role_ids["super_admin"]
 
         admin_id = uuid.uuid4()
         await db_session.execute(
@@ -17,7 +17,6 @@ This tests the integration of:
 
 import uuid
 
-import pytest
 from httpx import AsyncClient
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -28,7 +27,6 @@ from app.models.legal_document import LegalDocument, LegalDocumentStatus
 class TestLegalDocumentFlow:
     """Integration tests for legal document CRUD operations."""
 
-    @pytest.mark.asyncio
     async def test_create_draft_document(
         self,
         async_client: AsyncClient,
@@ -62,7 +60,6 @@ class TestLegalDocumentFlow:
         assert doc is not None
         assert doc.status == LegalDocumentStatus.DRAFT
 
-    @pytest.mark.asyncio
     async def test_create_duplicate_version_fails(
         self,
         async_client: AsyncClient,
@@ -94,7 +91,6 @@ class TestLegalDocumentFlow:
         error_text = detail if isinstance(detail, str) else detail.get("message", "")
         assert "already exists" in error_text.lower()
 
-    @pytest.mark.asyncio
     async def test_update_draft_document(
         self,
         async_client: AsyncClient,
@@ -128,7 +124,6 @@ class TestLegalDocumentFlow:
         data = update_response.json()
         assert data["content"] == "Updated content with more details"
 
-    @pytest.mark.asyncio
     async def test_cannot_update_published_document(
         self,
         async_client: AsyncClient,
@@ -167,7 +162,6 @@ class TestLegalDocumentFlow:
         error_text = detail if isinstance(detail, str) else detail.get("message", "")
         assert "Only DRAFT documents" in error_text
 
-    @pytest.mark.asyncio
     async def test_publish_document_archives_previous(
         self,
         async_client: AsyncClient,
@@ -227,7 +221,6 @@ class TestLegalDocumentFlow:
         v2_doc = result.scalar_one()
         assert v2_doc.status == LegalDocumentStatus.PUBLISHED
 
-    @pytest.mark.asyncio
     async def test_get_current_published_documents_public(
         self,
         async_client: AsyncClient,
@@ -278,7 +271,6 @@ class TestLegalDocumentFlow:
         assert "terms_of_service" in doc_types
         assert "privacy_policy" in doc_types
 
-    @pytest.mark.asyncio
     async def test_get_document_by_type(
         self,
         async_client: AsyncClient,
@@ -310,7 +302,6 @@ class TestLegalDocumentFlow:
         assert data["document_type"] == "terms_of_service"
         assert data["version"] == "3.0"
 
-    @pytest.mark.asyncio
     async def test_get_document_by_version(
         self,
         async_client: AsyncClient,
@@ -359,7 +350,6 @@ class TestLegalDocumentFlow:
         assert data["version"] == "1.0"
         assert data["content"] == "Privacy v1.0"
 
-    @pytest.mark.asyncio
     async def test_list_all_documents_admin(
         self,
         async_client: AsyncClient,
@@ -400,7 +390,6 @@ class TestLegalDocumentFlow:
         tos_data = tos_response.json()
         assert all(doc["document_type"] == "terms_of_service" for doc in tos_data["documents"])
 
-    @pytest.mark.asyncio
     async def test_non_admin_cannot_create_documents(
         self,
         async_client: AsyncClient,
@@ -421,7 +410,6 @@ class TestLegalDocumentFlow:
 
         assert response.status_code == 403
 
-    @pytest.mark.asyncio
     async def test_unauthenticated_cannot_access_admin_endpoints(
         self,
         async_client: AsyncClient,
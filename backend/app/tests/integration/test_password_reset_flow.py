@@ -16,7 +16,6 @@ class TestPasswordResetFlow:
     @pytest.mark.skip(
         reason="TODO: Need to implement token extraction from Redis for integration test"
     )
-    @pytest.mark.asyncio
     async def test_complete_password_reset_flow(
         self, async_client: AsyncClient, db_session: AsyncSession, test_user: User
     ) -> None:
@@ -84,7 +83,6 @@ class TestPasswordResetFlow:
     @pytest.mark.skip(
         reason="TODO: Need to implement token extraction from Redis for integration test"
     )
-    @pytest.mark.asyncio
     async def test_password_reset_revokes_all_sessions(
         self,
         async_client: AsyncClient,
@@ -127,7 +125,6 @@ class TestPasswordResetFlow:
     @pytest.mark.skip(
         reason="TODO: Need to implement token extraction from Redis for integration test"
     )
-    @pytest.mark.asyncio
     async def test_reset_token_expires_after_use(
         self, async_client: AsyncClient, test_user: User
     ) -> None:
@@ -167,7 +164,7 @@ class TestPasswordResetFlow:
         assert response.status_code == 400
         assert response.json()["detail"]["code"] == "INVALID_RESET_TOKEN"
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires time mocking - implement in full test suite")
     async def test_reset_token_expires_after_1_hour(
         self, async_client: AsyncClient, test_user: User
     ) -> None:
@@ -179,12 +176,10 @@ class TestPasswordResetFlow:
         """
         # This test would require mocking time or Redis TTL
         # For now, marking the expected behavior
-        pytest.skip("Requires time mocking - implement in full test suite")
 
     @pytest.mark.skip(
         reason="TODO: Need to implement token extraction from Redis for integration test"
     )
-    @pytest.mark.asyncio
     async def test_multiple_reset_requests_invalidate_previous_tokens(
         self, async_client: AsyncClient, test_user: User
     ) -> None:
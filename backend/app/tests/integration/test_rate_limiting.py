@@ -22,7 +22,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 class TestRateLimitingIntegration:
     """Integration tests for rate limiting workflows."""
 
-    @pytest.mark.asyncio
     async def test_rate_limit_triggers_after_5_failed_attempts(
         self, async_client: AsyncClient
     ) -> None:
@@ -51,7 +50,6 @@ class TestRateLimitingIntegration:
     @pytest.mark.skip(
         reason="TODO: Rate limit counter reset on successful login not implemented yet"
     )
-    @pytest.mark.asyncio
     async def test_successful_login_resets_rate_limit_counter(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -96,7 +94,7 @@ class TestRateLimitingIntegration:
             # All should return 401, not 429
             assert response.status_code == 401, f"Attempt {i + 1} after reset should be 401"
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires IP address mocking infrastructure")
     async def test_rate_limit_tracked_per_ip_address(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -108,13 +106,11 @@ class TestRateLimitingIntegration:
         """
         # This test requires mocking different IP addresses
         # For now, we document the expected behavior
-        pytest.skip("Requires IP address mocking infrastructure")
 
     @pytest.mark.skip(
         reason="TODO: Datetime mocking not working - app.middleware.rate_limit doesn't import datetime directly. "
         "Need to refactor middleware or use different time mocking approach."
     )
-    @pytest.mark.asyncio
     async def test_rate_limit_expires_after_15_minutes(self, async_client: AsyncClient) -> None:
         """Test rate limit resets after 15 minutes.
 
@@ -144,7 +140,7 @@ class TestRateLimitingIntegration:
             response = await async_client.post("/api/v1/auth/login", json=login_payload)
             assert response.status_code == 401  # Wrong password, but not rate limited
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires Redis service implementation")
     async def test_rate_limit_counter_increments_correctly(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -156,9 +152,7 @@ class TestRateLimitingIntegration:
         3. Hits limit exactly at 6th attempt
         """
         # This test requires Redis access to verify counter values
-        pytest.skip("Requires Redis service implementation")
 
-    @pytest.mark.asyncio
     async def test_rate_limit_applies_only_to_login_endpoint(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -194,7 +188,6 @@ class TestRateLimitingIntegration:
         )
         assert reset_response.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_rate_limit_response_includes_retry_after(
         self, async_client: AsyncClient
     ) -> None:
@@ -222,7 +215,6 @@ class TestRateLimitingIntegration:
             # Should be a number (seconds) or date
             assert retry_after.isdigit() or "-" in retry_after
 
-    @pytest.mark.asyncio
     async def test_rate_limit_persists_across_requests(self, async_client: AsyncClient) -> None:
         """Test rate limit counter persists across multiple HTTP requests.
 
@@ -251,7 +243,6 @@ class TestRateLimitingIntegration:
     @pytest.mark.skip(
         reason="TODO: Rate limiting is per-IP, test assumes per-email - cannot simulate different IPs in test client"
     )
-    @pytest.mark.asyncio
     async def test_rate_limit_different_users_independent_counters(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
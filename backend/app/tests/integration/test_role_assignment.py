@@ -18,14 +18,18 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import hash_password
+from app.models.role import Role
+from app.services.user_service import UserService
 
 
 class TestRoleAssignmentIntegration:
     """Integration tests for complete role assignment workflows."""
 
-    @pytest.mark.asyncio
     async def test_complete_donor_to_staff_upgrade_flow(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test complete flow: register as donor, upgrade to staff, verify permissions.
 
@@ -74,10 +78,7 @@ class TestRoleAssignmentIntegration:
 
         # Step 4: Create super_admin and upgrade user to staff
         # First create a super_admin user for this test
-        super_admin_result = await db_session.execute(
-            text("SELECT id FROM roles WHERE name = 'super_admin'")
-        )
-        super_admin_role_id = super_admin_result.scalar_one()
+        super_admin_role_id = role_ids["super_admin"]
 
         admin_id = uuid.uuid4()
         await db_session.execute(
@@ -134,9 +135,11 @@ class TestRoleAssignmentIntegration:
         list_users_response_staff = await async_client.get("/api/v1/users")
         assert list_users_response_staff.status_code in [403, 404]
 
-    @pytest.mark.asyncio
     async def test_npo_admin_role_assignment_with_npo_id(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test assigning npo_admin role requires and sets npo_id correctly.
 
@@ -147,10 +150,7 @@ class TestRoleAssignmentIntegration:
         4. Verify npo_admin can only see users in their NPO
         """
         # Step 1: Create super_admin
-        super_admin_result = await db_session.execute(
-            text("SELECT id FROM roles WHERE name = 'super_admin'")
-        )
-        super_admin_role_id = super_admin_result.scalar_one()
+        super_admin_role_id = role_ids["super_admin"]
 
         admin_id = uuid.uuid4()
         await db_session.execute(
@@ -231,9 +231,11 @@ class TestRoleAssignmentIntegration:
         # Should succeed and return filtered results (implementation will enforce filtering)
         assert list_response.status_code in [200, 403, 404]
 
-    @pytest.mark.asyncio
     async def test_role_downgrade_clears_npo_id(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that downgrading from npo_admin to donor clears npo_id.
 
@@ -245,10 +247,7 @@ class TestRoleAssignmentIntegration:
         5. Verify donor has appropriate permissions
         """
         # Step 1: Create super_admin
-        super_admin_result = await db_session.execute(
-            text("SELECT id FROM roles WHERE name = 'super_admin'")
-        )
-        super_admin_role_id = super_admin_result.scalar_one()
+        super_admin_role_id = role_ids["super_admin"]
 
         admin_id = uuid.uuid4()
         await db_session.execute(
@@ -273,10 +272,7 @@ class TestRoleAssignmentIntegration:
         )
 
         # Create npo_admin with npo_id
-        npo_admin_result = await db_session.execute(
-            text("SELECT id FROM roles WHERE name = 'npo_admin'")
-        )
-        npo_admin_role_id = npo_admin_result.scalar_one()
+        npo_admin_role_id = role_ids["npo_admin"]
 
         npo_id = uuid.uuid4()
         npo_admin_id = uuid.uuid4()
@@ -347,9 +343,11 @@ class TestRoleAssignmentIntegration:
         list_response = await async_client.get("/api/v1/users")
         assert list_response.status_code in [403, 404]
 
-    @pytest.mark.asyncio
     async def test_cannot_change_own_role(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
     ) -> None:
         """Test that users cannot change their own role.
 
@@ -362,22 +360,6 @@ class TestRoleAssignmentIntegration:
         3. Should receive 403 Forbidden error
         """
         # Step 1: Create super admin
-        await db_session.execute(
-            text(
-                """
-                INSERT INTO roles (id, name, description, scope)
-                VALUES (:id, :name, :description, :scope)
-                ON CONFLICT (name) DO NOTHING
-                """
-            ),
-            {
-                "id": uuid.uuid4(),
-                "name": "super_admin",
-                "description": "Super administrator",
-                "scope": "platform",
-            },
-        )
-
         admin_id = uuid.uuid4()
         await db_session.execute(
             text(
@@ -388,9 +370,7 @@ class TestRoleAssignmentIntegration:
                 )
                 VALUES (
                     :id, :email, :password_hash, :first_name, :last_name, :phone,
-                    :email_verified, :is_active,
-                    (SELECT id FROM roles WHERE name = 'super_admin'),
-                    :npo_id
+                    :email_verified, :is_active, :role_id, :npo_id
                 )
                 """
             ),
@@ -403,6 +383,7 @@ class TestRoleAssignmentIntegration:
                 "phone": "+1234567890",
                 "email_verified": True,
                 "is_active": True,
+                "role_id": role_ids["super_admin"],
                 "npo_id": None,
             },
         )
@@ -439,3 +420,57 @@ class TestRoleAssignmentIntegration:
             error_message = error_data["message"].lower()
 
         assert "cannot change your own role" in error_message
+
+
+class TestRoleIdCache:
+    """UserService resolves role IDs when its process-wide cache is cold."""
+
+    async def test_empty_cache_loads_roles(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
+    ) -> None:
+        """An empty cache (priming failed at startup) is filled on first lookup."""
+        monkeypatch.setattr(UserService, "_ROLE_ID_BY_NAME", {})
+
+        assert await UserService()._get_role_id(db_session, "staff") == role_ids["staff"]
+        assert UserService._ROLE_ID_BY_NAME == role_ids
+
+    async def test_missing_role_is_queried_and_cached(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
+    ) -> None:
+        """A role absent from a partially filled cache is loaded and added to it."""
+        monkeypatch.setattr(UserService, "_ROLE_ID_BY_NAME", {"donor": role_ids["donor"]})
+
+        assert await UserService()._get_role_id(db_session, "staff") == role_ids["staff"]
+        assert UserService._ROLE_ID_BY_NAME["staff"] == role_ids["staff"]
+
+    async def test_unknown_role_raises(
+        self, monkeypatch: pytest.MonkeyPatch, db_session: AsyncSession
+    ) -> None:
+        """A role that does not exist is rejected and not cached."""
+        monkeypatch.setattr(UserService, "_ROLE_ID_BY_NAME", {})
+
+        with pytest.raises(ValueError, match="Invalid role"):
+            await UserService()._get_role_id(db_session, "auctioneer")
+        assert "auctioneer" not in UserService._ROLE_ID_BY_NAME
+
+    async def test_role_write_clears_cache(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        db_session: AsyncSession,
+        role_ids: dict[str, uuid.UUID],
+    ) -> None:
+        """Updating a role through the ORM invalidates the cached IDs."""
+        monkeypatch.setattr(UserService, "_ROLE_ID_BY_NAME", dict(role_ids))
+
+        role = await db_session.get(Role, role_ids["staff"])
+        assert role is not None
+        role.description = "Registration and check-in"
+        await db_session.flush()
+
+        assert UserService._ROLE_ID_BY_NAME == {}
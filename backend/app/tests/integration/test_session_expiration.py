@@ -9,40 +9,42 @@ These tests verify:
 Uses time mocking to test expiration without waiting.
 """
 
+import uuid
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import text
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.session import Session, SessionJti
+from app.models.user import User
+from app.services.redis_service import RedisService
+from app.services.session_service import SessionService
 
+
+# verified_user_* logs in over HTTP during setup
+@pytest.mark.max_queries(15)
 class TestSessionExpirationIntegration:
     """Integration tests for session expiration workflows."""
 
     @pytest.fixture
     async def verified_user_with_active_session(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self,
+        async_client: AsyncClient,
+        verified_user_factory: Callable[..., Awaitable[User]],
     ) -> dict[str, str]:
         """Create a verified user, login, and return auth tokens."""
-        # Register user
-        register_payload = {
-            "email": "session.expire@example.com",
-            "password": "SecurePass123",
-            "first_name": "Session",
-            "last_name": "Expire",
-        }
-        register_response = await async_client.post("/api/v1/auth/register", json=register_payload)
-        assert register_response.status_code == 201
-        user_id = register_response.json()["user"]["id"]
-
-        # Verify email
-        await db_session.execute(
-            text("UPDATE users SET email_verified = true, is_active = true WHERE id = :id"),
-            {"id": user_id},
+        user = await verified_user_factory(
+            "session.expire@example.com", first_name="Session", last_name="Expire"
         )
-        await db_session.commit()
+        user_id = str(user.id)
 
         # Login
         login_response = await async_client.post(
@@ -59,7 +61,6 @@ class TestSessionExpirationIntegration:
             "email": "session.expire@example.com",
         }
 
-    @pytest.mark.asyncio
     async def test_session_valid_within_15_minutes(
         self,
         async_client: AsyncClient,
@@ -86,7 +87,6 @@ class TestSessionExpirationIntegration:
         reason="TODO: Datetime mocking not working - app.middleware.auth doesn't import datetime directly. "
         "Need to refactor middleware or use different time mocking approach."
     )
-    @pytest.mark.asyncio
     async def test_session_expires_after_15_minutes_inactivity(
         self,
         async_client: AsyncClient,
@@ -119,7 +119,7 @@ class TestSessionExpirationIntegration:
             error = response.json()["detail"]
             assert error["code"] in ["SESSION_EXPIRED", "UNAUTHORIZED", "INVALID_TOKEN"]
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires sliding window session implementation")
     async def test_session_refreshes_expiration_on_activity(
         self,
         async_client: AsyncClient,
@@ -136,13 +136,11 @@ class TestSessionExpirationIntegration:
         """
         # This test requires session sliding window implementation
         # For now, we document the expected behavior
-        pytest.skip("Requires sliding window session implementation")
 
     @pytest.mark.skip(
         reason="TODO: Datetime mocking not working - app.services.auth_service datetime mock doesn't affect session validation. "
         "Need to refactor service or use different time mocking approach."
     )
-    @pytest.mark.asyncio
     async def test_expired_session_prevents_token_refresh(
         self,
         async_client: AsyncClient,
@@ -175,7 +173,6 @@ class TestSessionExpirationIntegration:
             error = response.json()["detail"]
             assert error["code"] in ["SESSION_EXPIRED", "INVALID_REFRESH_TOKEN"]
 
-    @pytest.mark.asyncio
     async def test_logout_immediately_invalidates_session(
         self,
         async_client: AsyncClient,
@@ -208,7 +205,6 @@ class TestSessionExpirationIntegration:
         reason="TODO: Datetime mocking not working - app.middleware.auth doesn't import datetime directly. "
         "Need to refactor middleware or use different time mocking approach."
     )
-    @pytest.mark.asyncio
     async def test_multiple_sessions_independent_expiration(
         self,
         async_client: AsyncClient,
@@ -256,7 +252,7 @@ class TestSessionExpirationIntegration:
             # (if expiration is absolute, both would fail)
             assert response2.status_code in [200, 401]
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires Redis service implementation")
     async def test_session_expiration_stored_in_redis(
         self,
         async_client: AsyncClient,
@@ -272,9 +268,8 @@ class TestSessionExpirationIntegration:
         """
         # This test verifies Redis session storage
         # Requires Redis service access
-        pytest.skip("Requires Redis service implementation")
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires session extension implementation")
     async def test_session_extends_on_token_refresh(
         self,
         async_client: AsyncClient,
@@ -290,4 +285,115 @@ class TestSessionExpirationIntegration:
         4. Access works at t=20min
         """
         # This test requires session extension on refresh
-        pytest.skip("Requires session extension implementation")
+
+
+class TestSessionJtiUniqueness:
+    """The partitioned sessions table keeps refresh token JTIs globally unique."""
+
+    async def test_session_registers_jti(self, db_session: AsyncSession, test_user: User) -> None:
+        """Inserting a session claims its JTI in session_jtis."""
+        db_session.add(Session(user_id=test_user.id, refresh_token_jti="jti-1", ip_address="::1"))
+        await db_session.flush()
+
+        claimed = await db_session.scalar(
+            select(SessionJti.refresh_token_jti).where(SessionJti.refresh_token_jti == "jti-1")
+        )
+        assert claimed == "jti-1"
+
+    async def test_duplicate_jti_rejected_across_timestamps(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        """A JTI cannot be reused even though (jti, created_at) would be unique."""
+        now = datetime.now(UTC)
+        db_session.add(
+            Session(
+                user_id=test_user.id,
+                refresh_token_jti="jti-dup",
+                ip_address="::1",
+                created_at=now - timedelta(days=40),
+                expires_at=now - timedelta(days=33),
+            )
+        )
+        await db_session.flush()
+
+        with pytest.raises(IntegrityError):
+            async with db_session.begin_nested():
+                db_session.add(
+                    Session(user_id=test_user.id, refresh_token_jti="jti-dup", ip_address="::1")
+                )
+
+
+class TestUserSessionsPagination:
+    """SessionService.get_user_sessions pages newest first on (created_at, id)."""
+
+    async def test_pages_do_not_skip_sessions_sharing_created_at(
+        self, db_session: AsyncSession, test_user: User
+    ) -> None:
+        """Sessions created at the same instant are split across pages, not dropped."""
+        created_at = datetime.now(UTC)
+        tied = [
+            Session(
+                user_id=test_user.id,
+                refresh_token_jti=f"jti-page-{i}",
+                ip_address="::1",
+                created_at=created_at,
+            )
+            for i in range(5)
+        ]
+        db_session.add_all(tied)
+        await db_session.flush()
+
+        seen: list[uuid.UUID] = []
+        cursor: tuple[datetime, uuid.UUID] | None = None
+        while page := await SessionService.get_user_sessions(
+            db_session, test_user.id, cursor=cursor, limit=2
+        ):
+            seen.extend(session.id for session in page)
+            cursor = (page[-1].created_at, page[-1].id)
+
+        everything = await SessionService.get_user_sessions(db_session, test_user.id)
+        assert seen == [session.id for session in everything]
+        assert {session.id for session in tied} <= set(seen)
+
+
+@pytest.mark.usefixtures("_clean_redis")
+class TestBulkSessionRevocation:
+    """RedisService.delete_all_user_sessions and its session index."""
+
+    async def test_revokes_all_but_kept_session(self, app_redis: "Redis[Any]") -> None:
+        """Every indexed session except the kept one is deleted."""
+        user_id = uuid.uuid4()
+        for jti in ("keep", "drop-1", "drop-2"):
+            await RedisService.set_session(user_id, jti)
+
+        deleted = await RedisService.delete_all_user_sessions(user_id, except_jti="keep")
+
+        assert deleted == 2
+        assert await RedisService.get_session(user_id, "keep") is not None
+        assert await RedisService.get_session(user_id, "drop-1") is None
+        assert await app_redis.smembers(f"user_sessions:{user_id}") == {"keep"}
+
+    async def test_retries_when_session_added_during_revocation(
+        self, app_redis: "Redis[Any]"
+    ) -> None:
+        """A session indexed after the index is read is revoked on the retry."""
+        user_id = uuid.uuid4()
+        await RedisService.set_session(user_id, "drop-1")
+        smembers = Pipeline.smembers
+        calls = 0
+
+        async def smembers_then_login(self: "Pipeline[Any]", name: str) -> Any:
+            nonlocal calls
+            calls += 1
+            members = await smembers(self, name)
+            if calls == 1:
+                await RedisService.set_session(user_id, "late")
+            return members
+
+        with patch.object(Pipeline, "smembers", smembers_then_login):
+            deleted = await RedisService.delete_all_user_sessions(user_id)
+
+        assert calls == 2
+        assert deleted == 2
+        assert await RedisService.get_session(user_id, "late") is None
+        assert not await app_redis.exists(f"user_sessions:{user_id}")
@@ -11,45 +11,36 @@ Integration tests verify the complete token lifecycle across services.
 """
 
 import time
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
 
 import jwt
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
+from app.models.user import User
 
 settings = get_settings()
 
 
+# verified_user_* logs in over HTTP during setup
+@pytest.mark.max_queries(15)
 class TestTokenRefreshIntegration:
     """Integration tests for complete token refresh workflows."""
 
     @pytest.fixture
     async def verified_user_with_tokens(
-        self, async_client: AsyncClient, db_session: AsyncSession
+        self,
+        async_client: AsyncClient,
+        verified_user_factory: Callable[..., Awaitable[User]],
     ) -> dict[str, str]:
         """Create a verified user and return their login tokens."""
-        # Register user
-        register_payload = {
-            "email": "refresh.integration@example.com",
-            "password": "SecurePass123",
-            "first_name": "Refresh",
-            "last_name": "Integration",
-        }
-        register_response = await async_client.post("/api/v1/auth/register", json=register_payload)
-        assert register_response.status_code == 201
-        user_data = register_response.json()
-        user_id = user_data["user"]["id"]
-
-        # Manually verify email
-        await db_session.execute(
-            text("UPDATE users SET email_verified = true, is_active = true WHERE id = :id"),
-            {"id": user_id},
+        user = await verified_user_factory(
+            "refresh.integration@example.com", first_name="Refresh", last_name="Integration"
         )
-        await db_session.commit()
+        user_id = str(user.id)
 
         # Login to get tokens
         login_response = await async_client.post(
@@ -66,7 +57,6 @@ class TestTokenRefreshIntegration:
             "email": "refresh.integration@example.com",
         }
 
-    @pytest.mark.asyncio
     async def test_complete_token_refresh_flow(
         self,
         async_client: AsyncClient,
@@ -118,7 +108,6 @@ class TestTokenRefreshIntegration:
         profile_response3 = await async_client.get("/api/v1/users/me")
         assert profile_response3.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_multiple_refreshes_with_same_refresh_token(
         self,
         async_client: AsyncClient,
@@ -155,7 +144,6 @@ class TestTokenRefreshIntegration:
         # Verify all access tokens are unique
         assert len(set(access_tokens)) == 3, "Access tokens should all be different"
 
-    @pytest.mark.asyncio
     async def test_refresh_fails_after_logout(
         self,
         async_client: AsyncClient,
@@ -186,7 +174,6 @@ class TestTokenRefreshIntegration:
         assert refresh_response.status_code == 401
         assert refresh_response.json()["detail"]["code"] == "INVALID_REFRESH_TOKEN"
 
-    @pytest.mark.asyncio
     async def test_refresh_with_expired_token_fails(
         self, async_client: AsyncClient, db_session: AsyncSession
     ) -> None:
@@ -219,7 +206,6 @@ class TestTokenRefreshIntegration:
         assert response.status_code == 401
         assert response.json()["detail"]["code"] == "INVALID_REFRESH_TOKEN"
 
-    @pytest.mark.asyncio
     async def test_refresh_with_tampered_token_fails(self, async_client: AsyncClient) -> None:
         """Test refresh with tampered token fails signature validation.
 
@@ -228,12 +214,15 @@ class TestTokenRefreshIntegration:
         2. Attempt to refresh
         3. Refresh fails with 401
         """
-        # Create a token with wrong signature
-        tampered_token = (
-            "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9."
-            "eyJzdWIiOiIxMjM0NTY3ODkwIiwidHlwZSI6InJlZnJlc2gifQ."
-            "invalid_signature_here"
-        )
+        # Create an otherwise valid refresh token signed with the wrong secret
+        payload = {
+            "sub": "550e8400-e29b-41d4-a716-446655440000",
+            "type": "refresh",
+            "jti": "650e8400-e29b-41d4-a716-446655440000",
+            "exp": int((datetime.now(UTC) + timedelta(days=7)).timestamp()),
+            "iat": int(datetime.now(UTC).timestamp()),
+        }
+        tampered_token = jwt.encode(payload, f"not-{settings.jwt_secret_key}", algorithm="HS256")
 
         refresh_payload = {"refresh_token": tampered_token}
         response = await async_client.post("/api/v1/auth/refresh", json=refresh_payload)
@@ -242,7 +231,6 @@ class TestTokenRefreshIntegration:
         assert response.status_code == 401
         assert response.json()["detail"]["code"] == "INVALID_REFRESH_TOKEN"
 
-    @pytest.mark.asyncio
     async def test_refresh_with_access_token_fails(
         self,
         async_client: AsyncClient,
@@ -266,7 +254,6 @@ class TestTokenRefreshIntegration:
         assert response.status_code == 401
         assert response.json()["detail"]["code"] == "INVALID_REFRESH_TOKEN"
 
-    @pytest.mark.asyncio
     async def test_refresh_creates_new_jwt_with_updated_claims(
         self,
         async_client: AsyncClient,
@@ -310,7 +297,7 @@ class TestTokenRefreshIntegration:
         assert old_claims["iat"] < new_claims["iat"], "New token should have later iat"
         assert old_claims["exp"] < new_claims["exp"], "New token should have later exp"
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires Redis session management implementation")
     async def test_refresh_without_session_in_redis_fails(
         self,
         async_client: AsyncClient,
@@ -327,9 +314,7 @@ class TestTokenRefreshIntegration:
         """
         # This test requires Redis service implementation
         # For now, we document the expected behavior
-        pytest.skip("Requires Redis session management implementation")
 
-    @pytest.mark.asyncio
     async def test_refreshed_token_works_for_all_endpoints(
         self,
         async_client: AsyncClient,
@@ -5,14 +5,16 @@ Tests POST /users/{user_id}/verify-email endpoint for manually verifying user em
 
 import uuid
 
-import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.security import hash_password
 from app.models.user import User
 
+# bcrypt is deliberately slow; hash the password shared by ad-hoc users once
+PASSWORD_HASH = hash_password("TestPass123!")
+
 
-@pytest.mark.asyncio
 async def test_super_admin_can_verify_any_user_email(
     async_client: AsyncClient,
     test_super_admin_token: str,
@@ -40,7 +42,6 @@ async def test_super_admin_can_verify_any_user_email(
     assert test_donor_user.email_verified is True
 
 
-@pytest.mark.asyncio
 async def test_npo_admin_can_verify_their_npo_users(
     async_client: AsyncClient,
     test_npo_admin_token: str,
@@ -58,11 +59,10 @@ async def test_npo_admin_can_verify_their_npo_users(
         npo_id=test_npo_id,
         email_verified=False,
         is_active=False,
+        password_hash=PASSWORD_HASH,
     )
-    npo_user.set_password("TestPass123!")
     db_session.add(npo_user)
     await db_session.commit()
-    await db_session.refresh(npo_user)
 
     # NPO admin verifies user in their NPO
     response = await async_client.post(
@@ -79,7 +79,6 @@ async def test_npo_admin_can_verify_their_npo_users(
     assert npo_user.email_verified is True
 
 
-@pytest.mark.asyncio
 async def test_npo_admin_cannot_verify_other_npo_users(
     async_client: AsyncClient,
     test_npo_admin_token: str,
@@ -98,11 +97,10 @@ async def test_npo_admin_cannot_verify_other_npo_users(
         npo_id=other_npo_id,
         email_verified=False,
         is_active=False,
+        password_hash=PASSWORD_HASH,
     )
-    other_npo_user.set_password("TestPass123!")
     db_session.add(other_npo_user)
     await db_session.commit()
-    await db_session.refresh(other_npo_user)
 
     # NPO admin tries to verify user from different NPO
     response = await async_client.post(
@@ -119,7 +117,6 @@ async def test_npo_admin_cannot_verify_other_npo_users(
     assert other_npo_user.email_verified is False
 
 
-@pytest.mark.asyncio
 async def test_event_coordinator_cannot_verify_emails(
     async_client: AsyncClient,
     test_event_coordinator_token: str,
@@ -134,7 +131,6 @@ async def test_event_coordinator_cannot_verify_emails(
     assert response.status_code == 403
 
 
-@pytest.mark.asyncio
 async def test_staff_cannot_verify_emails(
     async_client: AsyncClient,
     test_staff_token: str,
@@ -149,7 +145,6 @@ async def test_staff_cannot_verify_emails(
     assert response.status_code == 403
 
 
-@pytest.mark.asyncio
 async def test_donor_cannot_verify_emails(
     async_client: AsyncClient,
     test_donor_token: str,
@@ -165,11 +160,10 @@ async def test_donor_cannot_verify_emails(
         role_id=test_donor_user.role_id,
         email_verified=False,
         is_active=False,
+        password_hash=PASSWORD_HASH,
     )
-    other_donor.set_password("TestPass123!")
     db_session.add(other_donor)
     await db_session.commit()
-    await db_session.refresh(other_donor)
 
     # Try to verify other donor's email
     response = await async_client.post(
@@ -180,7 +174,6 @@ async def test_donor_cannot_verify_emails(
     assert response.status_code == 403
 
 
-@pytest.mark.asyncio
 async def test_verify_email_for_nonexistent_user(
     async_client: AsyncClient,
     test_super_admin_token: str,
@@ -196,7 +189,6 @@ async def test_verify_email_for_nonexistent_user(
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
 async def test_verify_email_without_authentication(
     async_client: AsyncClient,
     test_donor_user: User,
@@ -209,7 +201,6 @@ async def test_verify_email_without_authentication(
     assert response.status_code == 401
 
 
-@pytest.mark.asyncio
 async def test_verify_already_verified_email(
     async_client: AsyncClient,
     test_super_admin_token: str,
@@ -234,7 +225,6 @@ async def test_verify_already_verified_email(
     assert data["email_verified"] is True
 
 
-@pytest.mark.asyncio
 async def test_verify_email_updates_timestamp(
     async_client: AsyncClient,
     test_super_admin_token: str,
@@ -261,7 +251,6 @@ async def test_verify_email_updates_timestamp(
     assert test_donor_user.email_verified is True
 
 
-@pytest.mark.asyncio
 async def test_verify_email_response_includes_all_user_fields(
     async_client: AsyncClient,
     test_super_admin_token: str,
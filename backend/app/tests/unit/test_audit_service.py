@@ -0,0 +1,66 @@
+"""Unit tests for session revocation audit logging."""
+
+import logging
+import uuid
+
+import pytest
+
+from app.middleware.request_id import request_id_context
+from app.services.audit_service import AuditService
+
+
+def _revoked_records(caplog: pytest.LogCaptureFixture) -> list[logging.LogRecord]:
+    """Return the captured "Session revoked" records."""
+    return [r for r in caplog.records if r.getMessage() == "Session revoked"]
+
+
+@pytest.mark.unit
+class TestSessionRevokedLogging:
+    """Test session revocation events keep the revoking request's ID."""
+
+    @pytest.fixture(autouse=True)
+    def _no_running_worker(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Start each test without the session-wide worker (restored afterwards)."""
+        monkeypatch.setattr(AuditService, "_revocation_queue", None)
+        monkeypatch.setattr(AuditService, "_revocation_worker", None)
+
+    def test_log_carries_request_id(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test an inline revocation event is tagged with the current request ID."""
+        token = request_id_context.set("req-revoke-1")
+        try:
+            with caplog.at_level(logging.WARNING, logger="app.services.audit_service"):
+                AuditService.log_session_revoked(
+                    user_id=uuid.uuid4(), email="revoked@example.com", session_jti="jti-1"
+                )
+        finally:
+            request_id_context.reset(token)
+
+        (record,) = _revoked_records(caplog)
+        assert getattr(record, "request_id", None) == "req-revoke-1"
+
+    async def test_queued_event_keeps_request_id(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test a queued event is logged by the worker with the scheduling request's ID."""
+        AuditService.start_background_worker()
+        token = request_id_context.set("req-revoke-2")
+        try:
+            AuditService.schedule_log_session_revoked(
+                user_id=uuid.uuid4(), email="revoked@example.com", session_jti="jti-2"
+            )
+        finally:
+            request_id_context.reset(token)
+
+        with caplog.at_level(logging.WARNING, logger="app.services.audit_service"):
+            await AuditService.stop_background_worker()
+
+        (record,) = _revoked_records(caplog)
+        assert getattr(record, "request_id", None) == "req-revoke-2"
+        assert AuditService._revocation_worker is None
+
+    def test_schedule_without_worker_logs_inline(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test events are logged immediately when no worker is running."""
+        with caplog.at_level(logging.WARNING, logger="app.services.audit_service"):
+            AuditService.schedule_log_session_revoked(
+                user_id=uuid.uuid4(), email="revoked@example.com", session_jti="jti-3"
+            )
+
+        assert len(_revoked_records(caplog)) == 1
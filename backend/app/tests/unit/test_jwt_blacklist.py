@@ -41,7 +41,6 @@ class TestJWTBlacklistUnit:
         service._redis = mock_redis_client  # noqa: SLF001
         return service
 
-    @pytest.mark.asyncio
     async def test_blacklist_token_stores_jti_in_redis(
         self, redis_service, mock_redis_client
     ) -> None:
@@ -64,7 +63,6 @@ class TestJWTBlacklistUnit:
             "1",  # Value is just "1" (presence check)
         )
 
-    @pytest.mark.asyncio
     async def test_is_token_blacklisted_returns_true_for_blacklisted_token(
         self, redis_service, mock_redis_client
     ) -> None:
@@ -88,7 +86,6 @@ class TestJWTBlacklistUnit:
         expected_key = f"blacklist:token:{jti}"
         mock_redis_client.get.assert_called_once_with(expected_key)
 
-    @pytest.mark.asyncio
     async def test_is_token_blacklisted_returns_false_for_valid_token(
         self, redis_service, mock_redis_client
     ) -> None:
@@ -112,7 +109,6 @@ class TestJWTBlacklistUnit:
         expected_key = f"blacklist:token:{jti}"
         mock_redis_client.get.assert_called_once_with(expected_key)
 
-    @pytest.mark.asyncio
     async def test_blacklist_token_with_access_token_ttl(
         self, redis_service, mock_redis_client
     ) -> None:
@@ -132,7 +128,6 @@ class TestJWTBlacklistUnit:
         call_args = mock_redis_client.setex.call_args
         assert call_args[0][1] == ttl_seconds
 
-    @pytest.mark.asyncio
     async def test_blacklist_token_with_zero_ttl_not_stored(
         self, redis_service, mock_redis_client
     ) -> None:
@@ -150,7 +145,6 @@ class TestJWTBlacklistUnit:
         # Redis SET should not be called for expired tokens
         mock_redis_client.setex.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_blacklist_uses_correct_redis_key_pattern(
         self, redis_service, mock_redis_client
     ) -> None:
@@ -176,7 +170,6 @@ class TestJWTBlacklistUnit:
             expected_key = f"blacklist:token:{jti}"
             assert call_args[0][0] == expected_key
 
-    @pytest.mark.asyncio
     async def test_blacklist_token_handles_redis_connection_error(
         self, redis_service, mock_redis_client
     ) -> None:
@@ -195,7 +188,6 @@ class TestJWTBlacklistUnit:
         with pytest.raises(ConnectionError):
             await redis_service.blacklist_token(jti, 900)
 
-    @pytest.mark.asyncio
     async def test_is_token_blacklisted_handles_redis_connection_error(
         self, redis_service, mock_redis_client
     ) -> None:
@@ -219,7 +211,6 @@ class TestJWTBlacklistUnit:
             # Raising error is also acceptable
             pass
 
-    @pytest.mark.asyncio
     async def test_blacklist_entry_expires_after_ttl(
         self, redis_service, mock_redis_client
     ) -> None:
@@ -243,7 +234,6 @@ class TestJWTBlacklistUnit:
         result = await redis_service.is_token_blacklisted(jti)
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_blacklist_multiple_tokens_independently(
         self, redis_service, mock_redis_client
     ) -> None:
@@ -277,7 +267,6 @@ class TestJWTBlacklistUnit:
         assert await redis_service.is_token_blacklisted(jti_b) is True
         assert await redis_service.is_token_blacklisted(jti_c) is False
 
-    @pytest.mark.asyncio
     async def test_blacklist_token_idempotent(self, redis_service, mock_redis_client) -> None:
         """Test blacklisting same token multiple times is idempotent.
 
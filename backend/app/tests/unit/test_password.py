@@ -7,10 +7,18 @@ Tests the password hashing utilities:
 - Invalid password handling
 """
 
+import time
+
 import pytest
 
+from app.core.config import Settings, get_settings
 from app.core.security import hash_password, verify_password
 
+settings = get_settings()
+
+# conftest lowers settings.bcrypt_rounds for speed; this is the shipped default
+DEFAULT_BCRYPT_ROUNDS = Settings.model_fields["bcrypt_rounds"].default
+
 
 class TestPasswordHashing:
     """Unit tests for password hashing utilities."""
@@ -145,12 +153,15 @@ class TestPasswordHashing:
             with pytest.raises((ValueError, Exception)):
                 verify_password(password, invalid_hash)
 
-    def test_bcrypt_work_factor(self) -> None:
+    def test_bcrypt_work_factor(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test bcrypt uses appropriate work factor (rounds).
 
         Verifies:
         - Hash uses at least 12 rounds (recommended minimum)
+
+        conftest lowers the work factor for speed, so use the default one here.
         """
+        monkeypatch.setattr(settings, "bcrypt_rounds", DEFAULT_BCRYPT_ROUNDS)
         password = "SecurePass123"
         hashed = hash_password(password)
 
@@ -179,7 +190,7 @@ class TestPasswordHashing:
             hashed = hash_password(password)
             assert verify_password(password, hashed) is True
 
-    def test_timing_attack_resistance(self) -> None:
+    def test_timing_attack_resistance(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test password verification takes consistent time.
 
         Verifies:
@@ -187,9 +198,10 @@ class TestPasswordHashing:
 
         Note: This is a basic test. Bcrypt is designed to be timing-attack resistant,
         but comprehensive timing analysis requires more sophisticated testing.
+        At the lowered test work factor a verify takes about a millisecond and
+        scheduler noise dominates, so time it at the default one.
         """
-        import time
-
+        monkeypatch.setattr(settings, "bcrypt_rounds", DEFAULT_BCRYPT_ROUNDS)
         password = "SecurePass123"
         hashed = hash_password(password)
 
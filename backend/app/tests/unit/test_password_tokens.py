@@ -16,37 +16,33 @@ import pytest
 class TestPasswordResetTokenGeneration:
     """Test password reset token generation."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires password_service implementation")
     async def test_generate_reset_token_creates_unique_tokens(self) -> None:
         """Should generate unique tokens for each call."""
-        pytest.skip("Requires password_service implementation")
         # token1 = generate_reset_token()
         # token2 = generate_reset_token()
         # assert token1 != token2
         # assert len(token1) >= 32  # Sufficient length for security
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires password_service implementation")
     async def test_generate_reset_token_is_url_safe(self) -> None:
         """Should generate URL-safe tokens (no special chars that need encoding)."""
-        pytest.skip("Requires password_service implementation")
         # token = generate_reset_token()
         # # Should not contain characters that need URL encoding
         # import re
         # assert re.match(r'^[A-Za-z0-9_-]+$', token)
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires password_service implementation")
     async def test_hash_reset_token_is_deterministic(self) -> None:
         """Should produce same hash for same input."""
-        pytest.skip("Requires password_service implementation")
         # token = "test_token_123"
         # hash1 = hash_reset_token(token)
         # hash2 = hash_reset_token(token)
         # assert hash1 == hash2
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires password_service implementation")
     async def test_hash_reset_token_is_different_for_different_tokens(self) -> None:
         """Should produce different hashes for different tokens."""
-        pytest.skip("Requires password_service implementation")
         # token1 = "test_token_123"
         # token2 = "test_token_456"
         # hash1 = hash_reset_token(token1)
@@ -57,10 +53,9 @@ class TestPasswordResetTokenGeneration:
 class TestPasswordResetTokenValidation:
     """Test password reset token validation."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires password_service implementation")
     async def test_validate_reset_token_accepts_valid_token(self) -> None:
         """Should return user_id for valid token."""
-        pytest.skip("Requires password_service implementation")
         # user_id = "550e8400-e29b-41d4-a716-446655440000"
         # token = generate_reset_token()
         # # Store token in Redis with 1-hour expiry
@@ -70,17 +65,15 @@ class TestPasswordResetTokenValidation:
         # result = await validate_reset_token(token)
         # assert result == user_id
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires password_service implementation")
     async def test_validate_reset_token_rejects_invalid_token(self) -> None:
         """Should return None for invalid token."""
-        pytest.skip("Requires password_service implementation")
         # result = await validate_reset_token("invalid_token_xyz")
         # assert result is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires password_service implementation and time mocking")
     async def test_validate_reset_token_rejects_expired_token(self) -> None:
         """Should return None for expired token."""
-        pytest.skip("Requires password_service implementation and time mocking")
         # user_id = "550e8400-e29b-41d4-a716-446655440000"
         # token = generate_reset_token()
         # # Store token with very short expiry
@@ -93,10 +86,9 @@ class TestPasswordResetTokenValidation:
         # result = await validate_reset_token(token)
         # assert result is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires password_service implementation")
     async def test_validate_reset_token_removes_token_after_use(self) -> None:
         """Should delete token from Redis after successful validation."""
-        pytest.skip("Requires password_service implementation")
         # user_id = "550e8400-e29b-41d4-a716-446655440000"
         # token = generate_reset_token()
         # await store_reset_token(token, user_id, expiry=3600)
@@ -113,10 +105,9 @@ class TestPasswordResetTokenValidation:
 class TestPasswordResetTokenStorage:
     """Test password reset token storage in Redis."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires redis_service implementation")
     async def test_store_reset_token_with_expiry(self) -> None:
         """Should store token in Redis with TTL."""
-        pytest.skip("Requires redis_service implementation")
         # user_id = "550e8400-e29b-41d4-a716-446655440000"
         # token = generate_reset_token()
         #
@@ -132,10 +123,9 @@ class TestPasswordResetTokenStorage:
         # ttl = await redis.ttl(f"password_reset:{token_hash}")
         # assert 3500 < ttl <= 3600  # Allow some time for execution
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires redis_service implementation")
     async def test_invalidate_previous_reset_tokens_for_user(self) -> None:
         """Should delete all existing reset tokens for a user when new one is requested."""
-        pytest.skip("Requires redis_service implementation")
         # user_id = "550e8400-e29b-41d4-a716-446655440000"
         #
         # # Create first token
@@ -158,10 +148,9 @@ class TestPasswordResetTokenStorage:
 class TestPasswordResetSecurity:
     """Test security aspects of password reset tokens."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires password_service implementation")
     async def test_token_has_sufficient_entropy(self) -> None:
         """Should generate tokens with sufficient randomness."""
-        pytest.skip("Requires password_service implementation")
         # # Generate many tokens and check for duplicates
         # tokens = set()
         # for _ in range(1000):
@@ -169,10 +158,9 @@ class TestPasswordResetSecurity:
         #     assert token not in tokens
         #     tokens.add(token)
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires password_service implementation")
     async def test_token_cannot_be_guessed_from_user_id(self) -> None:
         """Token should not be derivable from user information."""
-        pytest.skip("Requires password_service implementation")
         # # Two tokens for same user should be different
         # user_id = "550e8400-e29b-41d4-a716-446655440000"
         # token1 = generate_reset_token()
@@ -182,10 +170,9 @@ class TestPasswordResetSecurity:
         # assert user_id not in token1
         # assert user_id not in token2
 
-    @pytest.mark.asyncio
+    @pytest.mark.skip(reason="Requires password_service implementation")
     async def test_hash_is_irreversible(self) -> None:
         """Should not be able to reverse token from hash."""
-        pytest.skip("Requires password_service implementation")
         # token = "test_token_123"
         # token_hash = hash_reset_token(token)
         # # Hash should not contain original token
@@ -9,10 +9,7 @@ business logic without making HTTP requests or database calls.
 
 import uuid
 
-import pytest
-
-# Note: PermissionService doesn't exist yet, will be created in implementation
-# These tests define the expected interface and behavior
+from app.services.permission_service import PermissionService
 
 
 class MockUser:
@@ -33,11 +30,8 @@ class MockUser:
 class TestPermissionService:
     """Unit tests for PermissionService methods."""
 
-    @pytest.mark.asyncio
     async def test_super_admin_can_view_all_users(self) -> None:
         """Test that super_admin can view all users regardless of NPO."""
-        from app.services.permission_service import PermissionService
-
         user = MockUser(id=uuid.uuid4(), role="super_admin")
         service = PermissionService()
 
@@ -45,11 +39,8 @@ class TestPermissionService:
         assert await service.can_view_user(user, target_user_npo_id=None) is True
         assert await service.can_view_user(user, target_user_npo_id=uuid.uuid4()) is True
 
-    @pytest.mark.asyncio
     async def test_npo_admin_can_view_users_in_their_npo(self) -> None:
         """Test that npo_admin can only view users in their NPO."""
-        from app.services.permission_service import PermissionService
-
         npo_id = uuid.uuid4()
         user = MockUser(id=uuid.uuid4(), role="npo_admin", npo_id=npo_id)
         service = PermissionService()
@@ -64,11 +55,8 @@ class TestPermissionService:
         # Cannot view users with no NPO
         assert await service.can_view_user(user, target_user_npo_id=None) is False
 
-    @pytest.mark.asyncio
     async def test_donor_cannot_view_users(self) -> None:
         """Test that donor cannot view user lists."""
-        from app.services.permission_service import PermissionService
-
         user = MockUser(id=uuid.uuid4(), role="donor")
         service = PermissionService()
 
@@ -76,11 +64,8 @@ class TestPermissionService:
         assert await service.can_view_user(user, target_user_npo_id=None) is False
         assert await service.can_view_user(user, target_user_npo_id=uuid.uuid4()) is False
 
-    @pytest.mark.asyncio
     async def test_staff_cannot_view_users(self) -> None:
         """Test that staff cannot view general user lists."""
-        from app.services.permission_service import PermissionService
-
         user = MockUser(id=uuid.uuid4(), role="staff")
         service = PermissionService()
 
@@ -88,22 +73,16 @@ class TestPermissionService:
         assert await service.can_view_user(user, target_user_npo_id=None) is False
         assert await service.can_view_user(user, target_user_npo_id=uuid.uuid4()) is False
 
-    @pytest.mark.asyncio
     async def test_super_admin_can_create_users(self) -> None:
         """Test that super_admin can create users in any NPO."""
-        from app.services.permission_service import PermissionService
-
         user = MockUser(id=uuid.uuid4(), role="super_admin")
         service = PermissionService()
 
         assert await service.can_create_user(user, target_npo_id=None) is True
         assert await service.can_create_user(user, target_npo_id=uuid.uuid4()) is True
 
-    @pytest.mark.asyncio
     async def test_npo_admin_can_create_users_in_their_npo(self) -> None:
         """Test that npo_admin can only create users in their NPO."""
-        from app.services.permission_service import PermissionService
-
         npo_id = uuid.uuid4()
         user = MockUser(id=uuid.uuid4(), role="npo_admin", npo_id=npo_id)
         service = PermissionService()
@@ -118,33 +97,24 @@ class TestPermissionService:
         # Can create users with no NPO (donors) within their NPO context
         assert await service.can_create_user(user, target_npo_id=None) is True
 
-    @pytest.mark.asyncio
     async def test_donor_cannot_create_users(self) -> None:
         """Test that donor cannot create users."""
-        from app.services.permission_service import PermissionService
-
         user = MockUser(id=uuid.uuid4(), role="donor")
         service = PermissionService()
 
         assert await service.can_create_user(user, target_npo_id=None) is False
         assert await service.can_create_user(user, target_npo_id=uuid.uuid4()) is False
 
-    @pytest.mark.asyncio
     async def test_staff_cannot_create_users(self) -> None:
         """Test that staff cannot create users."""
-        from app.services.permission_service import PermissionService
-
         user = MockUser(id=uuid.uuid4(), role="staff")
         service = PermissionService()
 
         assert await service.can_create_user(user, target_npo_id=None) is False
         assert await service.can_create_user(user, target_npo_id=uuid.uuid4()) is False
 
-    @pytest.mark.asyncio
     async def test_super_admin_can_assign_any_role(self) -> None:
         """Test that super_admin can assign any role."""
-        from app.services.permission_service import PermissionService
-
         user = MockUser(id=uuid.uuid4(), role="super_admin")
         service = PermissionService()
 
@@ -152,11 +122,8 @@ class TestPermissionService:
         for role in ["super_admin", "npo_admin", "event_coordinator", "staff", "donor"]:
             assert await service.can_assign_role(user, target_role=role) is True
 
-    @pytest.mark.asyncio
     async def test_npo_admin_can_assign_limited_roles(self) -> None:
         """Test that npo_admin can only assign non-super_admin roles."""
-        from app.services.permission_service import PermissionService
-
         npo_id = uuid.uuid4()
         user = MockUser(id=uuid.uuid4(), role="npo_admin", npo_id=npo_id)
         service = PermissionService()
@@ -168,33 +135,24 @@ class TestPermissionService:
         for role in ["npo_admin", "event_coordinator", "staff", "donor"]:
             assert await service.can_assign_role(user, target_role=role) is True
 
-    @pytest.mark.asyncio
     async def test_donor_cannot_assign_roles(self) -> None:
         """Test that donor cannot assign roles."""
-        from app.services.permission_service import PermissionService
-
         user = MockUser(id=uuid.uuid4(), role="donor")
         service = PermissionService()
 
         for role in ["super_admin", "npo_admin", "event_coordinator", "staff", "donor"]:
             assert await service.can_assign_role(user, target_role=role) is False
 
-    @pytest.mark.asyncio
     async def test_staff_cannot_assign_roles(self) -> None:
         """Test that staff cannot assign roles."""
-        from app.services.permission_service import PermissionService
-
         user = MockUser(id=uuid.uuid4(), role="staff")
         service = PermissionService()
 
         for role in ["super_admin", "npo_admin", "event_coordinator", "staff", "donor"]:
             assert await service.can_assign_role(user, target_role=role) is False
 
-    @pytest.mark.asyncio
     async def test_npo_admin_role_requires_npo_id(self) -> None:
         """Test validation that npo_admin role requires npo_id."""
-        from app.services.permission_service import PermissionService
-
         service = PermissionService()
 
         # npo_admin requires npo_id
@@ -206,11 +164,8 @@ class TestPermissionService:
         assert service.role_requires_npo_id("staff") is False
         assert service.role_requires_npo_id("donor") is False
 
-    @pytest.mark.asyncio
     async def test_donor_and_staff_roles_forbid_npo_id(self) -> None:
         """Test validation that donor and staff roles must not have npo_id."""
-        from app.services.permission_service import PermissionService
-
         service = PermissionService()
 
         # donor and staff forbid npo_id
@@ -222,11 +177,8 @@ class TestPermissionService:
         assert service.role_forbids_npo_id("npo_admin") is False
         assert service.role_forbids_npo_id("event_coordinator") is False
 
-    @pytest.mark.asyncio
     async def test_can_modify_user_checks_permissions(self) -> None:
         """Test that can_modify_user checks appropriate permissions."""
-        from app.services.permission_service import PermissionService
-
         npo_id = uuid.uuid4()
         service = PermissionService()
 
@@ -244,11 +196,8 @@ class TestPermissionService:
         donor = MockUser(id=uuid.uuid4(), role="donor")
         assert await service.can_modify_user(donor, target_user_npo_id=None) is False
 
-    @pytest.mark.asyncio
     async def test_event_coordinator_has_limited_permissions(self) -> None:
         """Test that event_coordinator has appropriate limited permissions."""
-        from app.services.permission_service import PermissionService
-
         npo_id = uuid.uuid4()
         user = MockUser(id=uuid.uuid4(), role="event_coordinator", npo_id=npo_id)
         service = PermissionService()
@@ -1,5 +1,8 @@
 """Unit tests for security utilities (Phase 2 smoke tests)."""
 
+from datetime import timedelta
+
+import jwt
 import pytest
 
 from app.core.security import (
@@ -95,15 +98,11 @@ class TestJWTTokens:
 
     def test_decode_invalid_token(self) -> None:
         """Test decoding an invalid token raises error."""
-        import jwt
-
         with pytest.raises(jwt.InvalidTokenError):
             decode_token("invalid.token.here")
 
     def test_token_with_custom_expiry(self) -> None:
         """Test creating token with custom expiry."""
-        from datetime import timedelta
-
         data = {"sub": "user123"}
         token = create_access_token(data, expires_delta=timedelta(seconds=60))
         decoded = decode_token(token)